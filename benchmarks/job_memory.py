@@ -0,0 +1,41 @@
+"""
+Memory cost of registered jobs: Bytes allocated per job added to a JobScheduler (excluding the job func itself).
+
+    python benchmarks/job_memory.py [num_jobs]
+"""
+
+import gc
+import logging
+import sys
+import tracemalloc
+
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs.job import JobParams
+
+
+def _noop():
+    pass
+
+
+def bytes_per_job(num_jobs: int) -> float:
+    scheduler = JobScheduler(log_level=logging.WARNING)
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    for index in range(num_jobs):
+        scheduler.add_job(
+            PeriodicJob(
+                JobParams(func=_noop, id=f"job_{index}", interval=60, log_level=logging.WARNING)
+            )
+        )
+    gc.collect()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in snapshot.compare_to(baseline, "filename"))
+    return allocated / num_jobs
+
+
+if __name__ == "__main__":
+    num_jobs = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    print(f"{num_jobs} jobs: {bytes_per_job(num_jobs):,.0f} bytes per registered job")
@@ -0,0 +1,35 @@
+from kvcommon.exceptions import KVCException
+
+
+class ExecutorException(KVCException):
+    pass
+
+
+class UnknownExecutorException(ExecutorException):
+    def __init__(self, name: str, *args, **kwargs):
+        msg = f"No executor registered with name: '{name}'"
+        super().__init__(msg, *args, **kwargs)
+
+
+class PicklingCheckError(ExecutorException):
+    def __init__(self, job_id: str, err: str, *args, **kwargs):
+        msg = f"Job '{job_id}' cannot be sent to a process pool: '{err}'"
+        super().__init__(msg, *args, **kwargs)
+
+
+class CronExpressionError(KVCException):
+    def __init__(self, expression: str, err: str, *args, **kwargs):
+        msg = f"Invalid cron expression '{expression}': '{err}'"
+        super().__init__(msg, *args, **kwargs)
+
+
+class JobTimeoutException(KVCException):
+    def __init__(self, job_id: str, timeout: float, *args, **kwargs):
+        msg = f"Job '{job_id}' exceeded its timeout of {timeout}s"
+        super().__init__(msg, *args, **kwargs)
+
+
+class JobCancelledException(KVCException):
+    def __init__(self, reason: str | None = None, *args, **kwargs):
+        msg = "Job run was cancelled" if not reason else f"Job run was cancelled: '{reason}'"
+        super().__init__(msg, *args, **kwargs)
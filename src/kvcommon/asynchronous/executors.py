@@ -0,0 +1,500 @@
+from __future__ import annotations
+import atexit
+import dataclasses
+import multiprocessing
+import pickle
+import threading
+import time
+import typing as t
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from enum import StrEnum
+
+from kvcommon.logger import get_logger
+
+from .exceptions import PicklingCheckError
+from .exceptions import UnknownExecutorException
+
+
+LOG = get_logger("kvc_executors")
+
+
+class ExecutorKind(StrEnum):
+    THREAD = "thread"  # The event loop's default ThreadPoolExecutor
+    PROCESS = "process"  # A process pool shared by all jobs that request one
+
+
+_registry: t.Dict[str, Executor] = dict()
+_registry_lock = threading.Lock()
+
+_shared_process_pool: ProcessPoolExecutor | None = None
+_shared_process_pool_workers: int | None = None
+# Forking a process that's running threads is unsafe
+_shared_process_pool_start_method: str = "spawn"
+_shared_executor_users: int = 0
+
+_stuck_workers: int = 0
+_stuck_workers_lock = threading.Lock()
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class ExecutorStats:
+    """
+    Point-in-time view of an InstrumentedThreadPool
+
+    Parameters:
+        name (str): Registered name of the pool
+        max_workers (int): Current size limit of the pool
+        threads (int): Worker threads started so far
+        active (int): Workers currently running a task
+        queue_depth (int): Tasks submitted but not yet started - Including runs held back by a job ExecutionQueue
+        completed (int): Tasks finished (successfully or not)
+        wait_count (int): Tasks that have started, over which wait times are measured
+        wait_total (float): Seconds tasks spent queued before starting, in total
+        wait_max (float): Longest time (seconds) a task spent queued
+        resizes (int): Times the pool grew because it stayed saturated
+    """
+
+    name: str
+    max_workers: int
+    threads: int
+    active: int
+    queue_depth: int
+    completed: int
+    wait_count: int
+    wait_total: float
+    wait_max: float
+    resizes: int
+
+    @property
+    def wait_mean(self) -> float:
+        return self.wait_total / self.wait_count if self.wait_count else 0.0
+
+    @property
+    def saturated(self) -> bool:
+        return self.active >= self.max_workers and self.queue_depth > 0
+
+
+def _noop():
+    pass
+
+
+class InstrumentedThreadPool(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor of an explicit size that reports its queue depth, active workers and task wait times, and
+    grows (up to max_workers_limit) once it has stayed saturated - every worker busy with tasks still queued - for
+    scale_after seconds. Saturation is checked as tasks are submitted, start and finish, and re-checked by a timer
+    while it lasts - So that a pool whose workers are all stuck still grows without further events.
+    Threads aren't retired after growing: ThreadPoolExecutor has no way to stop an idle worker.
+    Create and register one via `create_thread_pool()`.
+
+    ThreadPoolExecutor has no public way to grow, so resizing sets its _max_workers attribute (present in every
+    supported CPython). Where it's missing, the pool is kept at its initial size.
+
+    Parameters:
+        name (str): Name of the pool, and prefix of its threads' names
+        max_workers (int): Initial number of worker threads
+        max_workers_limit (int): Max size the pool may grow to. Default: max_workers (fixed size)
+        scale_after (float): Seconds the pool must stay saturated before it grows
+        scale_step (int): Workers added each time the pool grows
+    """
+
+    _name: str
+    _max_workers_limit: int
+    _scale_after: float = 1.0
+    _scale_step: int = 1
+    _stats_lock: threading.Lock
+    _queued: int = 0
+    _active: int = 0
+    _completed: int = 0
+    _wait_count: int = 0
+    _wait_total_ns: int = 0
+    _wait_max_ns: int = 0
+    _resizes: int = 0
+    _saturated_since: float | None = None
+    _recheck_timer: threading.Timer | None = None
+    _closed: bool = False
+    _backlog_sources: t.List[t.Callable[[], int]]
+    _resize_listeners: t.List[t.Callable[[int], None]]
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_workers_limit: int | None = None,
+        scale_after: float = 1.0,
+        scale_step: int = 1,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        max_workers_limit = max_workers if max_workers_limit is None else max_workers_limit
+        if max_workers_limit < max_workers:
+            raise ValueError("max_workers_limit must be at least max_workers")
+        if scale_step < 1:
+            raise ValueError("scale_step must be at least 1")
+        super().__init__(max_workers=max_workers, thread_name_prefix=name)
+        if max_workers_limit > max_workers and not isinstance(
+            getattr(self, "_max_workers", None), int
+        ):
+            LOG.warning(
+                "Thread pool '%s' can't be resized on this Python - Keeping it at %s workers",
+                name,
+                max_workers,
+            )
+            max_workers_limit = max_workers
+        self._name = name
+        self._max_workers_limit = max_workers_limit
+        self._scale_after = scale_after
+        self._scale_step = scale_step
+        self._stats_lock = threading.Lock()
+        self._backlog_sources = []
+        self._resize_listeners = []
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False):
+        with self._stats_lock:
+            self._closed = True
+            timer, self._recheck_timer = self._recheck_timer, None
+        if timer is not None:
+            timer.cancel()
+        super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        with self._stats_lock:
+            self._queued += 1
+        try:
+            future = super().submit(self._run_task, time.perf_counter_ns(), fn, args, kwargs)
+        except BaseException:
+            with self._stats_lock:
+                self._queued -= 1
+            raise
+        future.add_done_callback(self._on_task_done)
+        self.check_saturation()
+        return future
+
+    def _run_task(
+        self, submitted_ns: int, fn: t.Callable, args: t.Tuple, kwargs: t.Dict[str, t.Any]
+    ) -> t.Any:
+        wait_ns = time.perf_counter_ns() - submitted_ns
+        with self._stats_lock:
+            self._queued -= 1
+            self._active += 1
+            self._wait_count += 1
+            self._wait_total_ns += wait_ns
+            if wait_ns > self._wait_max_ns:
+                self._wait_max_ns = wait_ns
+        self.check_saturation()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            with self._stats_lock:
+                self._active -= 1
+                self._completed += 1
+
+    def _on_task_done(self, future: Future):
+        if future.cancelled():
+            # Never started
+            with self._stats_lock:
+                self._queued -= 1
+        self.check_saturation()
+
+    def add_backlog_source(self, source: t.Callable[[], int]):
+        """
+        Count tasks waiting outside the pool (e.g. in a job ExecutionQueue) towards its queue depth
+        """
+        self._backlog_sources.append(source)
+
+    def add_resize_listener(self, listener: t.Callable[[int], None]):
+        """
+        Call listener with the new max_workers whenever the pool is resized
+        """
+        self._resize_listeners.append(listener)
+
+    def _backlog(self) -> int:
+        return self._queued + sum(source() for source in self._backlog_sources)
+
+    def check_saturation(self):
+        """
+        Grow the pool if it has stayed saturated for scale_after seconds
+        """
+        if self._max_workers >= self._max_workers_limit:
+            return
+        # Backlog sources take their own locks, so are read first
+        backlog = self._backlog()
+        now = time.monotonic()
+        with self._stats_lock:
+            if self._closed:
+                return
+            if not (self._active >= self._max_workers and backlog > 0):
+                self._saturated_since = None
+                return
+            if self._saturated_since is None:
+                self._saturated_since = now
+            saturated_for = now - self._saturated_since
+            if saturated_for < self._scale_after:
+                self._arm_recheck(self._scale_after - saturated_for)
+                return
+            self._saturated_since = None
+            new_size = min(self._max_workers + self._scale_step, self._max_workers_limit)
+        LOG.info(
+            "Thread pool '%s' saturated for %ss - Growing to %s workers",
+            self._name,
+            self._scale_after,
+            new_size,
+        )
+        self.resize(new_size)
+        # Starts timing again if it's still saturated
+        self.check_saturation()
+
+    def _arm_recheck(self, delay: float):
+        # With self._stats_lock held
+        if self._recheck_timer is not None:
+            return
+        timer = threading.Timer(delay, self._recheck_saturation)
+        timer.daemon = True
+        self._recheck_timer = timer
+        timer.start()
+
+    def _recheck_saturation(self):
+        with self._stats_lock:
+            self._recheck_timer = None
+        self.check_saturation()
+
+    def resize(self, max_workers: int):
+        """
+        Grow the pool to max_workers. Extra threads are started as tasks need them.
+        """
+        if max_workers < self._max_workers:
+            raise ValueError("Thread pools can only grow - Idle workers can't be stopped")
+        with self._stats_lock:
+            if max_workers == self._max_workers or self._closed:
+                return
+            added = max_workers - self._max_workers
+            self._max_workers = max_workers
+            self._resizes += 1
+            queued = self._queued
+        # ThreadPoolExecutor only starts threads on submit() - Submit a no-op per thread needed by the tasks already
+        # queued. The new threads take those tasks first, as the queue is FIFO.
+        for _ in range(min(queued, added)):
+            try:
+                super().submit(_noop)
+            except RuntimeError:
+                # Shut down meanwhile
+                break
+        for listener in self._resize_listeners:
+            listener(max_workers)
+
+    def stats(self) -> ExecutorStats:
+        backlog = self._backlog()
+        with self._stats_lock:
+            return ExecutorStats(
+                name=self._name,
+                max_workers=self._max_workers,
+                threads=len(getattr(self, "_threads", ())),
+                active=self._active,
+                queue_depth=backlog,
+                completed=self._completed,
+                wait_count=self._wait_count,
+                wait_total=self._wait_total_ns / _NS_PER_SECOND,
+                wait_max=self._wait_max_ns / _NS_PER_SECOND,
+                resizes=self._resizes,
+            )
+
+
+def register_executor(name: str, executor: Executor, replace: bool = False):
+    """
+    Register a dedicated executor that jobs can select by name via JobParams.executor
+    """
+    if name in (ExecutorKind.THREAD, ExecutorKind.PROCESS):
+        raise ValueError(f"Executor name is reserved: '{name}'")
+    with _registry_lock:
+        if name in _registry and not replace:
+            raise KeyError(f"Executor already registered with name: '{name}'")
+        _registry[name] = executor
+
+
+def create_thread_pool(
+    name: str,
+    max_workers: int,
+    max_workers_limit: int | None = None,
+    scale_after: float = 1.0,
+    scale_step: int = 1,
+    replace: bool = False,
+) -> InstrumentedThreadPool:
+    """
+    Create and register a named InstrumentedThreadPool - Selectable via JobParams.executor, JobScheduler.submit()
+    or call_sync_async(). Isolates a group of (e.g. noisy) sync jobs from the loop's default ThreadPoolExecutor.
+    See InstrumentedThreadPool for the parameters.
+    """
+    pool = InstrumentedThreadPool(
+        name,
+        max_workers=max_workers,
+        max_workers_limit=max_workers_limit,
+        scale_after=scale_after,
+        scale_step=scale_step,
+    )
+    try:
+        register_executor(name, pool, replace=replace)
+    except Exception:
+        pool.shutdown(wait=False)
+        raise
+    return pool
+
+
+def executor_stats() -> t.Dict[str, ExecutorStats]:
+    """
+    Stats of every registered InstrumentedThreadPool, by name
+    """
+    with _registry_lock:
+        pools = [
+            executor
+            for executor in _registry.values()
+            if isinstance(executor, InstrumentedThreadPool)
+        ]
+    return {pool.name: pool.stats() for pool in pools}
+
+
+def unregister_executor(name: str, shutdown: bool = False) -> Executor | None:
+    with _registry_lock:
+        executor = _registry.pop(name, None)
+    if executor is not None and shutdown:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return executor
+
+
+def configure_shared_process_pool(max_workers: int | None = None, start_method: str = "spawn"):
+    """
+    Configure the shared process pool. Takes effect the next time the pool is created.
+    """
+    global _shared_process_pool_workers, _shared_process_pool_start_method
+    _shared_process_pool_workers = max_workers
+    _shared_process_pool_start_method = start_method
+
+
+def get_shared_process_pool() -> ProcessPoolExecutor:
+    global _shared_process_pool
+    with _registry_lock:
+        if _shared_process_pool is None:
+            LOG.debug("Creating shared process pool")
+            _shared_process_pool = ProcessPoolExecutor(
+                max_workers=_shared_process_pool_workers,
+                mp_context=multiprocessing.get_context(_shared_process_pool_start_method),
+            )
+        return _shared_process_pool
+
+
+def reset_shared_process_pool(pool: ProcessPoolExecutor | None = None, wait: bool = False):
+    """
+    Discard the shared process pool (e.g. after it broke) so that a fresh one is created on next use.
+    If pool is passed, only reset if it's still the current shared pool.
+    """
+    global _shared_process_pool
+    with _registry_lock:
+        current = _shared_process_pool
+        if current is None or (pool is not None and pool is not current):
+            return
+        _shared_process_pool = None
+    current.shutdown(wait=wait, cancel_futures=True)
+
+
+def get_executor(name: ExecutorKind | str | None) -> Executor | None:
+    """
+    Resolve an executor by name.
+    Returns None for the loop's default ThreadPoolExecutor.
+    """
+    if name is None or name == ExecutorKind.THREAD:
+        return None
+    if name == ExecutorKind.PROCESS:
+        return get_shared_process_pool()
+    with _registry_lock:
+        executor = _registry.get(name, None)
+    if executor is None:
+        raise UnknownExecutorException(name)
+    return executor
+
+
+def is_process_executor(name: ExecutorKind | str | None) -> bool:
+    if name == ExecutorKind.PROCESS:
+        return True
+    if name is None or name == ExecutorKind.THREAD:
+        return False
+    return isinstance(get_executor(name), ProcessPoolExecutor)
+
+
+def ensure_picklable(
+    job_id: str, func: t.Callable, func_args: t.Tuple | None, func_kwargs: t.Dict | None
+):
+    """
+    Check up-front that a function and its args can be sent to a worker process.
+
+    raises: `PicklingCheckError`
+    """
+    for label, obj in (("func", func), ("func_args", func_args), ("func_kwargs", func_kwargs)):
+        try:
+            pickle.dumps(obj)
+        except Exception as ex:
+            raise PicklingCheckError(
+                job_id, f"{label} is not picklable - {type(ex).__name__}: {ex}"
+            ) from ex
+
+
+def stuck_worker_count() -> int:
+    """
+    Executor workers (threads or processes) still occupied by job runs that exceeded their timeout.
+    Each is unavailable to other jobs until the abandoned run returns.
+    """
+    return _stuck_workers
+
+
+def track_stuck_worker(delta: int) -> int:
+    global _stuck_workers
+    with _stuck_workers_lock:
+        _stuck_workers += delta
+        count = _stuck_workers
+    if delta > 0:
+        LOG.warning("Executor worker stuck on a timed-out job run - Stuck workers: %s", count)
+    return count
+
+
+def shutdown_shared_executors(wait: bool = False):
+    """
+    Shut down executors owned by this module (not those registered by callers).
+    Called at interpreter exit - Users that share them with others should release_shared_executors() instead.
+    """
+    reset_shared_process_pool(wait=wait)
+
+
+def acquire_shared_executors():
+    """
+    Register a user (e.g. a JobScheduler) of the executors owned by this module. Pair with release_shared_executors()
+    """
+    global _shared_executor_users
+    with _registry_lock:
+        _shared_executor_users += 1
+
+
+def release_shared_executors(wait: bool = False):
+    """
+    Unregister a user of the executors owned by this module, shutting them down once no user is left.
+    They're created again on next use.
+    """
+    global _shared_executor_users
+    with _registry_lock:
+        _shared_executor_users = max(_shared_executor_users - 1, 0)
+        last_user = _shared_executor_users == 0
+    if last_user:
+        shutdown_shared_executors(wait=wait)
+
+
+atexit.register(shutdown_shared_executors)
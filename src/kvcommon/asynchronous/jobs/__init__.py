@@ -1,16 +1,72 @@
+from .async_scheduler import AsyncJobScheduler
+from .cancellation import CancellationToken
+from .checkpoint import CatchUpPolicy
+from .clock import Clock
+from .clock import SystemClock
+from .clock import VirtualClock
+from .cron import CronExpression
+from .groups import JobGroup
+from .groups import JobGroupStats
 from .job import Job
 from .job import OneOffJob
+from .job import OverlapPolicy
 from .job import PeriodicJob
+from .lease import DatastoreLeaseBackend
+from .lease import FileLockLeaseBackend
+from .lease import JobLease
+from .lease import LeaseBackend
+from .metrics import MetricsSink
+from .metrics import RunMetrics
+from .priority import ExecutionQueue
+from .priority import JobPriority
+from .reload import ReloadSummary
+from .resilience import CircuitBreaker
+from .resilience import CircuitState
+from .resilience import RetryPolicy
+from .results import JobResult
 from .scheduler import JobScheduler
 from .scheduler import SchedulerState
+from .sharding import ShardAssignment
+from .sharding import ShardedJobScheduler
 from .status import JobState
+from .watchdog import LagHistogram
+from .watchdog import LoopStall
+from .watchdog import LoopWatchdog
 
 
 __all__ = [
+    "AsyncJobScheduler",
+    "CancellationToken",
+    "CatchUpPolicy",
+    "CircuitBreaker",
+    "CircuitState",
+    "Clock",
+    "CronExpression",
+    "DatastoreLeaseBackend",
+    "ExecutionQueue",
+    "FileLockLeaseBackend",
     "Job",
+    "JobGroup",
+    "JobGroupStats",
+    "JobLease",
+    "JobPriority",
+    "JobResult",
     "JobScheduler",
     "JobState",
+    "LagHistogram",
+    "LeaseBackend",
+    "LoopStall",
+    "LoopWatchdog",
+    "MetricsSink",
     "OneOffJob",
+    "OverlapPolicy",
     "PeriodicJob",
+    "ReloadSummary",
+    "RetryPolicy",
+    "RunMetrics",
     "SchedulerState",
+    "ShardAssignment",
+    "ShardedJobScheduler",
+    "SystemClock",
+    "VirtualClock",
 ]
@@ -0,0 +1,209 @@
+from __future__ import annotations
+import asyncio
+import logging
+import typing as t
+
+from kvcommon.datastore import VersionedDatastore
+from kvcommon.logger import get_logger
+
+from ..executors import ExecutorKind
+from ..utils import LoopType
+from .clock import Clock
+from .clock import VirtualClock
+from .groups import JobGroup
+from .job import Job
+from .metrics import MetricsSink
+from .reload import JobSource
+from .scheduler import JobScheduler
+from .scheduler import SchedulerState
+from .watchdog import LoopWatchdog
+
+
+LOG = get_logger("kvc_scheduler")
+
+
+class AsyncJobScheduler(JobScheduler):
+    """
+    Runs Jobs as tasks on the caller's running event loop (e.g. an ASGI app's) instead of on a loop in a background
+    thread - The dispatcher, jobs and submitted tasks all share that loop, with no thread hand-offs between them.
+    Sync jobs and tasks still run on their executor. Shares Job classes, and add_job()/submit() etc., with JobScheduler.
+
+        async with AsyncJobScheduler() as scheduler:
+            scheduler.add_job(job)  # Dispatched in the background until the block exits
+
+        await scheduler.serve()  # Or: Dispatch in the calling task until stop() is called or it's cancelled
+
+    Parameters:
+        event_loop (LoopType): The loop that the scheduler must be entered/served on. Default: Whichever loop it is
+            first entered/served on
+        loop_watchdog (LoopWatchdog or bool): Monitors the loop's lag while running. Off by default, as the loop
+            belongs to the host application and the watchdog needs a thread of its own.
+        job_source (callable): As for JobScheduler, but SIGHUP isn't hooked, as the loop's signal handlers belong to
+            the host application - Call request_reload() from its own handler to reload.
+        See JobScheduler for the rest. A VirtualClock isn't supported - Use JobScheduler.simulate() for that.
+    """
+
+    _event_loop: LoopType | None = None  # type: ignore[assignment]
+    _serve_task: asyncio.Task | None = None
+    _errors_task: asyncio.Task | None = None
+    _closed: bool = False
+
+    def __init__(
+        self,
+        event_loop: LoopType | None = None,
+        log_level=logging.INFO,
+        debug_mode: bool = False,
+        phase_spread: bool = False,
+        start_jitter: float = 0.0,
+        error_queue_size: int = 1000,
+        checkpoint_store: VersionedDatastore | None = None,
+        checkpoint_interval: float = 5.0,
+        metrics_sink: MetricsSink | None = None,
+        clock: Clock | None = None,
+        loop_watchdog: LoopWatchdog | bool = False,
+        priority_queue: bool = True,
+        priority_aging: float = 1.0,
+        job_groups: t.Sequence[JobGroup] | None = None,
+        job_source: JobSource | None = None,
+    ) -> None:
+        if isinstance(clock, VirtualClock):
+            raise ValueError(
+                "AsyncJobScheduler runs in real time - Use JobScheduler.simulate() with a VirtualClock"
+            )
+        super().__init__(
+            event_loop=event_loop,
+            log_level=log_level,
+            debug_mode=debug_mode,
+            phase_spread=phase_spread,
+            start_jitter=start_jitter,
+            error_queue_size=error_queue_size,
+            checkpoint_store=checkpoint_store,
+            checkpoint_interval=checkpoint_interval,
+            metrics_sink=metrics_sink,
+            clock=clock,
+            loop_watchdog=loop_watchdog,
+            priority_queue=priority_queue,
+            priority_aging=priority_aging,
+            job_groups=job_groups,
+            job_source=job_source,
+        )
+
+    def _init_event_loop(self, event_loop: LoopType | None) -> LoopType:
+        # Bound to the running loop once entered/served
+        return t.cast(LoopType, event_loop)
+
+    async def __aenter__(self) -> AsyncJobScheduler:
+        self._open()
+        self._serve_task = asyncio.create_task(self._dispatch_async(), name="kvc-scheduler")
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def serve(self):
+        """
+        Dispatch jobs in the calling task until stop() is called or the task is cancelled, then clean up.
+        """
+        self._open()
+        try:
+            await self._dispatch_async()
+        finally:
+            await self.aclose()
+
+    def _open(self):
+        if self._closed or self._state == SchedulerState.STOPPED:
+            raise RuntimeError("Scheduler has been stopped")
+        if self._state == SchedulerState.ACTIVE:
+            raise RuntimeError("Scheduler is already running")
+        loop = t.cast(LoopType, asyncio.get_running_loop())
+        if self._event_loop is None:
+            self._event_loop = loop
+            self.toggle_debug_mode(self._debug_mode)
+        elif self._event_loop is not loop:
+            raise RuntimeError("AsyncJobScheduler must run on the event loop it was given")
+
+        self._async_wakeup = asyncio.Event()
+        self._errors_task = loop.create_task(self._errors.run(), name="kvc-scheduler-errors")
+        if self._watchdog is not None:
+            self._watchdog.start(loop)
+        with self._wakeup:
+            self._rebase_dispatch_heap()
+            self._state = SchedulerState.ACTIVE
+        LOG.debug("Serving on the running event loop")
+
+    def start(self):
+        raise RuntimeError(
+            "AsyncJobScheduler runs on the caller's event loop - Use 'async with' or 'await serve()'"
+        )
+
+    def stop(self):
+        """
+        Stop dispatching - Safe to call from any thread. Jobs are cancelled as the serve()/async with block exits.
+        """
+        LOG.debug("Stopping..")
+        self._state = SchedulerState.STOPPED
+        if self._event_loop is not None:
+            self._notify_wakeup()
+
+    async def aclose(self, timeout: float = 3.0):
+        """
+        Stop dispatching, cancel running jobs and pending tasks, and wait (up to timeout seconds) for them to finish.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self.stop()
+        if self._watchdog is not None:
+            self._watchdog.stop()
+
+        serve_task = self._serve_task
+        self._serve_task = None
+        if serve_task is not None and serve_task is not asyncio.current_task():
+            await asyncio.gather(serve_task, return_exceptions=True)
+
+        try:
+            await self._cancel_loop_futures(timeout)
+        finally:
+            self._release_shared_executors()
+            self._cancel_pending_tasks()
+            self.save_checkpoints()
+            # Emit anything reported after the drain task was cancelled
+            self._errors.drain()
+            LOG.info("Stopped - Scheduler finished cleanup.")
+
+    async def _cancel_loop_futures(self, timeout: float):
+        # Only what the scheduler started - Other tasks on the loop belong to the host application
+        pending = [future for future in self._futures.values() if not future.done()]
+        pending.extend(
+            record.task
+            for record in self._tasks
+            if record.task is not None and not record.task.done()
+        )
+        self._futures.clear()
+        for future in pending:
+            future.cancel()
+        if pending:
+            LOG.debug("Waiting for %s jobs/tasks to finish cleanup..", len(pending))
+            _, still_running = await asyncio.wait(pending, timeout=timeout)
+            for future in still_running:
+                LOG.warning("Job timed out during cleanup: %s", future)
+
+        errors_task = self._errors_task
+        self._errors_task = None
+        if errors_task is not None:
+            errors_task.cancel()
+            await asyncio.gather(errors_task, return_exceptions=True)
+
+    def _launch_job(self, job: Job, loop: LoopType) -> asyncio.Task:  # type: ignore[override]
+        return loop.create_task(job.run(loop=loop, error_queue=self._errors), name=job.task_name)
+
+    def submit_many(
+        self,
+        func: t.Callable,
+        args_iterable: t.Iterable[t.Tuple],
+        executor: str = ExecutorKind.THREAD,
+        **kwargs,
+    ):
+        if self._event_loop is None:
+            raise RuntimeError("AsyncJobScheduler has no event loop until it's entered/served")
+        return super().submit_many(func, args_iterable, executor=executor, **kwargs)
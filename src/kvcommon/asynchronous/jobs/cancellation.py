@@ -0,0 +1,48 @@
+from __future__ import annotations
+import threading
+
+from ..exceptions import JobCancelledException
+
+
+class CancellationToken:
+    """
+    Cooperative cancellation for sync job funcs, which can't be interrupted once running in a worker thread.
+    Handed to job funcs that accept a `cancel_token` argument; long-running funcs should check it periodically
+    or use wait() in place of time.sleep().
+    """
+
+    _event: threading.Event
+    _reason: str | None = None
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def __repr__(self) -> str:
+        return f"<CancellationToken|cancelled:{self.cancelled}>"
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    @property
+    def reason(self) -> str | None:
+        return self._reason
+
+    def cancel(self, reason: str | None = None):
+        if self._event.is_set():
+            return
+        self._reason = reason
+        self._event.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Sleep for up to timeout seconds, returning early (True) if cancelled
+        """
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self):
+        """
+        raises: `JobCancelledException` if cancellation was requested
+        """
+        if self._event.is_set():
+            raise JobCancelledException(self._reason)
@@ -0,0 +1,124 @@
+from __future__ import annotations
+import dataclasses
+import datetime
+import threading
+import typing as t
+from enum import StrEnum
+
+from kvcommon.datastore import VersionedDatastore
+from kvcommon.datetime import NEVER
+from kvcommon.logger import get_logger
+
+
+if t.TYPE_CHECKING:
+    from .job import Job
+
+
+LOG = get_logger("kvc_checkpoint")
+
+
+class CatchUpPolicy(StrEnum):
+    """
+    What a periodic job restored from a checkpoint does with the runs it missed while the scheduler was down
+    """
+
+    RUN_ONCE = "run_once"  # A single catch-up run, then back on schedule
+    RUN_ALL = "run_all"  # One catch-up run per missed tick
+    SKIP = "skip"  # No catch-up run - Wait for the next scheduled tick
+
+
+@dataclasses.dataclass(kw_only=True)
+class JobCheckpoint:
+    """
+    The parts of a job's JobStatus that survive a restart: Timing and counters
+    """
+
+    run_time_first: datetime.datetime = NEVER
+    run_time_prev: datetime.datetime = NEVER
+    run_time_next: datetime.datetime = NEVER
+    executions: int = 0
+    skipped: int = 0
+    coalesced: int = 0
+    failed: int = 0
+    timed_out: int = 0
+    retries: int = 0
+    rejected: int = 0
+
+    def to_dict(self) -> t.Dict[str, t.Any]:
+        """
+        Plain dict of str/int values, storable by any datastore backend (including TOML)
+        """
+        data = dataclasses.asdict(self)
+        for field in ("run_time_first", "run_time_prev", "run_time_next"):
+            data[field] = data[field].isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: t.Dict[str, t.Any]) -> JobCheckpoint:
+        known = {field.name for field in dataclasses.fields(cls)}
+        values = {key: value for key, value in data.items() if key in known}
+        for field in ("run_time_first", "run_time_prev", "run_time_next"):
+            if field in values:
+                values[field] = datetime.datetime.fromisoformat(values[field])
+        return cls(**values)
+
+
+class JobCheckpointStore:
+    """
+    Persists job checkpoints in a VersionedDatastore, under a single key so that each save is one backend write.
+
+    Parameters:
+        datastore (VersionedDatastore): Where checkpoints are kept, e.g. with a TOMLBackend to survive restarts
+        key (str): Datastore key holding the dict of job ID -> checkpoint
+    """
+
+    _datastore: VersionedDatastore
+    _key: str = "job_checkpoints"
+    _lock: threading.Lock
+    _saved: t.Dict[str, t.Dict[str, t.Any]]
+
+    def __init__(self, datastore: VersionedDatastore, key: str = "job_checkpoints") -> None:
+        self._datastore = datastore
+        self._key = key
+        self._lock = threading.Lock()
+        self._saved = dict(self._datastore.get_value(self._key, default=None) or {})
+
+    @staticmethod
+    def is_checkpointed(job: Job) -> bool:
+        # One-off jobs shouldn't be re-run by a restart, and dependent jobs have no schedule to restore
+        return job.periodic and not job.depends_on
+
+    def load(self, job_id: str) -> JobCheckpoint | None:
+        with self._lock:
+            data = self._saved.get(job_id, None)
+        if data is None:
+            return None
+        try:
+            return JobCheckpoint.from_dict(data)
+        except (TypeError, ValueError) as ex:
+            LOG.warning("Discarding unreadable checkpoint for Job '%s': %s", job_id, ex)
+            return None
+
+    def save(self, jobs: t.Iterable[Job]) -> int:
+        """
+        Save checkpoints for jobs whose status changed since they were last saved.
+        Returns the number of checkpoints written.
+        """
+        changed: t.Dict[str, t.Dict[str, t.Any]] = dict()
+        with self._lock:
+            for job in jobs:
+                if not self.is_checkpointed(job) or not job.status.has_run:
+                    continue
+                data = job.status.to_checkpoint().to_dict()
+                if self._saved.get(job.id, None) != data:
+                    changed[job.id] = data
+            if not changed:
+                return 0
+            self._saved.update(changed)
+            self._datastore.set_value(self._key, dict(self._saved))
+        return len(changed)
+
+    def remove(self, job_id: str):
+        with self._lock:
+            if self._saved.pop(job_id, None) is not None:
+                self._datastore.set_value(self._key, dict(self._saved))
@@ -0,0 +1,170 @@
+from __future__ import annotations
+import asyncio
+import datetime
+import selectors
+import threading
+import time
+import typing as t
+from abc import ABC
+from abc import abstractmethod
+
+from kvcommon.datetime import utcnow
+
+from ..utils import LoopType
+
+
+_NS_PER_SECOND = 1_000_000_000
+
+# Default start of virtual time - Fixed so that simulations (including cron schedules) are reproducible
+VIRTUAL_EPOCH = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+class Clock(ABC):
+    """
+    Source of time for jobs and the scheduler: Wall-clock time for schedules and results, monotonic time for
+    dispatch, and a nanosecond counter for run metrics.
+    """
+
+    @abstractmethod
+    def now(self) -> datetime.datetime:
+        """
+        Current time as a timezone-aware UTC datetime
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def monotonic(self) -> float:
+        raise NotImplementedError()
+
+    def perf_counter_ns(self) -> int:
+        return int(self.monotonic() * _NS_PER_SECOND)
+
+
+class SystemClock(Clock):
+    """
+    Real time - The default for every job and scheduler
+    """
+
+    def now(self) -> datetime.datetime:
+        return utcnow()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def perf_counter_ns(self) -> int:
+        return time.perf_counter_ns()
+
+
+SYSTEM_CLOCK = SystemClock()
+
+
+class VirtualClock(Clock):
+    """
+    Simulated time that only moves when advanced. An event loop from new_event_loop() advances it straight to
+    its next timer whenever it would otherwise sleep, so waiting costs no real time and a scheduler on this clock
+    (see JobScheduler.simulate) can run days of schedule in seconds, identically every time.
+
+    Work in an executor takes no virtual time: The loop waits (in real time) for it before advancing.
+    So sync job funcs always finish within their timeout, and coroutine funcs advance time only by awaiting.
+
+    Parameters:
+        start (datetime.datetime): Virtual wall-clock time at creation. Default: VIRTUAL_EPOCH
+    """
+
+    _start: datetime.datetime
+    _elapsed: float = 0.0
+    _lock: threading.Lock
+
+    def __init__(self, start: datetime.datetime | None = None) -> None:
+        self._start = VIRTUAL_EPOCH if start is None else start
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<VirtualClock|{self.now().isoformat()}>"
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Virtual seconds since the clock was created
+        """
+        return self._elapsed
+
+    def now(self) -> datetime.datetime:
+        return self._start + datetime.timedelta(seconds=self._elapsed)
+
+    def monotonic(self) -> float:
+        return self._elapsed
+
+    def advance(self, seconds: float):
+        if seconds < 0:
+            raise ValueError("Virtual time cannot go backwards")
+        with self._lock:
+            self._elapsed += seconds
+
+    def new_event_loop(self) -> LoopType:
+        """
+        An event loop whose time() is this clock, and which advances it instead of sleeping
+        """
+        return t.cast(LoopType, VirtualTimeEventLoop(self))
+
+
+class _VirtualTimeSelector(selectors.DefaultSelector):
+    """
+    Selector that polls for I/O without blocking, then advances the clock by the loop's timeout instead of
+    waiting it out. Blocks for real only while executor work is in flight (or with nothing scheduled at all).
+    """
+
+    _clock: VirtualClock
+    _loop: VirtualTimeEventLoop | None = None
+
+    def __init__(self, clock: VirtualClock) -> None:
+        super().__init__()
+        self._clock = clock
+
+    def select(self, timeout: float | None = None):
+        ready = super().select(0)
+        if ready or timeout == 0:
+            return ready
+        if timeout is None or (self._loop is not None and self._loop.executor_calls > 0):
+            # Only another thread can wake the loop now - e.g. an executor worker finishing
+            return super().select(None)
+        self._clock.advance(timeout)
+        return []
+
+
+class VirtualTimeEventLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop on a VirtualClock - Created via VirtualClock.new_event_loop()
+    """
+
+    _virtual_clock: VirtualClock
+    _executor_calls: int = 0
+
+    def __init__(self, clock: VirtualClock) -> None:
+        self._virtual_clock = clock
+        selector = _VirtualTimeSelector(clock)
+        super().__init__(selector=selector)
+        selector._loop = self
+
+    @property
+    def clock(self) -> VirtualClock:
+        return self._virtual_clock
+
+    @property
+    def executor_calls(self) -> int:
+        """
+        Executor calls that haven't completed yet - Virtual time stands still until they have
+        """
+        return self._executor_calls
+
+    def time(self) -> float:
+        return self._virtual_clock.monotonic()
+
+    def run_in_executor(self, executor, func, *args) -> asyncio.Future:
+        future = super().run_in_executor(executor, func, *args)
+        self._executor_calls += 1
+        future.add_done_callback(self._on_executor_call_done)
+        return future
+
+    def _on_executor_call_done(self, future: asyncio.Future):
+        self._executor_calls -= 1
@@ -0,0 +1,252 @@
+from __future__ import annotations
+import bisect
+import datetime
+import functools
+import typing as t
+import zoneinfo
+
+from ..exceptions import CronExpressionError
+
+
+_MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+_MONTH_NAMES = {
+    name: index + 1
+    for index, name in enumerate(
+        ("JAN", "FEB", "MAR", "APR", "MAY", "JUN", "JUL", "AUG", "SEP", "OCT", "NOV", "DEC")
+    )
+}
+_DOW_NAMES = {
+    name: index for index, name in enumerate(("SUN", "MON", "TUE", "WED", "THU", "FRI", "SAT"))
+}
+
+# Enough to find Feb 29th from any starting point
+_MAX_SEARCH_YEARS = 9
+
+
+def _parse_value(expression: str, token: str, names: t.Dict[str, int] | None) -> int:
+    if names and token.upper() in names:
+        return names[token.upper()]
+    try:
+        return int(token)
+    except ValueError:
+        raise CronExpressionError(expression, f"Unrecognised value: '{token}'")
+
+
+def _parse_field(
+    expression: str, field: str, low: int, high: int, names: t.Dict[str, int] | None = None
+) -> t.Tuple[t.List[int], bool]:
+    """
+    Parse one field of a cron expression into its sorted allowed values.
+    Returns (values, is_wildcard)
+    """
+    if field in ("*", "?"):
+        return list(range(low, high + 1)), True
+
+    values: t.Set[int] = set()
+    for part in field.split(","):
+        step = 1
+        has_step = "/" in part
+        if has_step:
+            part, step_str = part.split("/", 1)
+            step = _parse_value(expression, step_str, None)
+            if step < 1:
+                raise CronExpressionError(expression, f"Step must be positive: '{field}'")
+
+        if part in ("*", "?"):
+            start, end = low, high
+        elif "-" in part:
+            start_str, end_str = part.split("-", 1)
+            start, end = _parse_value(expression, start_str, names), _parse_value(
+                expression, end_str, names
+            )
+        else:
+            start = _parse_value(expression, part, names)
+            end = high if has_step else start
+
+        if start < low or end > high or start > end:
+            raise CronExpressionError(expression, f"Value out of range {low}-{high}: '{field}'")
+        values.update(range(start, end + 1, step))
+
+    return sorted(values), False
+
+
+class CronExpression:
+    """
+    A cron schedule, with an optional leading seconds field and a time zone.
+
+        [second] minute hour day-of-month month day-of-week
+
+    Supports '*', '?', lists (1,2), ranges (1-5), steps (*/15, 10-40/10), month and weekday names
+    and the @yearly/@monthly/@weekly/@daily/@hourly macros. As in standard cron, if both day-of-month
+    and day-of-week are restricted then a day matching either one fires.
+
+    Next fire times are found by jumping field-by-field to the next allowed value rather than
+    stepping through every minute. Prefer `CronExpression.get()`, which shares parsed instances
+    (and their next-fire cache) between all jobs using the same expression.
+    """
+
+    _expression: str
+    _tz: datetime.tzinfo
+    _seconds: t.List[int]
+    _minutes: t.List[int]
+    _hours: t.List[int]
+    _days: t.List[int]
+    _months: t.List[int]
+    _weekdays: t.FrozenSet[int]
+    _days_wildcard: bool
+    _weekdays_wildcard: bool
+    _last_fire: t.Tuple[datetime.datetime, datetime.datetime] | None = None
+
+    def __init__(self, expression: str, tz: datetime.tzinfo | str | None = None) -> None:
+        self._expression = expression
+        if tz is None:
+            tz = datetime.timezone.utc
+        elif isinstance(tz, str):
+            try:
+                tz = zoneinfo.ZoneInfo(tz)
+            except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+                raise CronExpressionError(expression, f"Unknown time zone: '{tz}'")
+        self._tz = tz
+
+        normalised = _MACROS.get(expression.strip().lower(), expression)
+        fields = normalised.split()
+        if len(fields) == 5:
+            fields.insert(0, "0")
+        if len(fields) != 6:
+            raise CronExpressionError(expression, "Expected 5 fields (or 6 with seconds)")
+
+        self._seconds, _ = _parse_field(expression, fields[0], 0, 59)
+        self._minutes, _ = _parse_field(expression, fields[1], 0, 59)
+        self._hours, _ = _parse_field(expression, fields[2], 0, 23)
+        self._days, self._days_wildcard = _parse_field(expression, fields[3], 1, 31)
+        self._months, _ = _parse_field(expression, fields[4], 1, 12, _MONTH_NAMES)
+        weekdays, self._weekdays_wildcard = _parse_field(expression, fields[5], 0, 7, _DOW_NAMES)
+        # Both 0 and 7 mean Sunday
+        self._weekdays = frozenset(0 if day == 7 else day for day in weekdays)
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def get(cls, expression: str, tz: str | None = None) -> CronExpression:
+        """
+        Get a shared, parsed CronExpression
+        """
+        return cls(expression, tz)
+
+    def __repr__(self) -> str:
+        return f"<CronExpression|'{self._expression}'|{self._tz}>"
+
+    @property
+    def expression(self) -> str:
+        return self._expression
+
+    @property
+    def tz(self) -> datetime.tzinfo:
+        return self._tz
+
+    def _day_matches(self, day: datetime.datetime) -> bool:
+        day_match = day.day in self._days
+        weekday_match = (day.weekday() + 1) % 7 in self._weekdays
+        if self._days_wildcard:
+            return weekday_match
+        if self._weekdays_wildcard:
+            return day_match
+        return day_match or weekday_match
+
+    def _localize(self, local: datetime.datetime) -> datetime.datetime | None:
+        """
+        Attach the time zone to a naive local time. Returns None for times skipped by a DST transition.
+        Ambiguous (repeated) times resolve to their first occurrence.
+        """
+        aware = local.replace(tzinfo=self._tz, fold=0)
+        round_trip = (
+            aware.astimezone(datetime.timezone.utc).astimezone(self._tz).replace(tzinfo=None)
+        )
+        if round_trip != local:
+            return None
+        return aware
+
+    def next_fire(self, after: datetime.datetime) -> datetime.datetime:
+        """
+        The first fire time strictly after `after` (naive datetimes are treated as UTC).
+        Returned in the time zone of `after` (UTC if naive).
+        """
+        if after.tzinfo is None:
+            after = after.replace(tzinfo=datetime.timezone.utc)
+
+        last_fire = self._last_fire
+        if last_fire is not None and last_fire[0] == after:
+            return last_fire[1]
+
+        result = self._find_next_fire(after)
+        self._last_fire = (after, result)
+        return result
+
+    def _find_next_fire(self, after: datetime.datetime) -> datetime.datetime:
+        one_day = datetime.timedelta(days=1)
+        local = after.astimezone(self._tz).replace(tzinfo=None, microsecond=0) + datetime.timedelta(
+            seconds=1
+        )
+        max_year = local.year + _MAX_SEARCH_YEARS
+
+        while local.year <= max_year:
+            if local.month not in self._months:
+                index = bisect.bisect_left(self._months, local.month)
+                if index < len(self._months):
+                    local = datetime.datetime(local.year, self._months[index], 1)
+                else:
+                    local = datetime.datetime(local.year + 1, self._months[0], 1)
+                continue
+
+            if not self._day_matches(local):
+                local = datetime.datetime(local.year, local.month, local.day) + one_day
+                continue
+
+            if local.hour not in self._hours:
+                index = bisect.bisect_left(self._hours, local.hour)
+                if index < len(self._hours):
+                    local = local.replace(hour=self._hours[index], minute=0, second=0)
+                else:
+                    local = datetime.datetime(local.year, local.month, local.day) + one_day
+                continue
+
+            if local.minute not in self._minutes:
+                index = bisect.bisect_left(self._minutes, local.minute)
+                if index < len(self._minutes):
+                    local = local.replace(minute=self._minutes[index], second=0)
+                else:
+                    local = local.replace(minute=0, second=0) + datetime.timedelta(hours=1)
+                continue
+
+            if local.second not in self._seconds:
+                index = bisect.bisect_left(self._seconds, local.second)
+                if index < len(self._seconds):
+                    local = local.replace(second=self._seconds[index])
+                else:
+                    local = local.replace(second=0) + datetime.timedelta(minutes=1)
+                continue
+
+            aware = self._localize(local)
+            if aware is None or aware <= after:
+                # Skipped by DST (or the first occurrence of a repeated hour that's already passed)
+                local += datetime.timedelta(seconds=1)
+                continue
+            return aware.astimezone(after.tzinfo)
+
+        raise CronExpressionError(
+            self._expression, f"No fire time within {_MAX_SEARCH_YEARS} years"
+        )
+
+    def approximate_interval(self, after: datetime.datetime) -> datetime.timedelta:
+        """
+        Time between the next two fire times after `after`. Only an approximation for irregular schedules.
+        """
+        first = self.next_fire(after)
+        return self.next_fire(first) - first
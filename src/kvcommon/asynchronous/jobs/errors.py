@@ -1,15 +1,18 @@
 from __future__ import annotations
 import asyncio
+import collections
 import logging
-import queue
+import threading
 import typing as t
 from concurrent.futures import Future
 
+from kvcommon.asynchronous.utils import LoopType
+from kvcommon.asynchronous.utils import call_on_loop_thread
 from kvcommon.logger import get_logger
 
+from .clock import SYSTEM_CLOCK
+from .clock import Clock
 from .job import JobExceptionStruct
-from .job import JobParams
-from .job import PeriodicJob
 
 
 if t.TYPE_CHECKING:
@@ -19,7 +22,7 @@ if t.TYPE_CHECKING:
 LOG = get_logger("kvc_scheduler")
 
 
-def future_check_for_exception(future: Future, job: Job, error_queue: queue.Queue | None = None):
+def future_check_for_exception(future: Future, job: Job, error_queue: ErrorPipeline | None = None):
     if future.cancelled():
         # LOG.debug("Future for Job '%s' was cancelled.", job.id)
         return
@@ -34,25 +37,201 @@ def future_check_for_exception(future: Future, job: Job, error_queue: queue.Queu
             error_queue.put(JobExceptionStruct(job=job, exception=ex))
 
 
-async def emit_queued_error(error_queue: queue.Queue, logger: logging.Logger = LOG):
-    try:
-        job_exception: JobExceptionStruct = error_queue.get_nowait()
-        ex = job_exception.exception
-        ex_name = type(ex).__name__
-        logger.exception("Job '%s' raised: '%s' - %s", job_exception.job.id, ex_name, ex, exc_info=ex)
-        error_queue.task_done()
-    except queue.Empty:
-        pass
-    await asyncio.sleep(0.1)
-
-
-def get_error_poller_task(error_queue: queue.Queue, interval: float | int = 1, logger: logging.Logger = LOG):
-    return PeriodicJob(
-        JobParams(
-            func=emit_queued_error,
-            id="errors",
-            interval=interval,
-            stop_on_exception=False,
-            func_kwargs=dict(error_queue=error_queue, logger=logger),
-        )
-    )
+class ErrorPipeline:
+    """
+    Bounded, thread-safe sink for job exceptions, drained in batches by a task on the scheduler's event loop.
+    The drain task sleeps until errors arrive, so a burst of failures is logged promptly instead of one per tick.
+
+    Parameters:
+        maxsize (int): Max errors held awaiting the drain task. When full, the oldest are dropped (and counted)
+        batch_size (int): Max errors logged per drain pass before yielding to other tasks on the loop
+        rate_window (float): Window (seconds) over which per-job error rates are measured
+        logger (logging.Logger): Logger that errors are emitted on
+        clock (Clock): Source of time for error rates. Default: SystemClock
+    """
+
+    _pending: collections.deque[JobExceptionStruct]
+    _lock: threading.Lock
+    _loop: LoopType | None = None
+    _arrived: asyncio.Event | None = None
+    _wake_scheduled: bool = False
+    _batch_size: int = 100
+    _rate_window: float = 60.0
+    _logger: logging.Logger = LOG
+    _dropped: int = 0
+    _dropped_unreported: int = 0
+    _emitted: int = 0
+    _job_error_times: t.Dict[str, collections.deque[float]]
+    _job_error_totals: collections.Counter[str]
+    _clock: Clock = SYSTEM_CLOCK
+
+    def __init__(
+        self,
+        maxsize: int = 1000,
+        batch_size: int = 100,
+        rate_window: float = 60.0,
+        logger: logging.Logger = LOG,
+        clock: Clock | None = None,
+    ) -> None:
+        if maxsize < 1 or batch_size < 1:
+            raise ValueError("maxsize and batch_size must be at least 1")
+        self._pending = collections.deque(maxlen=maxsize)
+        self._lock = threading.Lock()
+        self._batch_size = batch_size
+        self._rate_window = rate_window
+        self._logger = logger
+        self._job_error_times = dict()
+        self._job_error_totals = collections.Counter()
+        if clock is not None:
+            self._clock = clock
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def dropped_count(self) -> int:
+        """
+        Errors discarded without being emitted because the pipeline was full
+        """
+        return self._dropped
+
+    @property
+    def emitted_count(self) -> int:
+        return self._emitted
+
+    def put(self, item: JobExceptionStruct):
+        """
+        Enqueue a job exception. Safe to call from any thread and never blocks.
+        """
+        now = self._clock.monotonic()
+        job_id = item.job.id
+        with self._lock:
+            if len(self._pending) == self._pending.maxlen:
+                self._dropped += 1
+                self._dropped_unreported += 1
+            self._pending.append(item)
+
+            self._job_error_totals[job_id] += 1
+            times = self._job_error_times.setdefault(job_id, collections.deque())
+            times.append(now)
+            self._expire_times(times, now)
+
+            loop = self._loop
+            schedule_wake = loop is not None and not self._wake_scheduled
+            if schedule_wake:
+                self._wake_scheduled = True
+
+        if schedule_wake:
+            self._schedule_wake(t.cast(LoopType, loop))
+
+    def _schedule_wake(self, loop: LoopType):
+        try:
+            call_on_loop_thread(loop, self._set_arrived)
+        except RuntimeError:
+            # Loop closed - Nothing left to drain on
+            pass
+
+    def _set_arrived(self):
+        if self._arrived is not None:
+            self._arrived.set()
+
+    def _expire_times(self, times: collections.deque[float], now: float):
+        cutoff = now - self._rate_window
+        while times and times[0] < cutoff:
+            times.popleft()
+
+    def error_count(self, job_id: str) -> int:
+        """
+        Total errors raised by a job since the pipeline was created
+        """
+        with self._lock:
+            return self._job_error_totals[job_id]
+
+    def error_rate(self, job_id: str) -> float:
+        """
+        Errors per second raised by a job over the last rate_window seconds
+        """
+        now = self._clock.monotonic()
+        with self._lock:
+            times = self._job_error_times.get(job_id, None)
+            if not times:
+                return 0.0
+            self._expire_times(times, now)
+            return len(times) / self._rate_window
+
+    def error_rates(self) -> t.Dict[str, float]:
+        """
+        Errors per second over the last rate_window seconds, for each job that raised any in that time
+        """
+        with self._lock:
+            job_ids = list(self._job_error_times)
+        rates = {job_id: self.error_rate(job_id) for job_id in job_ids}
+        return {job_id: rate for job_id, rate in rates.items() if rate > 0}
+
+    def forget(self, job_id: str):
+        """
+        Drop a job's error count and rate - Called when the job is removed from the scheduler
+        """
+        with self._lock:
+            self._job_error_times.pop(job_id, None)
+            self._job_error_totals.pop(job_id, None)
+
+    def _take_batch(self) -> t.Tuple[t.List[JobExceptionStruct], int]:
+        with self._lock:
+            batch = [
+                self._pending.popleft() for _ in range(min(self._batch_size, len(self._pending)))
+            ]
+            dropped, self._dropped_unreported = self._dropped_unreported, 0
+            if not self._pending:
+                self._wake_scheduled = False
+                if self._arrived is not None:
+                    self._arrived.clear()
+        return batch, dropped
+
+    def _emit_batch(self, batch: t.List[JobExceptionStruct], dropped: int):
+        if dropped:
+            self._logger.warning("Error pipeline full - Dropped %s job error(s)", dropped)
+        for job_exception in batch:
+            ex = job_exception.exception
+            ex_name = type(ex).__name__
+            self._logger.exception(
+                "Job '%s' raised: '%s' - %s", job_exception.job.id, ex_name, ex, exc_info=ex
+            )
+        self._emitted += len(batch)
+
+    def drain(self) -> int:
+        """
+        Emit everything pending right now, from the calling thread. Returns the number of errors emitted.
+        """
+        total = 0
+        while True:
+            batch, dropped = self._take_batch()
+            if not batch and not dropped:
+                return total
+            self._emit_batch(batch, dropped)
+            total += len(batch)
+
+    async def run(self):
+        """
+        Drain task: Runs on an event loop until cancelled, emitting errors in batches as they arrive.
+        Anything still pending when cancelled is emitted before exiting.
+        """
+        self._arrived = asyncio.Event()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._wake_scheduled = bool(self._pending)
+            if self._pending:
+                self._arrived.set()
+        try:
+            while True:
+                await self._arrived.wait()
+                batch, dropped = self._take_batch()
+                self._emit_batch(batch, dropped)
+                # Let other tasks run between batches of a large backlog
+                await asyncio.sleep(0)
+        finally:
+            with self._lock:
+                self._loop = None
+                self._wake_scheduled = False
+            self.drain()
@@ -32,18 +32,43 @@ def _signal_handler(loop):
     loop.stop()
 
 
-def _add_signal_handlers_to_loop(loop: LoopType, logger: logging.Logger = LOG):
+def _add_signal_handlers_to_loop(
+    loop: LoopType, logger: logging.Logger = LOG, on_hangup: t.Callable[[], None] | None = None
+):
     # Set up signal handlers for graceful shutdown:
     try:
         # loop.add_signal_handler(signal.SIGINT, _signal_handler, loop) # Handled by main thread
         loop.add_signal_handler(signal.SIGQUIT, _signal_handler, loop)
         loop.add_signal_handler(signal.SIGTERM, _signal_handler, loop)
-        loop.add_signal_handler(signal.SIGHUP, _signal_handler, loop)  # TODO: Rich SIGHUP handling
+        if on_hangup is not None:
+            # e.g. Reload configuration without stopping the loop (called on the loop's thread)
+            loop.add_signal_handler(signal.SIGHUP, on_hangup)
+        else:
+            loop.add_signal_handler(signal.SIGHUP, _signal_handler, loop)
     except NotImplementedError:
         logger.warning("Signal handlers not supported on this platform.")
 
 
-def get_or_create_loop(add_handlers: bool = True, logger: logging.Logger = LOG, adopt_loop: LoopType | None = None) -> LoopType:
+def remove_signal_handlers_from_loop(loop: LoopType, logger: logging.Logger = LOG):
+    """
+    Undo _add_signal_handlers_to_loop - Otherwise the loop only does so when garbage-collected, resetting the signals
+    to their defaults (SIGHUP's terminates the process) under whichever loop has handled them since.
+    Must be called from the main thread, as signal handlers can only be changed there.
+    """
+    for sig in (signal.SIGQUIT, signal.SIGTERM, signal.SIGHUP):
+        try:
+            loop.remove_signal_handler(sig)
+        except (NotImplementedError, ValueError, RuntimeError) as ex:
+            logger.debug("Couldn't remove %s handler: %s", sig.name, ex)
+            return
+
+
+def get_or_create_loop(
+    add_handlers: bool = True,
+    logger: logging.Logger = LOG,
+    adopt_loop: LoopType | None = None,
+    on_hangup: t.Callable[[], None] | None = None,
+) -> LoopType:
     try:
         # Try to get pre-existing thread-local event loop
         loop = adopt_loop or asyncio.get_event_loop()
@@ -58,7 +83,7 @@ def get_or_create_loop(add_handlers: bool = True, logger: logging.Logger = LOG,
     loop = t.cast(LoopType, loop)  # AbstractEventLoop is too abstract for code introspection
 
     if add_handlers:
-        _add_signal_handlers_to_loop(loop, logger=logger)
+        _add_signal_handlers_to_loop(loop, logger=logger, on_hangup=on_hangup)
 
     return loop
 
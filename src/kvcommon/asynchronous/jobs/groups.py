@@ -0,0 +1,230 @@
+from __future__ import annotations
+import asyncio
+import dataclasses
+import threading
+import typing as t
+
+from .clock import SYSTEM_CLOCK
+from .clock import Clock
+from .priority import ExecutionQueue
+from .priority import JobPriority
+
+_NS_PER_SECOND = 1_000_000_000
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: Refills at rate tokens per second, holding at most burst.
+    Callers reserve a token even when none is left and wait out the deficit, so waiters are served in arrival
+    order and the long-run rate never exceeds rate. Measured on the event loop's time, so it follows a VirtualClock.
+
+    Parameters:
+        rate (float): Tokens added per second
+        burst (int): Capacity - Max tokens taken at once after a quiet period. Default: rate (at least 1)
+    """
+
+    _rate: float
+    _burst: float
+    _tokens: float
+    _updated: float | None = None
+    _lock: threading.Lock
+
+    def __init__(self, rate: float, burst: int | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        burst = max(int(rate), 1) if burst is None else burst
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self._rate = rate
+        self._burst = float(burst)
+        self._tokens = float(burst)
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        return int(self._burst)
+
+    def reserve(self, now: float) -> float:
+        """
+        Take a token, returning the seconds to wait before it may be used (0.0 if one was available)
+        """
+        with self._lock:
+            if self._updated is not None:
+                self._tokens = min(self._tokens + (now - self._updated) * self._rate, self._burst)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    def refund(self):
+        with self._lock:
+            self._tokens = min(self._tokens + 1, self._burst)
+
+    async def acquire(self) -> float:
+        """
+        Wait for a token. Returns the seconds waited.
+        """
+        delay = self.reserve(asyncio.get_running_loop().time())
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self.refund()
+                raise
+        return delay
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class JobGroupStats:
+    """
+    Point-in-time view of a JobGroup's throttling
+
+    Parameters:
+        name (str): The group's name/tag
+        running (int): Runs of the group's jobs executing now
+        waiting (int): Runs waiting for a concurrency slot
+        admitted (int): Runs let through, in total
+        throttled (int): Runs that had to wait for a concurrency slot
+        rate_limited (int): Runs that had to wait for a rate limit token
+        wait_total (float): Seconds runs spent waiting on the group's limits, in total
+    """
+
+    name: str
+    running: int
+    waiting: int
+    admitted: int
+    throttled: int
+    rate_limited: int
+    wait_total: float
+
+
+class JobGroup:
+    """
+    Limits shared by every job tagged with the group's name (JobParams.tags) - e.g. to respect a backend's API
+    quota across all the jobs calling it. Each run (and retry attempt) of a member job first waits for a concurrency
+    slot - highest priority first - then for a rate limit token, so the rate applies to runs actually starting.
+    Register with JobScheduler (job_groups or add_group()). Thread-safe, so it can be shared between event loops.
+
+    Parameters:
+        name (str): The tag that puts a job in the group
+        max_concurrent (int): Max runs of the group's jobs executing at once. Default: No limit
+        rate (float): Max runs started per second across the group. Default: No limit
+        burst (int): Max runs started back-to-back once the group has been quiet. Default: rate (at least 1)
+    """
+
+    _name: str
+    _slots: ExecutionQueue | None = None
+    _bucket: TokenBucket | None = None
+    _stats_lock: threading.Lock
+    _running: int = 0
+    _admitted: int = 0
+    _throttled: int = 0
+    _rate_limited: int = 0
+    _wait_ns: int = 0
+    _clock: Clock = SYSTEM_CLOCK
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int | None = None,
+        rate: float | None = None,
+        burst: int | None = None,
+    ) -> None:
+        self._name = name
+        if max_concurrent is not None:
+            self._slots = ExecutionQueue(max_concurrent)
+        if rate is not None:
+            self._bucket = TokenBucket(rate, burst)
+        self._stats_lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<JobGroup|{self._name}>"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def max_concurrent(self) -> int | None:
+        return None if self._slots is None else self._slots.capacity
+
+    @property
+    def rate(self) -> float | None:
+        return None if self._bucket is None else self._bucket.rate
+
+    def set_clock(self, clock: Clock):
+        """
+        Switch to another source of time for waits and aging - Called by JobScheduler.add_group()
+        """
+        self._clock = clock
+        if self._slots is not None:
+            self._slots.set_clock(clock)
+
+    async def acquire(self, priority: int = JobPriority.NORMAL) -> int:
+        """
+        Wait until a run may start. Returns the nanoseconds waited. Must be paired with a release().
+        """
+        waited_ns = self._clock.perf_counter_ns()
+        slots = self._slots
+        throttled = slots is not None and await slots.acquire(priority)
+        rate_limited = False
+        try:
+            if self._bucket is not None:
+                rate_limited = await self._bucket.acquire() > 0
+        except BaseException:
+            if slots is not None:
+                slots.release()
+            raise
+        waited_ns = self._clock.perf_counter_ns() - waited_ns
+        with self._stats_lock:
+            self._running += 1
+            self._admitted += 1
+            self._throttled += throttled
+            self._rate_limited += rate_limited
+            if throttled or rate_limited:
+                self._wait_ns += waited_ns
+        return waited_ns if throttled or rate_limited else 0
+
+    def release(self):
+        with self._stats_lock:
+            self._running -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    def stats(self) -> JobGroupStats:
+        waiting = 0 if self._slots is None else self._slots.waiting_count
+        with self._stats_lock:
+            return JobGroupStats(
+                name=self._name,
+                running=self._running,
+                waiting=waiting,
+                admitted=self._admitted,
+                throttled=self._throttled,
+                rate_limited=self._rate_limited,
+                wait_total=self._wait_ns / _NS_PER_SECOND,
+            )
+
+
+async def acquire_groups(groups: t.Sequence[JobGroup], priority: int = JobPriority.NORMAL) -> int:
+    """
+    Acquire every group in order (callers keep groups sorted by name, so that jobs sharing groups can't deadlock).
+    Returns the nanoseconds waited. If interrupted, the groups acquired so far are released.
+    """
+    acquired: t.List[JobGroup] = []
+    waited_ns = 0
+    try:
+        for group in groups:
+            waited_ns += await group.acquire(priority)
+            acquired.append(group)
+    except BaseException:
+        release_groups(acquired)
+        raise
+    return waited_ns
+
+
+def release_groups(groups: t.Sequence[JobGroup]):
+    for group in reversed(groups):
+        group.release()
@@ -1,38 +1,253 @@
 from __future__ import annotations
 import asyncio
+import concurrent.futures
 import dataclasses
 import datetime
+import functools
+import inspect
 import logging
-import queue
+import threading
 import time
 import typing as t
+from concurrent.futures import Executor
+from enum import StrEnum
 
-from kvcommon.asynchronous.utils import run_callable_safely
+from kvcommon.asynchronous.exceptions import JobTimeoutException
+from kvcommon.asynchronous.executors import ExecutorKind
+from kvcommon.asynchronous.executors import get_executor
+from kvcommon.asynchronous.executors import is_process_executor
+from kvcommon.asynchronous.executors import track_stuck_worker
+from kvcommon.asynchronous.utils import CallableKind
+from kvcommon.asynchronous.utils import call_on_loop_thread
+from kvcommon.asynchronous.utils import call_sync_async
+from kvcommon.asynchronous.utils import classify_callable
 from kvcommon.asynchronous.utils import LoopType
 from kvcommon.datetime import EPOCH
 from kvcommon.datetime import NEVER
-from kvcommon.datetime import utcnow
 from kvcommon.logger import get_logger
 
+from .cancellation import CancellationToken
+from .checkpoint import CatchUpPolicy
+from .checkpoint import JobCheckpoint
+from .clock import SYSTEM_CLOCK
+from .clock import Clock
+from .cron import CronExpression
+from .groups import JobGroup
+from .groups import acquire_groups
+from .groups import release_groups
+from .lease import JobLease
+from .lease import LeaseBackend
 from .metrics import JobTimer
+from .metrics import MetricsSink
+from .metrics import RunMetrics
+from .metrics import RunTiming
+from .priority import ExecutionQueue
+from .priority import ExecutionQueues
+from .priority import JobPriority
+from .resilience import CircuitBreaker
+from .resilience import CircuitState
+from .resilience import RetryPolicy
+from .results import JobResult
+from .results import JobResultBuffer
 from .status import JobState
 from .status import JobStatus
+from .timing import random_delay
+
+
+if t.TYPE_CHECKING:
+    from .errors import ErrorPipeline
+    from .tasks import TaskRecord
 
 
 LOG = get_logger("kvc_job")
 
+# A cron job dispatched up to this late still runs for the fire time it was dispatched for
+_CRON_START_TOLERANCE = datetime.timedelta(seconds=1)
+
+# Beyond this many missed cron ticks, jump straight to the next fire time (and stop counting precisely)
+_CRON_MAX_CATCHUP_COUNT = 1000
+
+
+class _JobLogger(logging.LoggerAdapter):
+    """
+    A job's view of the shared kvc_job logger - Filtered at the job's own level, and messages prefixed with its ID.
+    Unlike a logger per job, it's freed with the job, and setting its level doesn't clear every logger's level cache.
+    """
+
+    _level: int
+    _prefix: str
+
+    def __init__(self, job_id: str, level: int) -> None:
+        super().__init__(LOG)
+        self._level = level
+        # Escaped as it's part of the %-format string
+        self._prefix = f"job:{job_id} - ".replace("%", "%%")
+
+    def setLevel(self, level: int):
+        self._level = level
+
+    def getEffectiveLevel(self) -> int:
+        return max(self._level, self.logger.getEffectiveLevel())
+
+    def isEnabledFor(self, level: int) -> bool:
+        return level >= self._level and self.logger.isEnabledFor(level)
+
+    def process(
+        self, msg: t.Any, kwargs: t.MutableMapping[str, t.Any]
+    ) -> t.Tuple[t.Any, t.MutableMapping[str, t.Any]]:
+        return f"{self._prefix}{msg}", kwargs
+
+
+class OverlapPolicy(StrEnum):
+    """
+    What a periodic job does with ticks that come due while it is still executing (or suspended)
+    """
+
+    SKIP = "skip"  # Drop missed ticks and wait for the next scheduled one
+    COALESCE = "coalesce"  # Fold all missed ticks into a single immediate catch-up run
+    QUEUE = "queue"  # Run missed ticks back-to-back, up to overlap_limit of them
+    CONCURRENT = "concurrent"  # Start each tick on schedule, with up to overlap_limit instances running at once
 
-@dataclasses.dataclass(kw_only=True)
+
+@dataclasses.dataclass(kw_only=True, slots=True)
 class JobFunc:
     func: t.Callable | t.Coroutine
     func_args: t.Tuple | None = ()
     func_kwargs: t.Dict[str, t.Any] | None = None
+    executor: str = ExecutorKind.THREAD
+    accepts_cancel_token: bool = dataclasses.field(init=False, default=False)
+    accepts_upstream_results: bool = dataclasses.field(init=False, default=False)
+    kind: CallableKind = dataclasses.field(init=False, default=CallableKind.SYNC)
+
+    def __post_init__(self):
+        # Classified once here rather than on every run
+        self.kind = classify_callable(self.func)
+        self.accepts_cancel_token = _accepts_kwarg(self.func, "cancel_token")
+        self.accepts_upstream_results = _accepts_kwarg(self.func, "upstream_results")
 
-    async def run(self, loop: LoopType, id: str) -> t.Any:
+    async def run(
+        self,
+        loop: LoopType,
+        id: str,
+        cancel_token: CancellationToken | None = None,
+        upstream_results: t.Dict[str, JobResult] | None = None,
+        timing: RunTiming | None = None,
+        run_start: _RunStart | None = None,
+    ) -> t.Any:
         # LOG.debug("Job '%s' running", id)
         func_args = self.func_args or ()
         func_kwargs = self.func_kwargs or {}
-        return await run_callable_safely(loop, func=self.func, *func_args, **func_kwargs)
+        if (
+            cancel_token is not None
+            and self.accepts_cancel_token
+            and not is_process_executor(self.executor)
+        ):
+            # Tokens can't cross a process boundary
+            func_kwargs = dict(func_kwargs, cancel_token=cancel_token)
+        if upstream_results is not None and self.accepts_upstream_results:
+            func_kwargs = dict(func_kwargs, upstream_results=upstream_results)
+        timing = RunTiming() if timing is None else timing
+
+        if self.executor != ExecutorKind.THREAD:
+            # Only sync functions are ever assigned a non-default executor (see JobParams)
+            executor = get_executor(self.executor)
+            return await self._run_in_executor(
+                loop, func_args, func_kwargs, timing, executor, run_start
+            )
+
+        if self.kind == CallableKind.SYNC:
+            value = await self._run_in_executor(
+                loop, func_args, func_kwargs, timing, None, run_start
+            )
+            if inspect.isawaitable(value):
+                # e.g. a lambda wrapping a coroutine function
+                return await value
+            return value
+
+        started_ns = time.perf_counter_ns()
+        try:
+            if self.kind == CallableKind.AWAITABLE:
+                # A coroutine object can only be awaited once - Only suits a one-off job
+                return await self.func
+            return await self.func(*func_args, **func_kwargs)
+        finally:
+            timing.observe(started_ns, started_ns, time.perf_counter_ns())
+
+    async def _run_in_executor(
+        self,
+        loop: LoopType,
+        func_args: t.Tuple,
+        func_kwargs: t.Dict[str, t.Any],
+        timing: RunTiming,
+        executor: Executor | None = None,
+        run_start: _RunStart | None = None,
+    ) -> t.Any:
+        submitted_ns = time.perf_counter_ns()
+        call, call_args = _timed_call, (self.func, func_args, func_kwargs)
+        if run_start is not None:
+            call, call_args = run_start.call, (_timed_call, *call_args)
+        started_ns, finished_ns, value, exception = await call_sync_async(
+            call, func_args=call_args, loop=loop, executor=executor
+        )
+        timing.observe(submitted_ns, started_ns, finished_ns)
+        if exception is not None:
+            raise exception
+        return value
+
+
+def _timed_call(
+    func: t.Callable, func_args: t.Tuple, func_kwargs: t.Dict[str, t.Any]
+) -> t.Tuple[int, int, t.Any, Exception | None]:
+    """
+    Runs in the executor worker, so that queue wait and execution time can be told apart.
+    Module-level so that it can be pickled for process pools.
+    """
+    started_ns = time.perf_counter_ns()
+    try:
+        value = func(*func_args, **func_kwargs)
+    except Exception as ex:
+        return started_ns, time.perf_counter_ns(), None, ex
+    return started_ns, time.perf_counter_ns(), value, None
+
+
+class _RunStart:
+    """
+    Settles, once, whether a sync run's func starts in its worker thread or is withdrawn before it does - So that a
+    run that times out while still queued for a worker is dropped, rather than left to run after its timeout
+    """
+
+    __slots__ = ("_lock", "_started")
+
+    _lock: threading.Lock
+    _started: bool | None  # None until settled
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started = None
+
+    def call(self, func: t.Callable, *args) -> t.Any:
+        # In the worker thread
+        with self._lock:
+            if self._started is False:
+                raise concurrent.futures.CancelledError()
+            self._started = True
+        return func(*args)
+
+    def withdraw(self) -> bool:
+        """
+        Returns True if the func hadn't started, and now never will
+        """
+        with self._lock:
+            if self._started is None:
+                self._started = False
+            return not self._started
+
+
+def _accepts_kwarg(func: t.Callable | t.Coroutine, name: str) -> bool:
+    try:
+        return name in inspect.signature(func).parameters  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return False
 
 
 class JobParams:
@@ -44,6 +259,7 @@ class JobParams:
         id (str): A short (unique) id for the job
         interval (datetime.timedelta or float or int): Interval (in seconds) between job iterations.
             Interpret as "delay before execution" for one-off jobs.
+            Optional for cron jobs, where it defaults to the (approximate) time between fire times.
         delay_first_run (bool):
             True: Job waits one interval before execution. Used as delay duration for one-off jobs.
             False: Job runs immediately
@@ -57,30 +273,148 @@ class JobParams:
         log_level (int): Log level (logging.DEBUG, logging.INFO, etc.) to use for the job's internal logger
         func_args (tuple): Positional args for the job func
         func_kwargs (dict): Named args for the job func
+        executor (str): Where a sync job func is executed. Has no effect on coroutine functions.
+            "thread": The event loop's default ThreadPoolExecutor (default)
+            "process": A process pool shared between jobs - For CPU-bound funcs that would hold the GIL.
+                func, func_args and func_kwargs must be picklable (checked when added to a JobScheduler)
+            Any other value: The name of a dedicated executor registered via `executors.register_executor`
+        overlap (OverlapPolicy): Only affects periodic jobs - What to do with ticks missed because an
+            execution ran longer than the interval (or the job was suspended). Default: COALESCE
+        overlap_limit (int): Max catch-up runs queued (OverlapPolicy.QUEUE) or max instances running
+            at once (OverlapPolicy.CONCURRENT)
+        jitter (float): Only affects periodic jobs - Max random delay (seconds) added to each run.
+            Doesn't shift the schedule, so it can't accumulate drift. Must be less than the interval.
+        cron (CronExpression or str): Run on a cron schedule instead of a fixed interval,
+            e.g. "*/30 * * * * *" (with seconds) or "0 9 * * MON-FRI". delay_first_run has no effect.
+        timezone (str): IANA time zone name for a cron expression given as a string. Default: UTC
+        result_history (int): Number of recent results (return values or exceptions) kept by the job
+        timeout (datetime.timedelta or float or int): Max duration (seconds) of each run. Default: No limit
+            Coroutine funcs are cancelled when it elapses. Sync funcs can't be interrupted, so any job func that
+            accepts a `cancel_token` arg is passed a CancellationToken to check, and the run is abandoned.
+            A sync run still waiting for a worker thread is dropped instead, so its func never runs.
+            Time spent waiting for a job group's limits or for admission to the executor doesn't count.
+            Timed-out runs raise JobTimeoutException and count as failures.
+        retry (RetryPolicy): Retry failed runs with exponential backoff before giving up until the next tick
+        circuit_breaker (CircuitBreaker): Only affects periodic jobs - Stop running the job after consecutive
+            failed runs, then probe with a single run once the breaker's reset_timeout has elapsed
+        depends_on (sequence of str): IDs of upstream jobs. The job then runs as soon as every upstream has
+            completed a run since its own last run, instead of on an interval (which becomes optional).
+            Upstreams must be added to the scheduler first. If the job func accepts an `upstream_results` arg,
+            it's passed a dict of upstream job ID -> JobResult. Runs are skipped if an upstream run failed.
+        catch_up (CatchUpPolicy): Only affects periodic jobs restored from a scheduler checkpoint - How many
+            runs are made for ticks missed while the scheduler was down. Default: RUN_ONCE
+        lease (LeaseBackend or JobLease): Single-runner mode across replicas - The job only executes while this
+            replica holds its lease (key "job:<id>"), which is renewed while the job runs.
+        lease_ttl (float): Seconds a lease lasts without renewal - Bounds how long a dead holder blocks others
+        metrics_sinks (sequence of MetricsSink): Receive the RunMetrics (scheduling lag, executor queue wait,
+            execution time) of every run
+        clock (Clock): Source of time for the job's schedule, results and scheduling lag. Default: SystemClock
+            Replaced by the scheduler's clock when the job is added to a JobScheduler.
+        priority (int): Only affects sync funcs run by a JobScheduler - When more runs are due than the job's
+            executor has workers, lower values are admitted first (see JobPriority). Default: JobPriority.NORMAL
+            Also orders runs waiting for a job group's concurrency slot.
+        tags (sequence of str): Put the job in the JobScheduler's JobGroups of these names, sharing their
+            concurrency and rate limits. Tags without a registered group have no effect.
     """
 
+    __slots__ = (
+        "func",
+        "func_args",
+        "func_kwargs",
+        "id",
+        "interval",
+        "delay_first_run",
+        "repeat",
+        "stop_on_exception",
+        "log_level",
+        "executor",
+        "overlap",
+        "overlap_limit",
+        "jitter",
+        "cron",
+        "result_history",
+        "timeout",
+        "retry",
+        "circuit_breaker",
+        "depends_on",
+        "catch_up",
+        "lease",
+        "metrics_sinks",
+        "clock",
+        "priority",
+        "tags",
+    )
+
     func: t.Callable | t.Coroutine
     func_args: t.Tuple[t.Any]
     func_kwargs: t.Dict[str, t.Any]
     id: str
-    interval: datetime.timedelta = dataclasses.field(init=False)
-    delay_first_run: bool = False
-    repeat: bool = True
-    stop_on_exception: bool = False
-    log_level: int = logging.INFO
+    interval: datetime.timedelta
+    delay_first_run: bool
+    repeat: bool
+    stop_on_exception: bool
+    log_level: int
+    executor: str
+    overlap: OverlapPolicy
+    overlap_limit: int
+    jitter: float
+    cron: CronExpression | None
+    result_history: int
+    timeout: float | None
+    retry: RetryPolicy | None
+    circuit_breaker: CircuitBreaker | None
+    depends_on: t.Tuple[str, ...]
+    catch_up: CatchUpPolicy
+    lease: JobLease | None
+    metrics_sinks: t.Tuple[MetricsSink, ...]
+    clock: Clock
+    priority: int
+    tags: t.FrozenSet[str]
 
     def __init__(
         self,
         func: t.Callable | t.Coroutine,
         id: str,
-        interval: datetime.timedelta | float | int,
+        interval: datetime.timedelta | float | int | None = None,
         delay_first_run: bool = False,
         repeat: bool = True,
         stop_on_exception: bool = False,
         log_level: int = logging.INFO,
         func_args: t.Tuple | None = None,
         func_kwargs: t.Dict | None = None,
+        executor: str = ExecutorKind.THREAD,
+        overlap: OverlapPolicy = OverlapPolicy.COALESCE,
+        overlap_limit: int = 1,
+        jitter: float = 0.0,
+        cron: CronExpression | str | None = None,
+        timezone: str | None = None,
+        result_history: int = 16,
+        timeout: datetime.timedelta | float | int | None = None,
+        retry: RetryPolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        depends_on: t.Sequence[str] | None = None,
+        catch_up: CatchUpPolicy = CatchUpPolicy.RUN_ONCE,
+        lease: LeaseBackend | JobLease | None = None,
+        lease_ttl: float = 30.0,
+        metrics_sinks: t.Sequence[MetricsSink] | None = None,
+        clock: Clock | None = None,
+        priority: int = JobPriority.NORMAL,
+        tags: t.Iterable[str] | None = None,
     ):
+        if isinstance(cron, str):
+            cron = CronExpression.get(cron, timezone)
+        depends_on = tuple(depends_on or ())
+        if depends_on and cron is not None:
+            raise ValueError(
+                "A job can run on a cron schedule or be triggered by upstream jobs, not both"
+            )
+        if interval is None:
+            if cron is not None:
+                interval = cron.approximate_interval((clock or SYSTEM_CLOCK).now())
+            elif depends_on:
+                interval = 0
+            else:
+                raise ValueError("Either interval, cron or depends_on is required")
         if isinstance(interval, (int, float)):
             interval = datetime.timedelta(seconds=interval)
         self.func = func
@@ -92,9 +426,47 @@ class JobParams:
         self.repeat = repeat
         self.stop_on_exception = stop_on_exception
         self.log_level = log_level
+        self.executor = executor
+        self.overlap = overlap
+        self.overlap_limit = overlap_limit
+        self.jitter = jitter
+        self.cron = cron
+        self.result_history = result_history
+        self.timeout = (
+            timeout.total_seconds() if isinstance(timeout, datetime.timedelta) else timeout
+        )
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker if repeat else None
+        self.depends_on = depends_on
+        self.catch_up = catch_up
+        if isinstance(lease, LeaseBackend):
+            lease = JobLease(lease, key=f"job:{id}", ttl=lease_ttl)
+        self.lease = lease
+        self.metrics_sinks = tuple(metrics_sinks or ())
+        self.clock = SYSTEM_CLOCK if clock is None else clock
+        self.priority = priority
+        self.tags = frozenset(tags or ())
+        if id in self.depends_on:
+            raise ValueError("A job cannot depend on itself")
+        if self.cron is not None:
+            self.delay_first_run = False
+
+        if self.timeout is not None and self.timeout <= 0:
+            raise ValueError("timeout must be positive")
+        if self.overlap_limit < 1:
+            raise ValueError("overlap_limit must be at least 1")
+        if self.jitter < 0 or (
+            self.repeat and self.jitter and self.jitter >= self.interval.total_seconds()
+        ):
+            raise ValueError("jitter must be non-negative and less than the interval")
+
+        if self.executor != ExecutorKind.THREAD and classify_callable(func) != CallableKind.SYNC:
+            raise ValueError(
+                "Coroutine functions run on the event loop - executor only applies to sync functions"
+            )
 
         if self.interval.total_seconds() <= 0:
-            if self.repeat:
+            if self.repeat and not self.depends_on:
                 raise ValueError("Interval cannot be zero for periodic jobs")
             self.delay_first_run = False
 
@@ -107,13 +479,80 @@ class Job:
         params (JobParams): Dataclass of params for encapsulation
     """
 
+    # Slotted to keep tens of thousands of registered jobs compact - Subclasses should declare __slots__ too
+    __slots__ = (
+        "_id",
+        "_status",
+        "_func",
+        "_logger",
+        "_prehooks",
+        "_posthooks",
+        "_timer",
+        "_loop",
+        "_run_task",
+        "_waiter",
+        "_executions_in_flight",
+        "_next_run_time",
+        "_overlap",
+        "_overlap_limit",
+        "_jitter",
+        "_cron",
+        "_results",
+        "_timeout",
+        "_abandoned_runs",
+        "_retry",
+        "_breaker",
+        "_depends_on",
+        "_upstreams",
+        "_upstream_seqs",
+        "_catch_up",
+        "_restored_catchup_runs",
+        "_catchup_tick",
+        "_lease",
+        "_metrics_sinks",
+        "_last_run_metrics",
+        "_clock",
+        "_priority",
+        "_execution_queues",
+        "_tags",
+        "_groups",
+    )
+
     _id: str
     _status: JobStatus
     _func: JobFunc
-    _logger: logging.Logger
+    _logger: _JobLogger
     _prehooks: list[JobFunc]
     _posthooks: list[JobFunc]
-    _timer: JobTimer | None = None
+    _timer: JobTimer | None
+    _loop: LoopType | None
+    _run_task: asyncio.Task | None
+    _waiter: asyncio.Future | None
+    _executions_in_flight: int
+    _next_run_time: datetime.datetime
+    _overlap: OverlapPolicy
+    _overlap_limit: int
+    _jitter: float
+    _cron: CronExpression | None
+    _results: JobResultBuffer
+    _timeout: float | None
+    _abandoned_runs: t.Set[asyncio.Task] | None  # Created on first abandoned run
+    _retry: RetryPolicy | None
+    _breaker: CircuitBreaker | None
+    _depends_on: t.Tuple[str, ...]
+    _upstreams: t.Dict[str, Job]
+    _upstream_seqs: t.Dict[str, int]
+    _catch_up: CatchUpPolicy
+    _restored_catchup_runs: int
+    _catchup_tick: datetime.datetime  # Due time of the next catch-up run
+    _lease: JobLease | None
+    _metrics_sinks: t.List[MetricsSink]
+    _last_run_metrics: RunMetrics | None
+    _clock: Clock
+    _priority: int
+    _execution_queues: ExecutionQueues | None
+    _tags: t.FrozenSet[str]
+    _groups: t.Tuple[JobGroup, ...]
 
     def __init__(
             self,
@@ -123,23 +562,58 @@ class Job:
             timer: JobTimer | None = None
         ) -> None:
         self._id = params.id
+        self._timer = None
+        self._loop = None
+        self._run_task = None
+        self._waiter = None
+        self._executions_in_flight = 0
+        self._next_run_time = NEVER
+        self._restored_catchup_runs = 0
+        self._catchup_tick = NEVER
+        self._last_run_metrics = None
         # self._prehooks = []
         # self._posthooks = []
-        if params.repeat:
-            logger_name = f"job:{params.id}"
-        else:
-            logger_name = f"job:{params.id}"
-        self._logger = get_logger(logger_name)
-        self._logger.setLevel(params.log_level)
+        self._logger = _JobLogger(params.id, params.log_level)
 
-        self._func = JobFunc(func=params.func, func_args=params.func_args, func_kwargs=params.func_kwargs)
+        self._func = JobFunc(
+            func=params.func,
+            func_args=params.func_args,
+            func_kwargs=params.func_kwargs,
+            executor=params.executor,
+        )
+        if params.repeat and self._func.kind == CallableKind.AWAITABLE:
+            raise ValueError(
+                "A coroutine object can only be awaited once - Pass its function for a repeating job"
+            )
+        self._overlap = params.overlap
+        self._overlap_limit = params.overlap_limit
+        self._jitter = params.jitter
+        self._cron = params.cron
+        self._results = JobResultBuffer(maxlen=params.result_history)
+        self._timeout = params.timeout
+        self._abandoned_runs = None
+        self._retry = params.retry
+        self._breaker = params.circuit_breaker
+        self._depends_on = params.depends_on
+        self._upstreams = dict()
+        self._upstream_seqs = dict()
+        self._catch_up = params.catch_up
+        self._lease = params.lease
+        self._metrics_sinks = list(params.metrics_sinks)
+        self._clock = params.clock
+        self._priority = params.priority
+        self._execution_queues = None
+        self._tags = params.tags
+        self._groups = ()
         self._status = JobStatus(
             interval=params.interval,
             delay=params.delay_first_run,
             repeat=params.repeat,
             stop_on_exception=params.stop_on_exception,
             logger=self._logger,
+            clock=self._clock,
         )
+        self._status._circuit_breaker = self._breaker
         # if prehooks:
         #     for prehook in prehooks:
         #         self.add_prehook(prehook)
@@ -150,6 +624,7 @@ class Job:
             if not isinstance(timer, JobTimer):
                 raise TypeError("Expected type for timer param: JobTimer")
             self._timer = timer
+            self._metrics_sinks.append(timer)
 
     # @property
     # def has_prehooks(self):
@@ -168,17 +643,28 @@ class Job:
     #     return len(self._posthooks) - 1
 
     @property
-    def LOG(self) -> logging.Logger:
+    def LOG(self) -> logging.LoggerAdapter:
         return self._logger
 
     @property
     def id(self) -> str:
         return self._id
 
+    @property
+    def task_name(self) -> str:
+        """
+        Name of the job's tasks on the event loop
+        """
+        return f"job:{self._id}"
+
     @property
     def state(self) -> JobState:
         return self._status.state
 
+    @property
+    def status(self) -> JobStatus:
+        return self._status
+
     @property
     def func(self) -> t.Callable | t.Coroutine:
         return self._func.func
@@ -193,51 +679,722 @@ class Job:
         if kwargs is not None:
             return kwargs.copy()
 
+    @property
+    def executor(self) -> str:
+        return self._func.executor
+
     @property
     def interval(self) -> datetime.timedelta:
         return self._status.interval
 
+    def set_interval(self, interval: datetime.timedelta | float | int):
+        """
+        Change the time between runs, in place - A run in progress is left to finish, and the next run is moved
+        to one new interval after the previous one. If that has already passed, the run is due now and is handled
+        by the job's OverlapPolicy like any other missed run. Safe to call from any thread.
+
+        raises: `ValueError` if the job runs on a cron schedule, or the interval is invalid for the job
+        """
+        if isinstance(interval, (int, float)):
+            interval = datetime.timedelta(seconds=interval)
+        if self._cron is not None:
+            raise ValueError("Cron jobs run on their cron schedule - Their interval can't be set")
+        if self.periodic and not self._depends_on and interval.total_seconds() <= 0:
+            raise ValueError("Interval cannot be zero for periodic jobs")
+        if self.periodic and self._jitter and self._jitter >= interval.total_seconds():
+            raise ValueError("jitter must be less than the interval")
+
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            # Not started yet - Its first run is scheduled from the status' interval
+            self._status.set_interval(interval)
+            return
+        try:
+            call_on_loop_thread(loop, self._apply_interval, interval)
+        except RuntimeError:
+            # Loop closed between the check and the call
+            self._status.set_interval(interval)
+
+    def _apply_interval(self, interval: datetime.timedelta):
+        # On the loop thread, which owns _next_run_time
+        previous = self._status.interval
+        self._status.set_interval(interval)
+        if previous == interval or self._next_run_time >= NEVER:
+            return
+        self.LOG.info("Interval changed from %s to %s", previous, interval)
+        self._next_run_time = max(self._next_run_time - previous + interval, self._clock.now())
+        # A run loop sleeping until the old next run time re-evaluates
+        self._set_waiter()
+
+    @property
+    def cron(self) -> CronExpression | None:
+        return self._cron
+
     @property
     def periodic(self) -> bool:
         return self._status.periodic
 
+    @property
+    def timeout(self) -> float | None:
+        return self._timeout
+
+    @property
+    def depends_on(self) -> t.Tuple[str, ...]:
+        return self._depends_on
+
+    @property
+    def lease(self) -> JobLease | None:
+        return self._lease
+
+    @property
+    def last_run_metrics(self) -> RunMetrics | None:
+        return self._last_run_metrics
+
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+
+    def set_clock(self, clock: Clock):
+        """
+        Switch the job (and its status) to another source of time, before it's first run.
+        Called by JobScheduler.add_job()
+        """
+        self._clock = clock
+        self._status._clock = clock
+        if self._breaker is not None:
+            self._breaker.set_clock(clock)
+
+    @property
+    def priority(self) -> int:
+        return self._priority
+
+    def set_execution_queues(self, queues: ExecutionQueues | None):
+        """
+        Admit the job's sync runs to its executor via a priority-ordered ExecutionQueue from queues.
+        Called by JobScheduler.add_job()
+        """
+        self._execution_queues = queues
+
+    @property
+    def tags(self) -> t.FrozenSet[str]:
+        return self._tags
+
+    @property
+    def groups(self) -> t.Tuple[JobGroup, ...]:
+        return self._groups
+
+    def set_groups(self, groups: t.Iterable[JobGroup]):
+        """
+        Subject the job's runs to these groups' limits. Called by JobScheduler for the groups matching the job's tags
+        """
+        # Always acquired in name order, so that jobs sharing several groups can't deadlock
+        self._groups = tuple(sorted(groups, key=lambda group: group.name))
+
+    def add_metrics_sink(self, sink: MetricsSink):
+        if sink not in self._metrics_sinks:
+            self._metrics_sinks.append(sink)
+
+    def _record_metrics(self, metrics: RunMetrics):
+        self._last_run_metrics = metrics
+        for sink in self._metrics_sinks:
+            try:
+                sink.record(metrics)
+            except Exception as ex:
+                self.LOG.error("Metrics sink raised: '%s' - %s", type(ex).__name__, ex)
+
+    def restore_checkpoint(
+        self, checkpoint: JobCheckpoint, now: datetime.datetime | None = None
+    ) -> int:
+        """
+        Resume from a checkpoint saved by a previous process, before the job is first run: The job keeps to its
+        saved schedule, and its CatchUpPolicy decides how many runs to make for ticks missed in the meantime.
+
+        Returns the number of catch-up runs that the job will make when started.
+        """
+        now = self._clock.now() if now is None else now
+        if checkpoint.executions < 1 or checkpoint.run_time_next >= NEVER:
+            return 0
+
+        self._next_run_time = checkpoint.run_time_next
+        self._catchup_tick = checkpoint.run_time_next
+        missed = self._catch_up_ticks(now)
+        if self._catch_up == CatchUpPolicy.RUN_ALL:
+            runs = missed
+        elif self._catch_up == CatchUpPolicy.RUN_ONCE:
+            runs = min(missed, 1)
+        else:
+            runs = 0
+
+        self._status.restore_checkpoint(
+            dataclasses.replace(checkpoint, run_time_next=self._next_run_time)
+        )
+        if missed > runs:
+            self._status.record_skipped(missed - runs)
+        self._restored_catchup_runs = runs
+        if missed:
+            self.LOG.info(
+                "Restored from checkpoint - Missed %s run(s), catching up with %s", missed, runs
+            )
+        return runs
+
+    def link_upstreams(self, upstreams: t.Iterable[Job]):
+        """
+        Resolve depends_on to the upstream Job objects. Runs are triggered by upstream results completed
+        after this call. Called by JobScheduler.add_job()
+        """
+        upstreams_by_id = {upstream.id: upstream for upstream in upstreams}
+        missing = set(self._depends_on) - set(upstreams_by_id)
+        if missing:
+            raise KeyError(f"Upstream job(s) of '{self.id}' not registered: {sorted(missing)}")
+        self._upstreams = {
+            upstream_id: upstreams_by_id[upstream_id] for upstream_id in self._depends_on
+        }
+        self._upstream_seqs = {
+            upstream_id: job._results.last_seq for upstream_id, job in self._upstreams.items()
+        }
+
+    @property
+    def stuck_runs(self) -> int:
+        """
+        Timed-out runs of a sync func that are still occupying an executor worker
+        """
+        return len(self._abandoned_runs or ())
+
+    @property
+    def run_task(self) -> asyncio.Task | None:
+        """
+        The task running the job's run loop (on the job's event loop), while it runs
+        """
+        return self._run_task
+
+    @property
+    def is_executing(self) -> bool:
+        """
+        True while the job func is executing (as opposed to waiting for its next run)
+        """
+        return self._executions_in_flight > 0
+
+    @property
+    def results(self) -> list[JobResult]:
+        """
+        The job's most recent results, oldest first
+        """
+        return self._results.snapshot()
+
+    @property
+    def last_result(self) -> JobResult | None:
+        return self._results.latest()
+
+    def next_result(self) -> concurrent.futures.Future[JobResult | None]:
+        """
+        Future resolving with the result of the next execution to finish, or with None if the job stops first.
+        For use from any thread, e.g. `job.next_result().result(timeout=5)`
+        """
+        return self._results.next_result()
+
+    async def wait_for_result(self, timeout: float | None = None) -> JobResult | None:
+        """
+        Await the result of the next execution to finish (None if the job stops first), from any event loop.
+        Raises TimeoutError if timeout (seconds) elapses first.
+        """
+        return await asyncio.wait_for(asyncio.wrap_future(self._results.next_result()), timeout)
+
+    def stream_results(self, from_seq: int | None = None) -> t.AsyncIterator[JobResult]:
+        """
+        Async iterator of results as executions finish, from any event loop. Ends when the job stops.
+        Results are kept in a bounded buffer, so a consumer that falls too far behind misses the oldest.
+
+        Parameters:
+            from_seq (int): Start after this JobResult.seq - e.g. 0 for every result still buffered.
+                Default: Only results of executions yet to finish
+        """
+        return self._results.stream(from_seq)
+
+    def add_state_listener(self, callback: t.Callable[[Job, JobState], None]):
+        """
+        Register a callback to be invoked as callback(job, new_state) whenever this job's state changes.
+        """
+        self._status.add_state_listener(functools.partial(callback, self))
+
     def resume(self, reason: str | None = None):
         if self._status._current_state == JobState.ACTIVE:
             return
         self.LOG.info("Resuming" if not reason else f"Resuming due to: '{reason}'")
         self._status.start()
+        self._wake()
 
     def pause(self, reason: str | None = None):
         if self._status._current_state == JobState.SUSPENDED:
             return
         self.LOG.info("Pausing" if not reason else f"Pausing due to: '{reason}'")
         self._status.pause()
+        self._wake()
 
     def stop(self, reason: str | None = None):
         if self._status._current_state == JobState.FINISHED:
             return
         self.LOG.info("Stopping" if not reason else f"Stopping due to: '{reason}'")
         self._status.stop()
+        self._results.close()
+        self._wake()
+
+    def _wake(self):
+        """
+        Signal a parked or sleeping run loop to re-evaluate its state. Safe to call from any thread.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            call_on_loop_thread(loop, self._set_waiter)
+        except RuntimeError:
+            # Loop closed between the check and the call
+            pass
+
+    def _set_waiter(self):
+        waiter = self._waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(True)
+
+    async def _wait_for_wake(self, timeout: float | None = None) -> bool:
+        """
+        Park the run loop until woken by resume()/pause()/stop() or until timeout (seconds) elapses.
+        Costs no loop cycles while parked.
+
+        Returns True if woken early, False if the timeout elapsed.
+        """
+        loop = t.cast(LoopType, self._loop)
+        waiter = loop.create_future()
+        self._waiter = waiter
+        timeout_handle = None
+        if timeout is not None:
+            timeout_handle = loop.call_later(timeout, _resolve_future, waiter, False)
+        try:
+            return await waiter
+        finally:
+            if timeout_handle is not None:
+                timeout_handle.cancel()
+            if self._waiter is waiter:
+                self._waiter = None
+
+    def _following_tick(self, tick: datetime.datetime) -> datetime.datetime:
+        if self._cron is not None:
+            return self._cron.next_fire(tick)
+        return tick + self.interval
+
+    def _due_ns(self, due: datetime.datetime) -> int:
+        """
+        Convert a (past) due time into the job clock's perf_counter_ns() - For measuring scheduling lag
+        """
+        clock = self._clock
+        return clock.perf_counter_ns() - int((clock.now() - due).total_seconds() * 1_000_000_000)
+
+    def _catch_up_ticks(self, now: datetime.datetime) -> int:
+        """
+        Advance the schedule past now, returning the number of scheduled ticks that had come due without
+        being waited for (i.e. they came due while the job was executing, suspended or the loop was blocked)
+        """
+        if now < self._next_run_time:
+            return 0
+
+        if self._cron is None:
+            missed = 1 + int((now - self._next_run_time) / self.interval)
+            self._next_run_time += self.interval * missed
+            return missed
+
+        missed = 0
+        while self._next_run_time <= now:
+            missed += 1
+            if missed >= _CRON_MAX_CATCHUP_COUNT:
+                self._next_run_time = self._cron.next_fire(now)
+                break
+            self._next_run_time = self._cron.next_fire(self._next_run_time)
+        return missed
+
+    def _apply_overlap_policy(self, missed: int) -> int:
+        """
+        Decide what to do with missed ticks according to the job's OverlapPolicy.
+        Returns the number of runs to execute immediately.
+        """
+        status = self._status
+        policy = self._overlap
+
+        if policy == OverlapPolicy.SKIP:
+            self.LOG.warning("Job '%s' skipping %s missed run(s)", self.id, missed)
+            status.record_skipped(missed)
+            return 0
+
+        if policy == OverlapPolicy.QUEUE:
+            runs = min(missed, self._overlap_limit)
+            if missed > runs:
+                status.record_skipped(missed - runs)
+            self.LOG.warning(
+                "Job '%s' missed %s run(s) - Queueing %s catch-up run(s)", self.id, missed, runs
+            )
+            return runs
+
+        # COALESCE / CONCURRENT: Fold all missed ticks into a single catch-up run
+        if missed > 1:
+            status.record_coalesced(missed - 1)
+        self.LOG.warning("Job '%s' missed %s run(s) - Executing immediately.", self.id, missed)
+        return 1
+
+    async def _run_func(
+        self,
+        loop: LoopType,
+        upstream_results: t.Dict[str, JobResult] | None = None,
+        timing: RunTiming | None = None,
+        held_groups: t.Sequence[JobGroup] = (),
+    ) -> t.Any:
+        """
+        Run the job func once, enforcing the job's timeout - From when a sync run is admitted to its executor.
+        held_groups and the run's admission are released once the func has finished - For a timed-out sync run,
+        only once its worker has.
+        """
+        queue = None
+        if self._execution_queues is not None and self._func.kind == CallableKind.SYNC:
+            queue = self._execution_queues.get(self._func.executor, loop)
+        admitted = False
+        abandoned = False
+        try:
+            if queue is not None:
+                # Admitted in priority order rather than queued FIFO by the executor - Time waiting counts as queue
+                # wait, but not towards the timeout
+                waited_from_ns = time.perf_counter_ns()
+                await queue.acquire(self._priority)
+                admitted = True
+                if timing is not None:
+                    timing.queue_wait_ns += time.perf_counter_ns() - waited_from_ns
+            cancel_token = CancellationToken()
+            run_start = None
+            if (
+                self._timeout is not None
+                and self._func.kind == CallableKind.SYNC
+                and not is_process_executor(self._func.executor)
+            ):
+                run_start = _RunStart()
+            run = self._func.run(
+                loop,
+                self.id,
+                cancel_token=cancel_token,
+                upstream_results=upstream_results,
+                timing=timing,
+                run_start=run_start,
+            )
+            if self._timeout is None:
+                return await run
+
+            run_task = loop.create_task(run, name=self.task_name)
+            try:
+                done, _ = await asyncio.wait({run_task}, timeout=self._timeout)
+            except asyncio.CancelledError:
+                run_task.cancel()
+                raise
+            if done:
+                return run_task.result()
+
+            cancel_token.cancel(f"Exceeded timeout of {self._timeout}s")
+            if self._func.kind != CallableKind.SYNC or (
+                run_start is not None and run_start.withdraw()
+            ):
+                # Either interruptible, or still waiting for a worker - So the func never runs
+                run_task.cancel()
+                await asyncio.wait({run_task})
+            else:
+                # A worker thread/process can't be interrupted - Leave the run to finish in the background.
+                # Whether a process pool has started the func can't be told, so it's assumed to have.
+                self._abandon_run(run_task, held_groups, queue if admitted else None)
+                abandoned = True
+            raise JobTimeoutException(self.id, self._timeout)
+        finally:
+            if not abandoned:
+                if admitted:
+                    queue.release()
+                if held_groups:
+                    release_groups(held_groups)
+
+    async def _run_attempt(
+        self,
+        loop: LoopType,
+        upstream_results: t.Dict[str, JobResult] | None = None,
+        timing: RunTiming | None = None,
+    ) -> t.Any:
+        """
+        Run the job func once, after waiting on its groups' limits - Waiting doesn't count towards the timeout.
+        """
+        groups = self._groups
+        if not groups:
+            return await self._run_func(loop, upstream_results, timing)
+        throttle_ns = await acquire_groups(groups, self._priority)
+        if timing is not None:
+            timing.throttle_ns += throttle_ns
+        # Released by _run_func - Not before a timed-out sync run's worker is free, so the limits hold
+        return await self._run_func(loop, upstream_results, timing, held_groups=groups)
+
+    async def _run_with_retries(
+        self,
+        loop: LoopType,
+        upstream_results: t.Dict[str, JobResult] | None = None,
+        timing: RunTiming | None = None,
+    ) -> t.Any:
+        attempt = 1
+        while True:
+            try:
+                return await self._run_attempt(loop, upstream_results, timing)
+            except Exception as ex:
+                retry = self._retry
+                if retry is None or not retry.should_retry(attempt, ex):
+                    raise
+                # A half-open probe gets a single attempt, and a stopped job gets no more
+                if self._breaker is not None and self._breaker.state != CircuitState.CLOSED:
+                    raise
+                if not self._status.should_continue:
+                    raise
+                delay = retry.delay(attempt)
+                self.LOG.warning(
+                    "Attempt %s/%s raised: '%s' - Retrying in %.2fs",
+                    attempt,
+                    retry.max_attempts,
+                    type(ex).__name__,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+                self._status.record_retry()
+
+    def _abandon_run(
+        self,
+        run_task: asyncio.Task,
+        held_groups: t.Sequence[JobGroup] = (),
+        admitted_to: ExecutionQueue | None = None,
+    ):
+        if self._abandoned_runs is None:
+            self._abandoned_runs = set()
+        self._abandoned_runs.add(run_task)
+        track_stuck_worker(1)
+        run_task.add_done_callback(
+            functools.partial(self._on_abandoned_run_done, held_groups, admitted_to)
+        )
+
+    def _on_abandoned_run_done(
+        self,
+        held_groups: t.Sequence[JobGroup],
+        admitted_to: ExecutionQueue | None,
+        run_task: asyncio.Task,
+    ):
+        if self._abandoned_runs is not None:
+            self._abandoned_runs.discard(run_task)
+        track_stuck_worker(-1)
+        # The worker is free at last - So is the run's place in its executor and groups
+        if admitted_to is not None:
+            admitted_to.release()
+        if held_groups:
+            release_groups(held_groups)
+        if not run_task.cancelled() and run_task.exception() is not None:
+            self.LOG.debug("Abandoned run raised: '%s'", type(run_task.exception()).__name__)
+
+    async def _execute(
+        self,
+        loop: LoopType,
+        error_queue: ErrorPipeline | None = None,
+        upstream_results: t.Dict[str, JobResult] | None = None,
+        scheduled_ns: int | None = None,
+    ):
+        """
+        Execute one run of the job.
+
+        scheduled_ns: When the run was due, as the job clock's perf_counter_ns() - For measuring scheduling lag
+        """
+        clock = self._clock
+        started_ns = clock.perf_counter_ns()
+        status = self._status
+        breaker = self._breaker
+        if self._lease is not None and not self._lease.held:
+            self.LOG.debug("Lease '%s' held by another replica - Skipping run", self._lease.key)
+            status.record_standby()
+            if not status.periodic:
+                self._next_run_time = NEVER
+                self.stop("One-off job runs on the lease holder")
+            return
+        if breaker is not None and not breaker.allow_run():
+            self.LOG.debug(
+                "Circuit open - Skipping run (probe in %.1fs)", breaker.seconds_until_probe
+            )
+            status.record_rejected()
+            return
+        probe = breaker is not None and breaker.state == CircuitState.HALF_OPEN
+
+        any_exc = False
+        timed_out = False
+        cancelled = False
+        timing = RunTiming()
+        started_at = clock.now()
+        self._executions_in_flight += 1
+        try:
+            if self._timer:
+                self._timer.start()
+
+            # for prehook in self._prehooks:
+            #     await prehook.run(loop, id)
+
+            value = await self._run_with_retries(loop, upstream_results, timing)
+
+            # for posthook in self._posthooks:
+            #     await posthook.run(loop, id)
+
+            self._results.append(
+                self.id, started_at=started_at, finished_at=clock.now(), value=value
+            )
+            if breaker is not None:
+                breaker.record_success()
+
+        except Exception as ex:
+            # self.LOG.error("Exception in Job '%s': '%s'", id, type(ex).__name__)
+            any_exc = True
+            timed_out = isinstance(ex, JobTimeoutException)
+            if breaker is not None:
+                breaker.record_failure()
+                if breaker.state == CircuitState.OPEN:
+                    self.LOG.warning(
+                        "Circuit opened after %s consecutive failure(s)",
+                        breaker.consecutive_failures,
+                    )
+            self._results.append(
+                self.id, started_at=started_at, finished_at=clock.now(), exception=ex
+            )
+            if error_queue:
+                error_queue.put(JobExceptionStruct(job=self, exception=ex))
+            if status.stop_on_exception:
+                self._next_run_time = NEVER
+                self.stop()
 
-    async def run(self, loop: LoopType, error_queue: queue.Queue | None = None):
+        except asyncio.CancelledError:
+            cancelled = True
+            raise
+
+        finally:
+            self._executions_in_flight -= 1
+            if probe and breaker.state == CircuitState.HALF_OPEN:
+                # Probe was cancelled before it could report an outcome
+                breaker.release_probe()
+
+            if not status.periodic:
+                self._next_run_time = NEVER
+                self.stop()
+
+            status.record_run(
+                current_run_time=clock.now(),
+                next_run_time=self._next_run_time,
+                any_exceptions=any_exc,
+                timed_out=timed_out,
+            )
+            if not cancelled:
+                self._record_metrics(
+                    RunMetrics(
+                        job_id=self.id,
+                        scheduling_lag_ns=0 if scheduled_ns is None else started_ns - scheduled_ns,
+                        queue_wait_ns=timing.queue_wait_ns,
+                        execution_ns=timing.execution_ns,
+                        total_ns=clock.perf_counter_ns() - started_ns,
+                        ok=not any_exc,
+                        timed_out=timed_out,
+                        priority=self._priority,
+                        throttle_ns=timing.throttle_ns,
+                    )
+                )
+
+    def _start_concurrent_execution(
+        self,
+        loop: LoopType,
+        error_queue: ErrorPipeline | None,
+        tasks: t.Set[asyncio.Task],
+        scheduled_ns: int | None = None,
+    ):
+        if len(tasks) >= self._overlap_limit:
+            self.LOG.warning(
+                "Job '%s' already has %s instance(s) running - Skipping run", self.id, len(tasks)
+            )
+            self._status.record_skipped(1)
+            return
+        task = loop.create_task(
+            self._execute(loop, error_queue, scheduled_ns=scheduled_ns), name=self.task_name
+        )
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def run(self, loop: LoopType, error_queue: ErrorPipeline | None = None):
         """
-        An async job that runs indefinitely on a fixed time interval.
+        An async job that runs indefinitely on a fixed time interval (or cron schedule, or upstream trigger).
         This function will be scheduled to run on the background event loop.
         """
-        id = self.id
+        self._loop = loop
+        current_task = asyncio.current_task()
+        if current_task is not None:
+            # Identifies the job to the loop watchdog (and in asyncio debug output)
+            current_task.set_name(self.task_name)
+        lease_task = None
+        if self._lease is not None:
+            # Settle the lease before the first run, so that a holder doesn't skip it
+            await asyncio.to_thread(self._lease.refresh)
+            lease_task = loop.create_task(self._keep_lease(self._lease))
+        self._run_task = current_task
+        try:
+            if self._depends_on:
+                await self._run_triggered(loop, error_queue)
+            else:
+                await self._run_scheduled(loop, error_queue)
+        finally:
+            if self._run_task is current_task:
+                self._run_task = None
+            if lease_task is not None:
+                lease_task.cancel()
+                try:
+                    # Wait for the keeper to unwind before releasing the lease
+                    await lease_task
+                except asyncio.CancelledError:
+                    pass
+                if not self._status.should_continue:
+                    # Stopped for good (rather than e.g. moved to another loop) -> Let another replica take over
+                    await asyncio.to_thread(self._lease.release)
+
+    async def _keep_lease(self, lease: JobLease):
+        while True:
+            await asyncio.sleep(lease.renew_interval)
+            await asyncio.to_thread(lease.refresh)
+
+    async def _run_scheduled(self, loop: LoopType, error_queue: ErrorPipeline | None = None):
         interval = self.interval
         status = self._status
-        is_periodic_job = status.periodic
         delay_first_run = status.delay_first_run
+        concurrent = self._overlap == OverlapPolicy.CONCURRENT
+        concurrent_tasks: t.Set[asyncio.Task] = set()
+        catchup_runs = 0
+        clock = self._clock
 
         # Initial run timing
-        now_outer = utcnow()
-        next_run_time = now_outer + self.interval
-        next_monotonic_time = time.monotonic() + interval.total_seconds()
+        now_outer = clock.now()
+        run_immediately = not delay_first_run
+        first_due = now_outer
+        self._next_run_time = now_outer + interval
+        if status.has_run and status.run_time_next < NEVER:
+            # Job was restarted (e.g. moved to another loop, or restored from a checkpoint) -> Keep to its schedule
+            self._next_run_time = status.run_time_next
+            run_immediately = False
+            catchup_runs, self._restored_catchup_runs = self._restored_catchup_runs, 0
+        elif self._cron is not None:
+            # Run now if we were dispatched for a fire time that has (only just) arrived
+            first_fire = self._cron.next_fire(now_outer - _CRON_START_TOLERANCE)
+            run_immediately = first_fire <= now_outer
+            first_due = first_fire
+            self._next_run_time = (
+                self._cron.next_fire(first_fire) if run_immediately else first_fire
+            )
 
-        # self.LOG.debug("Initial :: Now: '%s' - Next: '%s' - Next monotonic: '%s'", now_outer, next_run_time, next_monotonic_time)
+        # self.LOG.debug("Initial :: Now: '%s' - Next: '%s'", now_outer, self._next_run_time)
 
-        if self.periodic:
+        if self._cron is not None:
+            self.LOG.debug("Cron Job Started - Schedule: '%s'.", self._cron.expression)
+        elif self.periodic:
             self.LOG.debug("Periodic Job Started - Running every %s seconds.", interval)
         else:
             if delay_first_run:
@@ -245,75 +1402,143 @@ class Job:
             else:
                 self.LOG.debug("One-off Job Started - Running once.")
 
+        try:
+            while status.should_continue:
+                if status.state == JobState.SUSPENDED:
+                    # Park until resume() or stop() is called
+                    await self._wait_for_wake()
+                    continue
+
+                status.start()
+
+                if run_immediately:
+                    # First run with first-time delay disabled
+                    run_immediately = False
+                    scheduled_ns = self._due_ns(first_due)
+
+                elif catchup_runs > 0:
+                    # Lag is measured from the missed tick that this run makes up for
+                    catchup_runs -= 1
+                    scheduled_ns = self._due_ns(self._catchup_tick)
+                    self._catchup_tick = self._following_tick(self._catchup_tick)
+
+                else:
+                    now = clock.now()
+                    self._catchup_tick = self._next_run_time
+                    missed = self._catch_up_ticks(now)
+                    if missed > 0:
+                        # Ticks came due while we weren't waiting for them -> Overlap policy decides what to run
+                        catchup_runs = self._apply_overlap_policy(missed)
+                        continue
+
+                    # Wait until it's time to run the job again
+                    wait_time = (self._next_run_time - now).total_seconds()
+                    if self._jitter > 0 and status.periodic:
+                        wait_time += random_delay(self._jitter)
+                    # self.LOG.debug("Loop:: Waiting: '%s'", wait_time)
+                    scheduled_ns = clock.perf_counter_ns() + int(max(wait_time, 0) * 1_000_000_000)
+                    if await self._wait_for_wake(wait_time):
+                        # Woken early by a state change -> Re-evaluate before executing
+                        continue
+                    self._next_run_time = self._following_tick(self._next_run_time)
+
+                if concurrent and status.periodic:
+                    self._start_concurrent_execution(
+                        loop, error_queue, concurrent_tasks, scheduled_ns
+                    )
+                else:
+                    await self._execute(loop, error_queue, scheduled_ns=scheduled_ns)
+
+                if not status.periodic:
+                    break
+
+            if concurrent_tasks:
+                await asyncio.gather(*concurrent_tasks, return_exceptions=True)
+
+        finally:
+            for task in concurrent_tasks:
+                task.cancel()
+
+    async def _wait_for_upstreams(self) -> t.Dict[str, JobResult] | None:
+        """
+        Wait until every upstream job has completed a run since this job last ran.
+
+        Returns the latest result of each upstream, an empty dict if an upstream has finished for good,
+        or None if woken early by resume()/pause()/stop().
+        """
+        loop = t.cast(LoopType, self._loop)
+        upstream_waits = [
+            asyncio.wrap_future(
+                upstream._results.wait_after(self._upstream_seqs[upstream_id]), loop=loop
+            )
+            for upstream_id, upstream in self._upstreams.items()
+        ]
+        all_upstreams = asyncio.gather(*upstream_waits)
+        waiter = loop.create_future()
+        self._waiter = waiter
+        try:
+            await asyncio.wait({all_upstreams, waiter}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if self._waiter is waiter:
+                self._waiter = None
+            if not all_upstreams.done():
+                all_upstreams.cancel()
+
+        if all_upstreams.cancelled():
+            return None
+        latest: t.Dict[str, JobResult] = dict()
+        for upstream_id, results in zip(self._upstreams, all_upstreams.result()):
+            if not results:
+                return dict()
+            latest[upstream_id] = results[-1]
+        self._upstream_seqs.update(
+            {upstream_id: result.seq for upstream_id, result in latest.items()}
+        )
+        return latest
+
+    async def _run_triggered(self, loop: LoopType, error_queue: ErrorPipeline | None = None):
+        """
+        Run loop for a job with upstream dependencies: Runs each time all of its upstreams have completed.
+        Jobs waiting on the same upstream are each woken by its result, so independent branches run concurrently.
+        """
+        status = self._status
+        self.LOG.debug("Dependent Job Started - Triggered by: '%s'.", "', '".join(self._depends_on))
+
         while status.should_continue:
             if status.state == JobState.SUSPENDED:
-                # self.LOG.debug("Skipping execution for paused job")
-                await asyncio.sleep(1)
+                await self._wait_for_wake()
                 continue
 
             status.start()
 
-            if status.execution_count <= 0 and delay_first_run == False:
-                # We haven't run before, and first-time delay is disabled -> Run immediately
-                wait_time = 0
-            else:
-                # Calculate time to wait before running from now until next_monotonic_time
-                wait_time = next_monotonic_time - time.monotonic()
-
-            if wait_time <= 0:
-                if status.execution_count >= 1:
-                    # If this isn't the first run, then we're here because job run is late
-                    self.LOG.warning("Job '%s' missed run time '%s' - Executing immediately.", id, next_run_time.time())
-                # else:
-                #     # First run with no delay
-                #     self.LOG.debug("Loop:: '%s' NOT Waiting before execution", id)
-            else:
-                # Wait until it's time to run the job again
-                # self.LOG.debug("Loop:: Waiting: '%s'", wait_time)
-                await asyncio.sleep(wait_time)
-
-            # TODO: Return results?
-            any_exc = False
-            try:
-                if self._timer:
-                    self._timer.start()
-
-                # for prehook in self._prehooks:
-                #     await prehook.run(loop, id)
-
-                await self._func.run(loop, id)
+            upstream_results = await self._wait_for_upstreams()
+            scheduled_ns = self._clock.perf_counter_ns()
+            if upstream_results is None:
+                # Woken early by a state change -> Re-evaluate
+                continue
+            if not upstream_results:
+                self.stop("Upstream job finished")
+                break
 
-                # for posthook in self._posthooks:
-                #     await posthook.run(loop, id)
+            failed = [
+                upstream_id for upstream_id, result in upstream_results.items() if not result.ok
+            ]
+            if failed:
+                self.LOG.warning("Skipping run - Upstream job(s) failed: '%s'", "', '".join(failed))
+                status.record_skipped(1)
+                continue
 
-                if self._timer:
-                    self._timer.stop()
+            await self._execute(
+                loop, error_queue, upstream_results=upstream_results, scheduled_ns=scheduled_ns
+            )
 
-            except Exception as ex:
-                # self.LOG.error("Exception in Job '%s': '%s'", id, type(ex).__name__)
-                any_exc = True
-                if error_queue:
-                    error_queue.put(JobExceptionStruct(job=self, exception=ex))
-                if status.stop_on_exception:
-                    next_run_time = NEVER
-                    self.stop()
-
-            finally:
-
-                now_inner = utcnow()
-                if is_periodic_job:
-                    while next_run_time <= now_inner:
-                        next_run_time += interval
-                    monotonic_delta = (next_run_time - now_inner).total_seconds()
-                    next_monotonic_time = time.monotonic() + monotonic_delta
-                else:
-                    next_run_time = NEVER
-                    self.stop()
+            if not status.periodic:
+                break
 
-                status.record_run(current_run_time=now_inner, next_run_time=next_run_time, any_exceptions=any_exc)
 
-                if not is_periodic_job:
-                    break
+def _resolve_future(future: asyncio.Future, result: t.Any):
+    if not future.done():
+        future.set_result(result)
 
 
 class PeriodicJob(Job):
@@ -321,6 +1546,8 @@ class PeriodicJob(Job):
     A periodic job that executes repeatedly on its interval
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         params: JobParams,
@@ -338,6 +1565,8 @@ class OneOffJob(Job):
     A one-off job that executes after a delay (using its interval as delay) and does not repeat
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         params: JobParams,
@@ -350,7 +1579,7 @@ class OneOffJob(Job):
         super().__init__(params=params, timer=timer)
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class JobExceptionStruct:
-    job: Job
+    job: Job | TaskRecord
     exception: BaseException
@@ -0,0 +1,236 @@
+from __future__ import annotations
+import os
+import pathlib
+import socket
+import threading
+import time
+import typing as t
+import uuid
+from abc import ABC
+from abc import abstractmethod
+
+from kvcommon.datastore import VersionedDatastore
+from kvcommon.logger import get_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Not available on Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+LOG = get_logger("kvc_lease")
+
+_process_holder_id: str | None = None
+
+
+def default_holder_id() -> str:
+    """
+    Identity of this process as a lease holder: Unique across hosts, processes and restarts
+    """
+    global _process_holder_id
+    if _process_holder_id is None:
+        _process_holder_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+    return _process_holder_id
+
+
+class LeaseBackend(ABC):
+    """
+    Mutual exclusion between replicas: At most one holder may hold the lease on a key at a time.
+
+    Implementations must make acquire() atomic with respect to other replicas - e.g. a Kubernetes Lease
+    backend would create/update the Lease object with its resourceVersion as a compare-and-set.
+    """
+
+    @abstractmethod
+    def acquire(self, key: str, holder: str, ttl: float) -> bool:
+        """
+        Acquire the lease on key for holder, or renew it if holder already holds it.
+        The lease lapses unless renewed within ttl seconds.
+
+        Returns True if holder now holds the lease.
+        """
+        raise NotImplementedError()
+
+    @abstractmethod
+    def release(self, key: str, holder: str) -> None:
+        """
+        Give up the lease on key, if held by holder
+        """
+        raise NotImplementedError()
+
+
+class FileLockLeaseBackend(LeaseBackend):
+    """
+    Leases as exclusive flock()s on files in a shared directory - For replicas on one host (or a filesystem
+    with working flock). A lock is held for as long as this process keeps it, and the OS releases it if the
+    process dies, so ttl has no effect.
+
+    Parameters:
+        directory (str or pathlib.Path): Directory for the lock files
+    """
+
+    _directory: pathlib.Path
+    _files: t.Dict[str, t.IO]
+    _lock: threading.Lock
+
+    def __init__(self, directory: str | pathlib.Path) -> None:
+        if fcntl is None:
+            raise NotImplementedError(
+                "FileLockLeaseBackend requires fcntl (unavailable on this platform)"
+            )
+        self._directory = pathlib.Path(directory).expanduser()
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._files = dict()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> pathlib.Path:
+        safe_key = "".join(char if char.isalnum() or char in "-_." else "_" for char in key)
+        return self._directory / f"{safe_key}.lease"
+
+    def acquire(self, key: str, holder: str, ttl: float) -> bool:
+        with self._lock:
+            if key in self._files:
+                return True
+            lock_file = open(self._path(key), "a+")
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                lock_file.close()
+                return False
+            lock_file.seek(0)
+            lock_file.truncate()
+            lock_file.write(holder)
+            lock_file.flush()
+            self._files[key] = lock_file
+            return True
+
+    def release(self, key: str, holder: str) -> None:
+        with self._lock:
+            lock_file = self._files.pop(key, None)
+        if lock_file is not None:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+            lock_file.close()
+
+
+class DatastoreLeaseBackend(LeaseBackend):
+    """
+    Leases as {holder, expiry} records in a VersionedDatastore, using wall-clock expiry times.
+    Acquisition is a read-modify-write, so it's only atomic where the datastore is shared within a process
+    (e.g. an InMemoryDatastore in tests) - Replicas need a backend with compare-and-set.
+
+    Parameters:
+        datastore (VersionedDatastore): Where lease records are kept
+        key (str): Datastore key holding the dict of lease key -> record
+    """
+
+    _datastore: VersionedDatastore
+    _key: str = "job_leases"
+    _lock: threading.Lock
+
+    def __init__(self, datastore: VersionedDatastore, key: str = "job_leases") -> None:
+        self._datastore = datastore
+        self._key = key
+        self._lock = threading.Lock()
+
+    def _records(self) -> t.Dict[str, t.Dict[str, t.Any]]:
+        return dict(self._datastore.get_value(self._key, default=None) or {})
+
+    def holder_of(self, key: str) -> str | None:
+        record = self._records().get(key, None)
+        if record is None or record["expires_at"] <= time.time():
+            return None
+        return record["holder"]
+
+    def acquire(self, key: str, holder: str, ttl: float) -> bool:
+        with self._lock:
+            records = self._records()
+            now = time.time()
+            record = records.get(key, None)
+            if record is not None and record["holder"] != holder and record["expires_at"] > now:
+                return False
+            records[key] = dict(holder=holder, expires_at=now + ttl)
+            self._datastore.set_value(self._key, records)
+            return True
+
+    def release(self, key: str, holder: str) -> None:
+        with self._lock:
+            records = self._records()
+            record = records.get(key, None)
+            if record is not None and record["holder"] == holder:
+                del records[key]
+                self._datastore.set_value(self._key, records)
+
+
+class JobLease:
+    """
+    A job's lease on the right to run it: Only the replica holding the lease executes the job.
+
+    Parameters:
+        backend (LeaseBackend): Where the lease is held
+        key (str): Lease key - Defaults to "job:<job id>" when created via JobParams.lease
+        ttl (float): Seconds the lease lasts without renewal. It's renewed every ttl/3 seconds while the job
+            runs, so another replica takes over within ttl of the holder dying.
+        holder (str): This replica's identity. Default: default_holder_id()
+    """
+
+    _backend: LeaseBackend
+    _key: str
+    _ttl: float = 30.0
+    _holder: str
+    _held_until: float = 0.0
+
+    def __init__(
+        self, backend: LeaseBackend, key: str, ttl: float = 30.0, holder: str | None = None
+    ) -> None:
+        if ttl <= 0:
+            raise ValueError("Lease ttl must be positive")
+        self._backend = backend
+        self._key = key
+        self._ttl = ttl
+        self._holder = default_holder_id() if holder is None else holder
+
+    def __repr__(self) -> str:
+        return f"<JobLease|{self._key}|held:{self.held}>"
+
+    @property
+    def key(self) -> str:
+        return self._key
+
+    @property
+    def holder(self) -> str:
+        return self._holder
+
+    @property
+    def renew_interval(self) -> float:
+        return self._ttl / 3
+
+    @property
+    def held(self) -> bool:
+        return time.monotonic() < self._held_until
+
+    def refresh(self) -> bool:
+        """
+        Acquire or renew the lease (blocking IO). Returns True if held.
+        A backend error counts as not holding the lease - Better to skip a run than to duplicate it.
+        """
+        was_held = self.held
+        started = time.monotonic()
+        try:
+            acquired = self._backend.acquire(self._key, self._holder, self._ttl)
+        except Exception as ex:
+            LOG.warning("Lease '%s' backend raised: '%s' - %s", self._key, type(ex).__name__, ex)
+            acquired = False
+
+        self._held_until = started + self._ttl if acquired else 0.0
+        if acquired and not was_held:
+            LOG.info("Acquired lease '%s'", self._key)
+        elif was_held and not acquired:
+            LOG.warning("Lost lease '%s'", self._key)
+        return acquired
+
+    def release(self):
+        self._held_until = 0.0
+        try:
+            self._backend.release(self._key, self._holder)
+        except Exception as ex:
+            LOG.warning("Failed to release lease '%s': '%s' - %s", self._key, type(ex).__name__, ex)
@@ -1,9 +1,92 @@
+from __future__ import annotations
+import dataclasses
 import time
 import typing as t
+from abc import ABC
+from abc import abstractmethod
 
+from .priority import JobPriority
 
-class JobTimer:
-    _start_time: float = -1.0
+_NS_PER_SECOND = 1_000_000_000
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class RunMetrics:
+    """
+    Timings of a single job run, in nanoseconds.
+    Scheduling lag and total are measured on the job's Clock (so they're virtual under a VirtualClock), while
+    queue wait and execution are always real time.
+
+    Parameters:
+        job_id (str): The job that ran
+        scheduling_lag_ns (int): Actual start minus scheduled start - Time lost to a busy/blocked event loop
+        queue_wait_ns (int): Time a sync func waited for an executor worker (0 for coroutine funcs)
+        throttle_ns (int): Time the run waited on its job groups' concurrency and rate limits
+        execution_ns (int): Time spent executing the job func
+        total_ns (int): Whole run, including retries and their backoff
+        ok (bool): False if the run raised (or timed out)
+        timed_out (bool): True if the run exceeded the job's timeout
+        priority (int): The job's priority - For queue wait per priority class
+    """
+
+    job_id: str
+    scheduling_lag_ns: int
+    queue_wait_ns: int
+    execution_ns: int
+    total_ns: int
+    ok: bool = True
+    timed_out: bool = False
+    priority: int = JobPriority.NORMAL
+    throttle_ns: int = 0
+
+    @property
+    def scheduling_lag(self) -> float:
+        return self.scheduling_lag_ns / _NS_PER_SECOND
+
+    @property
+    def queue_wait(self) -> float:
+        return self.queue_wait_ns / _NS_PER_SECOND
+
+    @property
+    def execution(self) -> float:
+        return self.execution_ns / _NS_PER_SECOND
+
+    @property
+    def throttle(self) -> float:
+        return self.throttle_ns / _NS_PER_SECOND
+
+    @property
+    def total(self) -> float:
+        return self.total_ns / _NS_PER_SECOND
+
+
+class RunTiming:
+    """
+    Accumulates executor queue-wait, execution and job group throttling times across the attempts of a single run
+    """
+
+    queue_wait_ns: int = 0
+    execution_ns: int = 0
+    throttle_ns: int = 0
+
+    def observe(self, submitted_ns: int, started_ns: int, finished_ns: int):
+        self.queue_wait_ns += max(started_ns - submitted_ns, 0)
+        self.execution_ns += max(finished_ns - started_ns, 0)
+
+
+class MetricsSink(ABC):
+    """
+    Receives the RunMetrics of every run of the jobs it's attached to (via JobParams or JobScheduler).
+    Called on the job's event loop, so implementations must not block.
+    """
+
+    @abstractmethod
+    def record(self, metrics: RunMetrics) -> None:
+        raise NotImplementedError()
+
+
+class JobTimer(MetricsSink):
+    _start_time_ns: int = -1
     _started: bool = False
     _callback_start: t.Callable | None = None
     _callback_stop: t.Callable[[float], None]
@@ -19,11 +102,16 @@ class JobTimer:
     def start(self):
         if self._callback_start:
             self._callback_start()
-        self._start_time = time.time()
+        self._start_time_ns = time.perf_counter_ns()
         self._started = True
 
     def stop(self):
         if not self._started:
             return
-        duration = time.time() - self._start_time
+        duration = (time.perf_counter_ns() - self._start_time_ns) / _NS_PER_SECOND
         self._callback_stop(duration)
+
+    def record(self, metrics: RunMetrics) -> None:
+        # Successful runs' execution time, as measured by start()/stop() before RunMetrics existed
+        if metrics.ok:
+            self._callback_stop(metrics.execution)
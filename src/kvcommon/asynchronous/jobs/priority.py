@@ -0,0 +1,270 @@
+from __future__ import annotations
+import asyncio
+import collections
+import threading
+import typing as t
+from concurrent.futures import Executor
+from enum import IntEnum
+
+from ..executors import ExecutorKind
+from ..executors import InstrumentedThreadPool
+from ..executors import get_executor
+from ..utils import LoopType
+from ..utils import call_on_loop_thread
+from .clock import SYSTEM_CLOCK
+from .clock import Clock
+
+
+class JobPriority(IntEnum):
+    """
+    Common priority classes for JobParams.priority - Lower values run first. Any int may be used.
+    """
+
+    CRITICAL = 0  # e.g. health probes
+    HIGH = 10
+    NORMAL = 20
+    LOW = 30
+    BATCH = 40  # e.g. bulk exports
+
+
+class _Waiter:
+    __slots__ = ("priority", "enqueued_at", "loop", "future", "granted")
+
+    priority: int
+    enqueued_at: float
+    loop: LoopType
+    future: asyncio.Future
+    granted: bool
+
+    def __init__(self, priority: int, loop: LoopType, enqueued_at: float) -> None:
+        self.priority = priority
+        self.enqueued_at = enqueued_at
+        self.loop = loop
+        self.future = loop.create_future()
+        self.granted = False
+
+
+def _grant(future: asyncio.Future):
+    if not future.done():
+        future.set_result(True)
+
+
+class ExecutionQueue:
+    """
+    Admits sync job runs to an executor at most capacity at a time, highest priority (lowest value) first, instead
+    of letting them pile up in the executor's own FIFO queue - So that latency-critical jobs don't wait behind
+    batch work when the executor is saturated. Runs of equal priority are admitted in arrival order.
+
+    Waiting runs age: Each second waited improves a run's effective priority by aging, so a steady stream of
+    high-priority work can delay, but never starve, low-priority runs. Safe to share between event loops.
+
+    Parameters:
+        capacity (int): Max runs admitted at once - The executor's worker count
+        aging (float): Priority points a waiting run gains per second waited. 0 for strict priority order.
+        on_backlog (callable): Called whenever a run has to wait - e.g. to let a resizable executor grow
+        clock (Clock): Source of time for aging. Default: SystemClock
+    """
+
+    _capacity: int
+    _aging: float = 1.0
+    _running: int = 0
+    _waiting: t.Dict[int, collections.deque[_Waiter]]
+    _lock: threading.Lock
+    _on_backlog: t.Callable[[], None] | None = None
+    _clock: Clock = SYSTEM_CLOCK
+
+    def __init__(
+        self,
+        capacity: int,
+        aging: float = 1.0,
+        on_backlog: t.Callable[[], None] | None = None,
+        clock: Clock | None = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if aging < 0:
+            raise ValueError("aging must be non-negative")
+        self._capacity = capacity
+        self._aging = aging
+        self._waiting = dict()
+        self._lock = threading.Lock()
+        self._on_backlog = on_backlog
+        if clock is not None:
+            self._clock = clock
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def set_clock(self, clock: Clock):
+        self._clock = clock
+
+    def set_capacity(self, capacity: int):
+        """
+        Resize - e.g. when the executor does. Waiting runs are admitted right away if capacity grew.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        with self._lock:
+            self._capacity = capacity
+            admitted = []
+            while self._running < self._capacity:
+                waiter = self._pop_next()
+                if waiter is None:
+                    break
+                waiter.granted = True
+                self._running += 1
+                admitted.append(waiter)
+        for waiter in admitted:
+            call_on_loop_thread(waiter.loop, _grant, waiter.future)
+
+    @property
+    def running_count(self) -> int:
+        return self._running
+
+    @property
+    def waiting_count(self) -> int:
+        with self._lock:
+            return sum(len(waiters) for waiters in self._waiting.values())
+
+    def waiting_by_priority(self) -> t.Dict[int, int]:
+        """
+        Number of runs waiting for admission, per priority
+        """
+        with self._lock:
+            return {
+                priority: len(waiters)
+                for priority, waiters in sorted(self._waiting.items())
+                if waiters
+            }
+
+    async def acquire(self, priority: int = JobPriority.NORMAL) -> bool:
+        """
+        Wait until the run is admitted. Returns True if it had to wait.
+        Every acquire() that returns must be paired with a release().
+        """
+        with self._lock:
+            if self._running < self._capacity and not any(self._waiting.values()):
+                self._running += 1
+                return False
+            waiter = _Waiter(
+                priority, t.cast(LoopType, asyncio.get_running_loop()), self._clock.monotonic()
+            )
+            self._waiting.setdefault(priority, collections.deque()).append(waiter)
+        if self._on_backlog is not None:
+            self._on_backlog()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            with self._lock:
+                if not waiter.granted:
+                    self._waiting[priority].remove(waiter)
+                    raise
+            # Admitted just as it was cancelled - Pass the slot on
+            self.release()
+            raise
+        return True
+
+    def release(self):
+        with self._lock:
+            waiter = self._pop_next() if self._running <= self._capacity else None
+            if waiter is None:
+                self._running -= 1
+                return
+            # The slot passes straight to the waiter, so _running is unchanged
+            waiter.granted = True
+        call_on_loop_thread(waiter.loop, _grant, waiter.future)
+
+    def _pop_next(self) -> _Waiter | None:
+        # With self._lock held - FIFO within each priority, so only each priority's oldest waiter is a candidate
+        best: _Waiter | None = None
+        best_effective = 0.0
+        now = self._clock.monotonic()
+        for waiters in self._waiting.values():
+            if not waiters:
+                continue
+            head = waiters[0]
+            effective = head.priority - self._aging * (now - head.enqueued_at)
+            if best is None or effective < best_effective:
+                best = head
+                best_effective = effective
+        if best is not None:
+            self._waiting[best.priority].popleft()
+        return best
+
+
+def executor_capacity(executor: Executor | None) -> int | None:
+    """
+    Worker count of an executor, or None if it can't be told
+    """
+    if executor is None:
+        return None
+    return getattr(executor, "_max_workers", None)
+
+
+def loop_default_executor(loop: LoopType) -> Executor | None:
+    """
+    The executor a loop runs sync funcs in when given none - Whichever set_default_executor() installed, else the
+    ThreadPoolExecutor the loop creates on first use. None until then.
+    """
+    # No public accessor - Present on every asyncio BaseEventLoop
+    return getattr(loop, "_default_executor", None)
+
+
+class ExecutionQueues:
+    """
+    An ExecutionQueue per executor (for "thread", the event loop's current default executor), created on first use
+    and sized to the executor's worker count. Executors of unknown size get none - Including a loop's default
+    executor before the loop has created it.
+
+    Parameters:
+        aging (float): See ExecutionQueue
+        clock (Clock): See ExecutionQueue
+    """
+
+    _aging: float = 1.0
+    _clock: Clock = SYSTEM_CLOCK
+    _queues: t.Dict[t.Tuple[str, Executor | None], ExecutionQueue | None]
+    _lock: threading.Lock
+
+    def __init__(self, aging: float = 1.0, clock: Clock | None = None) -> None:
+        self._aging = aging
+        if clock is not None:
+            self._clock = clock
+        self._queues = dict()
+        self._lock = threading.Lock()
+
+    def get(self, executor_name: str, loop: LoopType) -> ExecutionQueue | None:
+        if executor_name == ExecutorKind.THREAD:
+            # Keyed by the executor itself, so that one installed later by set_default_executor() gets its own
+            executor = loop_default_executor(loop)
+            if executor is None:
+                return None
+            key = (executor_name, executor)
+        else:
+            key = (executor_name, None)
+        try:
+            return self._queues[key]
+        except KeyError:
+            pass
+        if executor_name != ExecutorKind.THREAD:
+            executor = get_executor(executor_name)
+        capacity = executor_capacity(executor)
+        with self._lock:
+            if key in self._queues:
+                return self._queues[key]
+            queue = None
+            if isinstance(executor, InstrumentedThreadPool):
+                # Runs held back here count as the pool's backlog, so that it can tell it's saturated and grow
+                queue = ExecutionQueue(
+                    executor.max_workers,
+                    aging=self._aging,
+                    on_backlog=executor.check_saturation,
+                    clock=self._clock,
+                )
+                executor.add_backlog_source(lambda: queue.waiting_count)
+                executor.add_resize_listener(queue.set_capacity)
+            elif capacity is not None:
+                queue = ExecutionQueue(capacity, aging=self._aging, clock=self._clock)
+            self._queues[key] = queue
+            return queue
@@ -0,0 +1,31 @@
+from __future__ import annotations
+import dataclasses
+import typing as t
+
+from .job import Job
+
+
+# Returns the full set of jobs that should be scheduled - e.g. built from a config file, re-read on every call
+JobSource = t.Callable[[], t.Iterable[Job]]
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class ReloadSummary:
+    """
+    What a JobScheduler.reload() changed
+
+    Parameters:
+        added (tuple of str): IDs of jobs new to the source, now added
+        retired (tuple of str): IDs of jobs gone from the source, now stopping (after any run in progress)
+        updated (tuple of str): IDs of jobs whose interval was changed in place
+        deferred (tuple of str): IDs of jobs back in the source that are still retiring - Added by a later reload
+    """
+
+    added: t.Tuple[str, ...] = ()
+    retired: t.Tuple[str, ...] = ()
+    updated: t.Tuple[str, ...] = ()
+    deferred: t.Tuple[str, ...] = ()
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.retired or self.updated)
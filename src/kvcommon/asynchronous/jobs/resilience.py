@@ -0,0 +1,171 @@
+from __future__ import annotations
+import dataclasses
+import threading
+import typing as t
+from enum import StrEnum
+
+from .clock import SYSTEM_CLOCK
+from .clock import Clock
+from .timing import random_delay
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True)
+class RetryPolicy:
+    """
+    Retry a failed run in-place (before its next scheduled tick) with exponential backoff.
+
+    Parameters:
+        max_attempts (int): Total attempts per run, including the first
+        backoff_base (float): Delay (seconds) before the first retry
+        backoff_factor (float): Multiplier applied to the delay for each subsequent retry
+        backoff_max (float): Upper bound (seconds) on the delay before jitter
+        jitter (float): Fraction of each delay added at random, so that jobs failing together don't retry together
+        retry_on (tuple): Exception types that are retried - Anything else fails the run immediately
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_factor: float = 2.0
+    backoff_max: float = 30.0
+    jitter: float = 0.1
+    retry_on: t.Tuple[t.Type[BaseException], ...] = (Exception,)
+
+    def __post_init__(self):
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if self.backoff_base < 0 or self.backoff_factor < 1 or self.backoff_max < 0:
+            raise ValueError("Backoff must be non-negative and non-decreasing")
+        if self.jitter < 0:
+            raise ValueError("jitter must be non-negative")
+
+    def should_retry(self, attempt: int, exception: BaseException) -> bool:
+        return attempt < self.max_attempts and isinstance(exception, self.retry_on)
+
+    def delay(self, attempt: int) -> float:
+        """
+        Seconds to wait after the given (failed) attempt before the next one
+        """
+        delay = min(self.backoff_base * self.backoff_factor ** (attempt - 1), self.backoff_max)
+        return delay + random_delay(delay * self.jitter)
+
+
+class CircuitState(StrEnum):
+    CLOSED = "closed"  # Runs proceed normally
+    OPEN = "open"  # Runs are rejected until reset_timeout elapses
+    HALF_OPEN = "half_open"  # A single probe run is allowed through - Its outcome closes or re-opens the circuit
+
+
+class CircuitBreaker:
+    """
+    Stops a job running against a dependency that keeps failing, then probes it with one run at a time.
+    Share one instance between jobs that call the same dependency to trip (and probe) them together.
+
+    Parameters:
+        failure_threshold (int): Consecutive failed runs (after retries) that open the circuit
+        reset_timeout (float): Seconds the circuit stays open before a half-open probe run is allowed
+        clock (Clock): Source of time for reset_timeout. Default: SystemClock - Set to the scheduler's clock
+            when a job using the breaker is added to one
+    """
+
+    _failure_threshold: int = 5
+    _reset_timeout: float = 60.0
+    _state: CircuitState = CircuitState.CLOSED
+    _consecutive_failures: int = 0
+    _opened_at: float = 0.0
+    _probe_in_flight: bool = False
+    _times_opened: int = 0
+    _clock: Clock = SYSTEM_CLOCK
+    _lock: threading.Lock
+
+    def __init__(
+        self, failure_threshold: int = 5, reset_timeout: float = 60.0, clock: Clock | None = None
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if reset_timeout <= 0:
+            raise ValueError("reset_timeout must be positive")
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        if clock is not None:
+            self._clock = clock
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker|{self._state}|failures:{self._consecutive_failures}>"
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    def set_clock(self, clock: Clock):
+        """
+        Switch to another source of time - Called by Job.set_clock()
+        """
+        self._clock = clock
+
+    @property
+    def consecutive_failures(self) -> int:
+        return self._consecutive_failures
+
+    @property
+    def times_opened(self) -> int:
+        return self._times_opened
+
+    @property
+    def seconds_until_probe(self) -> float:
+        if self._state != CircuitState.OPEN:
+            return 0.0
+        return max(self._opened_at + self._reset_timeout - self._clock.monotonic(), 0.0)
+
+    def _open(self):
+        self._state = CircuitState.OPEN
+        self._opened_at = self._clock.monotonic()
+        self._probe_in_flight = False
+        self._times_opened += 1
+
+    def allow_run(self) -> bool:
+        """
+        Whether a run may proceed now. A True result in the half-open state claims the single probe run,
+        so the caller must report its outcome via record_success()/record_failure().
+        """
+        with self._lock:
+            if self._state == CircuitState.CLOSED:
+                return True
+            if self._state == CircuitState.OPEN:
+                if self._clock.monotonic() - self._opened_at < self._reset_timeout:
+                    return False
+                self._state = CircuitState.HALF_OPEN
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == CircuitState.HALF_OPEN:
+                self._open()
+            elif (
+                self._state == CircuitState.CLOSED
+                and self._consecutive_failures >= self._failure_threshold
+            ):
+                self._open()
+
+    def release_probe(self):
+        """
+        Give up a claimed probe run without an outcome (e.g. it was cancelled), so that another may be made
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def reset(self):
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._consecutive_failures = 0
+            self._probe_in_flight = False
@@ -0,0 +1,176 @@
+from __future__ import annotations
+import asyncio
+import collections
+import concurrent.futures
+import dataclasses
+import datetime
+import threading
+import typing as t
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class JobResult:
+    seq: int
+    job_id: str
+    started_at: datetime.datetime
+    finished_at: datetime.datetime
+    value: t.Any = None
+    exception: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exception is None
+
+    @property
+    def duration(self) -> datetime.timedelta:
+        return self.finished_at - self.started_at
+
+
+class JobResultBuffer:
+    """
+    Bounded ring buffer of a job's most recent results, with waiters for results yet to come.
+    Results are appended on the job's event loop thread; waiters may be on any thread.
+
+    Parameters:
+        maxlen (int): Number of results kept. Older results are discarded (and missed by slow consumers).
+    """
+
+    __slots__ = ("_results", "_maxlen", "_lock", "_waiters", "_seq", "_closed")
+
+    # A deque preallocates a block of 64 entries, so it's only created once there's a result to keep
+    _results: collections.deque[JobResult] | tuple
+    _maxlen: int
+    _lock: threading.Lock
+    _waiters: list[t.Tuple[int, concurrent.futures.Future]]
+    _seq: int
+    _closed: bool
+
+    def __init__(self, maxlen: int = 16) -> None:
+        if maxlen < 1:
+            raise ValueError("Result buffer needs room for at least one result")
+        self._results = ()
+        self._maxlen = maxlen
+        self._lock = threading.Lock()
+        self._waiters = []
+        self._seq = 0
+        self._closed = False
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @property
+    def last_seq(self) -> int:
+        """
+        Sequence number of the most recent result (0 if there are none yet)
+        """
+        return self._seq
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def snapshot(self) -> list[JobResult]:
+        with self._lock:
+            return list(self._results)
+
+    def latest(self) -> JobResult | None:
+        with self._lock:
+            return self._results[-1] if self._results else None
+
+    def _since(self, seq: int) -> list[JobResult]:
+        # Results are in seq order, so only walk back as far as needed
+        newer = []
+        for result in reversed(self._results):
+            if result.seq <= seq:
+                break
+            newer.append(result)
+        newer.reverse()
+        return newer
+
+    def append(
+        self,
+        job_id: str,
+        started_at: datetime.datetime,
+        finished_at: datetime.datetime,
+        value: t.Any = None,
+        exception: BaseException | None = None,
+    ) -> JobResult:
+        with self._lock:
+            self._seq += 1
+            if not self._results:
+                self._results = collections.deque(maxlen=self._maxlen)
+            result = JobResult(
+                seq=self._seq,
+                job_id=job_id,
+                started_at=started_at,
+                finished_at=finished_at,
+                value=value,
+                exception=exception,
+            )
+            self._results.append(result)
+            resolved = [(future, self._since(after_seq)) for after_seq, future in self._waiters]
+            self._waiters = []
+
+        # Resolve outside the lock - Done-callbacks may append new waiters
+        for future, newer in resolved:
+            if not future.done():
+                future.set_result(newer)
+        return result
+
+    def close(self):
+        """
+        No more results will be appended - Resolves all current and future waiters with an empty list
+        """
+        with self._lock:
+            self._closed = True
+            waiters, self._waiters = self._waiters, []
+        for _, future in waiters:
+            if not future.done():
+                future.set_result([])
+
+    def wait_after(self, seq: int) -> concurrent.futures.Future[list[JobResult]]:
+        """
+        Future resolving with every buffered result newer than seq - Immediately if there already are any.
+        Resolves with an empty list once the buffer is closed.
+        """
+        future: concurrent.futures.Future[list[JobResult]] = concurrent.futures.Future()
+        with self._lock:
+            newer = self._since(seq)
+            if not newer and not self._closed:
+                self._waiters.append((seq, future))
+                return future
+        future.set_result(newer)
+        return future
+
+    def next_result(self) -> concurrent.futures.Future[JobResult | None]:
+        """
+        Future resolving with the next result to be appended (None if the buffer is closed first).
+        Safe to use from any thread.
+        """
+        next_future: concurrent.futures.Future[JobResult | None] = concurrent.futures.Future()
+        results_future = self.wait_after(self._seq)
+
+        def _chain(done: concurrent.futures.Future):
+            if next_future.done():
+                return
+            results = done.result()
+            next_future.set_result(results[0] if results else None)
+
+        results_future.add_done_callback(_chain)
+        return next_future
+
+    async def stream(self, from_seq: int | None = None) -> t.AsyncIterator[JobResult]:
+        """
+        Iterate results as they arrive, on any event loop. Ends once the buffer is closed.
+
+        Parameters:
+            from_seq (int): Yield results newer than this sequence number. Default: Only new results
+        """
+        seq = self._seq if from_seq is None else from_seq
+        while True:
+            results = await asyncio.wrap_future(self.wait_after(seq))
+            if not results:
+                return
+            for result in results:
+                seq = result.seq
+                yield result
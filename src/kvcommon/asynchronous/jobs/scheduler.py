@@ -2,29 +2,61 @@ from __future__ import annotations
 import asyncio
 import concurrent.futures
 import functools
+import heapq
+import itertools
 import logging
-import queue
+import math
 import threading
-import time
 import typing as t
+from concurrent.futures import Executor
 from concurrent.futures import Future
 from enum import StrEnum
 
+from kvcommon.datastore import VersionedDatastore
 from kvcommon.logger import get_logger
 
+from ..executors import ExecutorKind
+from ..executors import acquire_shared_executors
+from ..executors import ensure_picklable
+from ..executors import get_executor
+from ..executors import is_process_executor
+from ..executors import release_shared_executors
+from ..utils import CallableKind
 from ..utils import LoopType
+from ..utils import call_on_loop_thread
+from ..utils import classify_callable
+from ..utils import create_task
+from ..utils import is_loop_thread
+from .checkpoint import JobCheckpointStore
+from .clock import SYSTEM_CLOCK
+from .clock import Clock
+from .clock import VirtualClock
+from .errors import ErrorPipeline
 from .errors import future_check_for_exception
-from .errors import get_error_poller_task
 from .event_loop import cancel_residual_loop_tasks
 from .event_loop import get_or_create_loop
+from .event_loop import remove_signal_handlers_from_loop
 from .event_loop import start_async_loop
+from .groups import JobGroup
+from .groups import JobGroupStats
 from .job import Job
+from .job import JobExceptionStruct
 from .job import JobState
-from .job import PeriodicJob
+from .metrics import MetricsSink
+from .priority import ExecutionQueues
+from .reload import JobSource
+from .reload import ReloadSummary
+from .tasks import TaskRecord
+from .timing import phase_offset
+from .timing import random_delay
+from .watchdog import LoopWatchdog
 
 
 LOG = get_logger("kvc_scheduler")
 
+# Tasks of a submit_many() batch started per loop callback - Larger batches yield to the loop between chunks
+_TASK_START_CHUNK = 256
+
 
 class SchedulerState(StrEnum):
     SUSPENDED = "suspended"
@@ -33,39 +65,138 @@ class SchedulerState(StrEnum):
 
 
 class JobScheduler:
+    """
+    Runs Jobs on an event loop in a background thread, dispatching each job once it's due.
+
+    Parameters:
+        event_loop (LoopType): Adopt an existing event loop instead of getting/creating one
+        log_level (int): Log level for the scheduler's logger when not in debug mode
+        debug_mode (bool): Verbose logging + asyncio debug mode
+        phase_spread (bool): Start each periodic job at a deterministic offset (derived from its id)
+            within its interval, so that many same-interval jobs don't all fire at the same instant
+        start_jitter (float): Max random delay (seconds) added to each periodic job's start
+        error_queue_size (int): Max job errors held awaiting emission before the oldest are dropped
+        checkpoint_store (VersionedDatastore): Persist each periodic job's timing and counters here, and restore
+            them when a job with the same ID is added (e.g. after a restart) - See JobParams.catch_up
+        checkpoint_interval (float): Min time (seconds) between checkpoint saves while running
+        metrics_sink (MetricsSink): Receives the RunMetrics of every run of every job added to the scheduler
+        clock (Clock): Source of time for the scheduler and every job added to it. Default: SystemClock
+            With a VirtualClock, the scheduler is driven by simulate() (in the calling thread) instead of start()
+        loop_watchdog (LoopWatchdog or bool): Monitors the event loop's lag while started, and pins loop stalls on
+            the job that caused them. True (default) for a LoopWatchdog with default settings, False for none.
+        priority_queue (bool): Admit jobs' sync runs to each executor in order of JobParams.priority once it has
+            no idle workers, instead of first-come first-served by the executor's own queue
+            Executors of unknown size aren't - Including an event loop's default executor until its first use
+        priority_aging (float): Priority points a run waiting for a worker gains per second - So that low-priority
+            runs are delayed by a stream of higher-priority ones, but never starved. 0 for strict priority order.
+        job_groups (sequence of JobGroup): Concurrency/rate limits shared by the jobs tagged with each group's name
+        job_source (callable): Returns the jobs to schedule (e.g. read from a config file) - Loaded once the
+            scheduler starts, and reloaded on SIGHUP (or request_reload()) without restarting it. See reload()
+    """
+
     _event_loop: LoopType
-    _loop_thread: threading.Thread | None
+    _loop_thread: threading.Thread | None = None
     _futures: t.Dict[str, Future]
     _jobs_all: t.Dict[str, Job]
     _jobs_running: t.Dict[str, Job]
     _started: bool = False
     _state: SchedulerState = SchedulerState.SUSPENDED
-    _loop_sleep_time: float = 0.5
-    _error_queue: queue.Queue
+    _max_wait_time: float = 5.0
+    _wakeup: threading.Condition
+    _dispatch_heap: t.List[t.Tuple[float, int, str]]
+    _dispatch_seq: t.Iterator[int]
+    _changed_job_ids: t.Set[str]
+    _phase_spread: bool = False
+    _start_jitter: float = 0.0
+    _errors: ErrorPipeline
+    _errors_future: Future | None = None
+    _checkpoints: JobCheckpointStore | None = None
+    _checkpoint_interval: float = 5.0
+    _last_checkpoint: float = 0.0
+    _metrics_sink: MetricsSink | None = None
+    _clock: Clock = SYSTEM_CLOCK
+    _async_wakeup: asyncio.Event | None = None
+    _watchdog: LoopWatchdog | None = None
+    _execution_queues: ExecutionQueues | None = None
+    _groups: t.Dict[str, JobGroup]
+    _holds_shared_executors: bool = False
+    _signal_handlers_added: bool = False
+    _job_source: JobSource | None = None
+    _sourced_job_ids: t.Set[str]
+    _reload_requested: bool = False
+    _reload_lock: threading.Lock
+    _tasks: t.Set[TaskRecord]
     _debug_mode: bool = False
     _normal_log_level = logging.INFO
-    _error_poller: PeriodicJob
 
     def __init__(
         self,
         event_loop: LoopType | None = None,
         log_level=logging.INFO,
         debug_mode: bool = False,
+        phase_spread: bool = False,
+        start_jitter: float = 0.0,
+        error_queue_size: int = 1000,
+        checkpoint_store: VersionedDatastore | None = None,
+        checkpoint_interval: float = 5.0,
+        metrics_sink: MetricsSink | None = None,
+        clock: Clock | None = None,
+        loop_watchdog: LoopWatchdog | bool = True,
+        priority_queue: bool = True,
+        priority_aging: float = 1.0,
+        job_groups: t.Sequence[JobGroup] | None = None,
+        job_source: JobSource | None = None,
     ) -> None:
         self._futures = dict()
         self._jobs_all = dict()
         self._jobs_running = dict()
-
-        self._error_queue = queue.Queue()
-        self._error_poller = get_error_poller_task(error_queue=self._error_queue)
-        self._error_poller.pause("Startup")
-        self.add_job(self._error_poller)
-
-        self._event_loop = get_or_create_loop(add_handlers=True, logger=LOG, adopt_loop=event_loop)
+        self._tasks = set()
+
+        self._wakeup = threading.Condition(threading.RLock())
+        self._dispatch_heap = []
+        self._dispatch_seq = itertools.count()
+        self._changed_job_ids = set()
+        self._phase_spread = phase_spread
+        self._start_jitter = start_jitter
+
+        self._clock = SYSTEM_CLOCK if clock is None else clock
+        self._errors = ErrorPipeline(maxsize=error_queue_size, clock=self._clock)
+
+        if checkpoint_store is not None:
+            self._checkpoints = JobCheckpointStore(checkpoint_store)
+        self._checkpoint_interval = checkpoint_interval
+        self._metrics_sink = metrics_sink
+        if loop_watchdog is True:
+            loop_watchdog = LoopWatchdog()
+        self._watchdog = loop_watchdog or None
+        if priority_queue:
+            self._execution_queues = ExecutionQueues(aging=priority_aging, clock=self._clock)
+        self._groups = dict()
+        for group in job_groups or ():
+            self.add_group(group)
+        self._job_source = job_source
+        self._sourced_job_ids = set()
+        self._reload_lock = threading.Lock()
+        # Initial load happens on the first dispatch cycle
+        self._reload_requested = job_source is not None
+        self._event_loop = self._init_event_loop(event_loop)
+        # Shared executors (e.g. the process pool) outlive this scheduler while other schedulers still use them
+        acquire_shared_executors()
+        self._holds_shared_executors = True
 
         self._normal_log_level = log_level
         self.toggle_debug_mode(debug_mode)
 
+    def _init_event_loop(self, event_loop: LoopType | None) -> LoopType:
+        if event_loop is None and isinstance(self._clock, VirtualClock):
+            event_loop = self._clock.new_event_loop()
+        # With a job source, SIGHUP reloads it instead of stopping the loop
+        on_hangup = self.request_reload if self._job_source is not None else None
+        self._signal_handlers_added = True
+        return get_or_create_loop(
+            add_handlers=True, logger=LOG, adopt_loop=event_loop, on_hangup=on_hangup
+        )
+
     def toggle_debug_mode(self, new_state: bool | None = None):
         if new_state is None:
             self._debug_mode = not self._debug_mode
@@ -75,7 +206,8 @@ class JobScheduler:
         if self._debug_mode:
             LOG.setLevel(logging.DEBUG)
             # Emit warnings for slow/blocking tasks if True
-            self._event_loop.set_debug(True)
+            if self._event_loop is not None:
+                self._event_loop.set_debug(True)
         else:
             LOG.setLevel(self._normal_log_level)
 
@@ -87,9 +219,276 @@ class JobScheduler:
     def event_loop(self) -> LoopType:
         return self._event_loop
 
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+
+    @property
+    def watchdog(self) -> LoopWatchdog | None:
+        """
+        Monitor of the scheduler's event loop - For its lag histogram and recent stalls
+        """
+        return self._watchdog
+
+    @property
+    def execution_queues(self) -> ExecutionQueues | None:
+        """
+        Priority-ordered admission to each executor - For the number of runs waiting per priority
+        """
+        return self._execution_queues
+
+    @property
+    def errors(self) -> ErrorPipeline:
+        """
+        Pipeline that job exceptions are emitted through - For drop counts and per-job error rates
+        """
+        return self._errors
+
     def add_job(self, job: Job):
-        if job.id not in self._jobs_all.keys():
+        """
+        Register a job to be dispatched by the scheduler.
+
+        raises: `PicklingCheckError` if the job targets a process pool with unpicklable func/args
+        raises: `UnknownExecutorException` if the job targets an executor name that isn't registered
+        raises: `KeyError` if the job depends on upstream jobs that haven't been added yet
+            (which also rules out dependency cycles)
+        """
+        if is_process_executor(job.executor):
+            ensure_picklable(job.id, job.func, job.func_args, job.func_kwargs)
+
+        with self._wakeup:
+            if job.id in self._jobs_all.keys():
+                return
+            if job.depends_on:
+                job.link_upstreams(
+                    self._jobs_all[job_id] for job_id in job.depends_on if job_id in self._jobs_all
+                )
             self._jobs_all[job.id] = job
+            job.set_clock(self._clock)
+            job.set_execution_queues(self._execution_queues)
+            if job.tags:
+                job.set_groups(self._groups[tag] for tag in job.tags if tag in self._groups)
+            job.add_state_listener(self._on_job_state_change)
+            if self._metrics_sink is not None:
+                job.add_metrics_sink(self._metrics_sink)
+            if self._restore_job(job):
+                # Job keeps to its restored schedule from the moment it's dispatched
+                start_offset = 0.0
+            else:
+                start_offset = self._start_offset(job)
+            self._schedule_dispatch(job, self._dispatch_time_base() + start_offset)
+
+    def add_group(self, group: JobGroup):
+        """
+        Register a JobGroup - Its limits apply to the runs of every job (already added or not) tagged with its name.
+
+        raises: `KeyError` if a group with the same name is already registered
+        """
+        with self._wakeup:
+            if group.name in self._groups:
+                raise KeyError(f"Job group already registered with name: '{group.name}'")
+            self._groups[group.name] = group
+            group.set_clock(self._clock)
+            for job in self._jobs_all.values():
+                if group.name in job.tags:
+                    job.set_groups(self._groups[tag] for tag in job.tags if tag in self._groups)
+
+    def get_group(self, name: str) -> JobGroup:
+        group = self._groups.get(name, None)
+        if group is None:
+            raise KeyError(f"Failed to retrieve job group with name: '{name}'")
+        return group
+
+    def group_stats(self) -> t.Dict[str, JobGroupStats]:
+        """
+        Throttling stats of every registered JobGroup, by name
+        """
+        return {name: group.stats() for name, group in list(self._groups.items())}
+
+    def request_reload(self):
+        """
+        Have the dispatcher reload() the job source on its next cycle - Called on SIGHUP. Safe to call from any
+        thread (including a signal handler on the loop's thread), as it doesn't wait for the reload.
+        """
+        if self._job_source is None:
+            LOG.warning("Reload requested, but the scheduler has no job_source")
+            return
+        with self._wakeup:
+            self._reload_requested = True
+            self._wake_dispatcher()
+
+    def reload(self) -> ReloadSummary:
+        """
+        Re-read the job source and bring the scheduler's jobs in line with it, without restarting the scheduler
+        or interrupting jobs that stay: Jobs new to the source are added, jobs gone from it are retired (stopped
+        once any run in progress finishes) and jobs whose interval changed are rescheduled in
+        place (see Job.set_interval).
+        Jobs are matched by ID - Other changes to a job that stays are ignored, so give it a new ID to replace it.
+        Only jobs that came from the source are retired - Jobs added with add_job() are left alone.
+
+        raises: `ValueError` if the source returns more than one job with the same ID
+        raises: Anything raised by the source or add_job() - Jobs are left as they were if the source fails
+        """
+        job_source = self._job_source
+        if job_source is None:
+            raise RuntimeError("Scheduler has no job_source to reload")
+        with self._reload_lock:
+            source_jobs: t.Dict[str, Job] = dict()
+            for job in job_source():
+                if job.id in source_jobs:
+                    raise ValueError(f"Job source returned duplicate job id: '{job.id}'")
+                source_jobs[job.id] = job
+
+            added: t.List[str] = []
+            updated: t.List[str] = []
+            deferred: t.List[str] = []
+            with self._wakeup:
+                current_jobs = dict(self._jobs_all)
+                retired = [job_id for job_id in self._sourced_job_ids if job_id not in source_jobs]
+                self._sourced_job_ids = set(source_jobs)
+
+            for job_id in retired:
+                if job_id in current_jobs:
+                    # Untracked by the dispatcher once stopped - A run in progress is left to finish
+                    current_jobs[job_id].stop(reason="Removed from job source")
+
+            for job_id, job in source_jobs.items():
+                existing = current_jobs.get(job_id, None)
+                if existing is None:
+                    self.add_job(job)
+                    added.append(job_id)
+                elif existing.state == JobState.FINISHED:
+                    deferred.append(job_id)
+                    with self._wakeup:
+                        # Not from the source until it's added
+                        self._sourced_job_ids.discard(job_id)
+                elif (
+                    existing.cron is None and job.cron is None and existing.interval != job.interval
+                ):
+                    existing.set_interval(job.interval)
+                    updated.append(job_id)
+
+        summary = ReloadSummary(
+            added=tuple(added),
+            retired=tuple(sorted(retired)),
+            updated=tuple(updated),
+            deferred=tuple(deferred),
+        )
+        if summary.changed:
+            LOG.info(
+                "Reloaded job source - Added: %s, Retired: %s, Updated: %s",
+                len(added),
+                len(retired),
+                len(updated),
+            )
+        if deferred:
+            LOG.warning(
+                "Jobs still stopping after removal will be added by a later reload: %s", deferred
+            )
+        return summary
+
+    def _reload_from_source(self):
+        try:
+            self.reload()
+        except Exception as ex:
+            LOG.error("Failed to reload job source: '%s' - %s", type(ex).__name__, ex)
+
+    def _restore_job(self, job: Job) -> bool:
+        if self._checkpoints is None or not self._checkpoints.is_checkpointed(job):
+            return False
+        checkpoint = self._checkpoints.load(job.id)
+        if checkpoint is None:
+            return False
+        job.restore_checkpoint(checkpoint)
+        return job.status.has_run
+
+    def save_checkpoints(self) -> int:
+        """
+        Checkpoint every job whose status changed since it was last saved. Returns the number saved.
+        Called periodically while running and on stop().
+        """
+        if self._checkpoints is None:
+            return 0
+        with self._wakeup:
+            jobs = list(self._jobs_all.values())
+        self._last_checkpoint = self._clock.monotonic()
+        return self._checkpoints.save(jobs)
+
+    def _maybe_save_checkpoints(self):
+        if (
+            self._checkpoints is None
+            or self._clock.monotonic() - self._last_checkpoint < self._checkpoint_interval
+        ):
+            return
+        try:
+            self.save_checkpoints()
+        except Exception as ex:
+            LOG.error("Failed to save job checkpoints: '%s' - %s", type(ex).__name__, ex)
+
+    def _dispatch_time_base(self) -> float:
+        # Before start(), dispatch times are relative and get rebased in _rebase_dispatch_heap()
+        if self._state == SchedulerState.ACTIVE:
+            return self._clock.monotonic()
+        return 0.0
+
+    def _rebase_dispatch_heap(self):
+        with self._wakeup:
+            now = self._clock.monotonic()
+            rebased = []
+            for due, seq, job_id in self._dispatch_heap:
+                job = self._jobs_all.get(job_id, None)
+                if job is not None and job.cron is not None:
+                    # Cron offsets are relative to wall-clock time, so recompute rather than rebase
+                    due = self._start_offset(job)
+                rebased.append((due + now, seq, job_id))
+            heapq.heapify(rebased)
+            self._dispatch_heap = rebased
+
+    def _start_offset(self, job: Job) -> float:
+        """
+        Delay (seconds) before a newly-added job is first dispatched.
+        Cron jobs are dispatched at their first fire time, so they don't hold a waiting coroutine until then.
+        Dependent jobs are dispatched immediately to wait on their upstreams.
+        One-off jobs aren't spread - Their interval is already an explicit delay.
+        """
+        if job.depends_on:
+            return 0.0
+        if job.cron is not None:
+            now = self._clock.now()
+            return max((job.cron.next_fire(now) - now).total_seconds(), 0.0)
+        if not job.periodic:
+            return 0.0
+        offset = 0.0
+        if self._phase_spread:
+            offset += phase_offset(job.id, job.interval.total_seconds())
+        if self._start_jitter > 0:
+            offset += random_delay(self._start_jitter)
+        return offset
+
+    def _schedule_dispatch(self, job: Job, due_monotonic: float):
+        """
+        Push a job onto the dispatch heap to be started by the scheduler once due_monotonic has passed.
+        """
+        with self._wakeup:
+            heapq.heappush(self._dispatch_heap, (due_monotonic, next(self._dispatch_seq), job.id))
+            self._wake_dispatcher()
+
+    def _on_job_state_change(self, job: Job, new_state: JobState):
+        # Invoked from whichever thread changed the job's state (usually the loop thread)
+        with self._wakeup:
+            self._changed_job_ids.add(job.id)
+            self._wake_dispatcher()
+
+    def _notify_wakeup(self):
+        with self._wakeup:
+            self._wake_dispatcher()
+
+    def _wake_dispatcher(self):
+        # With self._wakeup held - Wakes the dispatcher thread, or the dispatcher task on the loop thread
+        self._wakeup.notify()
+        async_wakeup = self._async_wakeup
+        if async_wakeup is not None and not self._event_loop.is_closed():
+            call_on_loop_thread(self._event_loop, async_wakeup.set)
 
     def get_job(self, job_or_id: Job | str) -> Job:
         if isinstance(job_or_id, Job):
@@ -107,13 +506,37 @@ class JobScheduler:
             raise KeyError(f"Failed to retrieve job with id: '{job_or_id}'")
         return job
 
-    def remove_job(self, job_or_id: Job | str):
+    def remove_job(self, job_or_id: Job | str, cancel: bool = False):
+        """
+        Untrack a job. A run loop that's still going is left to wind down on its own (e.g. after job.stop()).
+
+        Parameters:
+            cancel (bool): Also cancel the job's run loop, interrupting any run in progress
+        """
         if isinstance(job_or_id, Job):
             job_or_id = job_or_id.id
-        if job_or_id in self._jobs_all.keys():
-            del self._jobs_all[job_or_id]
-        if job_or_id in self._jobs_running.keys():
-            del self._jobs_running[job_or_id]
+        with self._wakeup:
+            # Stale dispatch heap entries for this id are discarded lazily when popped
+            if job_or_id in self._jobs_all.keys():
+                del self._jobs_all[job_or_id]
+            if job_or_id in self._jobs_running.keys():
+                del self._jobs_running[job_or_id]
+            if cancel:
+                self._cancel_future(job_or_id)
+            else:
+                self._futures.pop(job_or_id, None)
+            self._changed_job_ids.discard(job_or_id)
+            self._errors.forget(job_or_id)
+            self._on_job_untracked(job_or_id)
+            self._wake_dispatcher()
+        if self._checkpoints is not None:
+            self._checkpoints.remove(job_or_id)
+
+    def _on_job_untracked(self, job_id: str):
+        """
+        Hook for subclasses: Called (with the scheduler lock held) when a job is removed from the scheduler.
+        """
+        pass
 
     def _track_running_job(self, job_id: str, job: Job):
         if job_id in self._jobs_running:
@@ -161,7 +584,7 @@ class JobScheduler:
             LOG.warning("Job timed out during cleanup: %s", p)
 
     def _cancel_future(self, job_id: str, defer_wait: bool = False) -> Future | None:
-        job_future = self._futures.pop(job_id)
+        job_future = self._futures.pop(job_id, None)
         if job_future and not (job_future.done() or job_future.cancelled()):
             LOG.debug("Cancelling job future: '%s'", job_id)
             job_future.cancel()
@@ -179,11 +602,24 @@ class JobScheduler:
                 cancelled_futures.append(cancelled)
         self._wait_for_futures(cancelled_futures=cancelled_futures)
 
+    def _run_loop_thread(self, ready_event: threading.Event):
+        try:
+            start_async_loop(self._event_loop, ready_event, LOG)
+        finally:
+            # Wake the dispatcher so that it notices the dead loop thread immediately
+            self._notify_wakeup()
+
     def _start_loop_thread(self):
         ready_event = threading.Event()
-        loop_thread = threading.Thread(target=start_async_loop, args=(self._event_loop, ready_event, LOG), daemon=True)
+        loop_thread = threading.Thread(
+            target=self._run_loop_thread, args=(ready_event,), daemon=True
+        )
         self._loop_thread = loop_thread
+        self._launch_loop_thread(loop_thread, ready_event)
+        return loop_thread
 
+    @staticmethod
+    def _launch_loop_thread(loop_thread: threading.Thread, ready_event: threading.Event):
         LOG.debug(f"Starting loop thread")
         loop_thread.start()  # begins loop.run_forever()
 
@@ -194,7 +630,17 @@ class JobScheduler:
         if not ready_event.is_set():
             raise TimeoutError("Async loop failed to start.")
 
-        return loop_thread
+    def _start_loop_threads(self):
+        self._start_loop_thread()
+
+    def _loop_threads_alive(self) -> bool:
+        return self._loop_thread is not None and self._loop_thread.is_alive()
+
+    def _loop_for_job(self, job: Job) -> LoopType:
+        """
+        The event loop that a job should run on.
+        """
+        return self._event_loop
 
     def _keyboard_interrupt(self):
         self._state = SchedulerState.SUSPENDED
@@ -217,94 +663,354 @@ class JobScheduler:
         if job.id in self._jobs_running:
             raise KeyError(f"Job already running: {job.id}")
 
-        job_future = asyncio.run_coroutine_threadsafe(
-            job.run(loop=self._event_loop, error_queue=self._error_queue), self._event_loop
-        )
+        job_future = self._launch_job(job, self._loop_for_job(job))
 
         job_done_callback = functools.partial(
-            future_check_for_exception, **dict(job=job, error_queue=self._error_queue)
+            future_check_for_exception, **dict(job=job, error_queue=self._errors)
         )
         job_future.add_done_callback(job_done_callback)
 
-        self._track_future(job.id, job_future)
-        self._track_running_job(job.id, job)
+        with self._wakeup:
+            self._track_future(job.id, job_future)
+            self._track_running_job(job.id, job)
 
         return job_future
 
-    def start(self):
-        try:
-            self._start_loop_thread()
-            LOG.debug("Background thread event loop started.")
-
-            self._state = SchedulerState.ACTIVE
-
-            for job_id, job in self._jobs_all.items():
-                self.run_job(job)
-
-            while self._state == SchedulerState.ACTIVE:
-                time.sleep(self._loop_sleep_time)
-                jobs_to_run: list[str] = []
-                jobs_to_remove: list[str] = []
-                paused_jobs: list[str] = []
+    def _launch_job(self, job: Job, loop: LoopType) -> Future:
+        return asyncio.run_coroutine_threadsafe(job.run(loop=loop, error_queue=self._errors), loop)
+
+    def submit(
+        self, func: t.Callable, *args, executor: str = ExecutorKind.THREAD, **kwargs
+    ) -> Future:
+        """
+        Run func(*args, **kwargs) once, as soon as possible, without the overhead of a Job (logger, ID, status).
+        Coroutine funcs run on the scheduler's event loop, sync funcs on the named executor.
+        Safe to call from any thread, including before start().
+
+        Returns a Future for func's result. Cancelling it before the task starts prevents it from running.
+        When called on the scheduler's event loop (e.g. from a job), the task is started right away and the Future
+        is an asyncio.Future to await, rather than a concurrent.futures.Future.
+        Exceptions are also reported to the error pipeline, under the ID "task:<func qualname>".
+        Tasks still pending when the scheduler stops are cancelled.
+        """
+        return self.submit_many(func, (args,), executor=executor, **kwargs)[0]
+
+    def submit_many(
+        self,
+        func: t.Callable,
+        args_iterable: t.Iterable[t.Tuple],
+        executor: str = ExecutorKind.THREAD,
+        **kwargs,
+    ) -> t.List[Future]:
+        """
+        Submit one task per args tuple - func(*args, **kwargs) - in a single hand-off to the event loop.
+        Large batches are started in chunks, yielding to the loop in between so that other jobs aren't held up.
+        See submit()
+        """
+        is_coroutine = classify_callable(func) == CallableKind.COROUTINE_FUNCTION
+        if is_coroutine and executor != ExecutorKind.THREAD:
+            raise ValueError(
+                "Coroutine functions run on the event loop - executor only applies to sync functions"
+            )
+        loop = self._event_loop
+        if is_loop_thread(loop):
+            records = [
+                TaskRecord(func, args, kwargs, loop.create_future()) for args in args_iterable
+            ]
+        else:
+            records = [TaskRecord(func, args, kwargs) for args in args_iterable]
+        if not records:
+            return []
+        self._tasks.update(records)
+        call_on_loop_thread(loop, self._start_tasks, records, is_coroutine, executor)
+        return [record.future for record in records]
+
+    def _start_tasks(self, records: t.List[TaskRecord], is_coroutine: bool, executor_name: str):
+        # On the loop thread
+        executor = None
+        if not is_coroutine:
+            try:
+                executor = get_executor(executor_name)
+            except Exception as ex:
+                for record in records:
+                    self._finish_task(record, exception=ex)
+                return
+        self._start_task_chunk(records, 0, is_coroutine, executor)
+
+    def _start_task_chunk(
+        self, records: t.List[TaskRecord], start: int, is_coroutine: bool, executor: Executor | None
+    ):
+        # On the loop thread
+        loop = self._event_loop
+        end = start + _TASK_START_CHUNK
+        for record in records[start:end]:
+            if record.future.cancelled():
+                self._tasks.discard(record)
+                continue
+            try:
+                if is_coroutine:
+                    # Eager (Python 3.12+): Tasks that finish without suspending skip a trip through the loop
+                    coro = record.func(*record.args, **record.kwargs)
+                    task = create_task(loop, coro, name=record.id, eager=True)
+                else:
+                    call = functools.partial(record.func, *record.args, **record.kwargs)
+                    task = loop.run_in_executor(executor, call)
+            except Exception as ex:
+                self._finish_task(record, exception=ex)
+                continue
+            record.task = task
+            task.add_done_callback(functools.partial(self._on_task_done, record))
+        if end < len(records):
+            # The rest of the batch queues behind whatever else is ready to run on the loop
+            loop.call_soon(self._start_task_chunk, records, end, is_coroutine, executor)
+
+    def _on_task_done(self, record: TaskRecord, task: asyncio.Future):
+        if task.cancelled():
+            self._tasks.discard(record)
+            record.future.cancel()
+            return
+        self._finish_task(
+            record, task.result() if task.exception() is None else None, task.exception()
+        )
 
-                for job_id in self.keys_jobs_all:
-                    job = self.get_job(job_id)
+    def _finish_task(
+        self, record: TaskRecord, value: t.Any = None, exception: BaseException | None = None
+    ):
+        self._tasks.discard(record)
+        future = record.future
+        if exception is not None:
+            self._errors.put(JobExceptionStruct(job=record, exception=exception))
+        if future.done():
+            # Cancelled by the caller after it started
+            return
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(value)
 
-                    # Untrack jobs that have finished/stopped fully
-                    if job.state == JobState.FINISHED:
-                        jobs_to_remove.append(job.id)
+    def _cancel_pending_tasks(self):
+        records = list(self._tasks)
+        self._tasks.clear()
+        for record in records:
+            record.future.cancel()
+        if records:
+            LOG.debug("Cancelled %s pending task(s)", len(records))
 
-                    # Catch new jobs added since thread started
-                    elif job.state == JobState.READY:
-                        jobs_to_run.append(job.id)
+    @property
+    def count_tasks_pending(self) -> int:
+        """
+        Tasks submitted via submit()/submit_many() that haven't finished yet
+        """
+        return len(self._tasks)
+
+    def _next_wait_time(self) -> float:
+        """
+        Seconds until the earliest entry on the dispatch heap is due (capped at _max_wait_time).
+        """
+        if not self._dispatch_heap:
+            return self._max_wait_time
+        due_monotonic = self._dispatch_heap[0][0]
+        return min(max(due_monotonic - self._clock.monotonic(), 0.0), self._max_wait_time)
+
+    def _pop_due_jobs(self) -> t.List[Job]:
+        due_jobs: t.List[Job] = []
+        now = self._clock.monotonic()
+        while self._dispatch_heap and self._dispatch_heap[0][0] <= now:
+            _, _, job_id = heapq.heappop(self._dispatch_heap)
+            job = self._jobs_all.get(job_id, None)
+            # Discard stale entries for jobs that were removed, finished or already started
+            if job is None or job.state == JobState.FINISHED or job_id in self._jobs_running:
+                continue
+            due_jobs.append(job)
+        return due_jobs
+
+    def _collect_finished_jobs(self, changed_job_ids: t.Set[str]) -> t.List[str]:
+        finished: t.List[str] = []
+        for job_id in changed_job_ids:
+            job = self._jobs_all.get(job_id, None)
+            if job is not None and job.state == JobState.FINISHED:
+                finished.append(job_id)
+        return finished
+
+    def _dispatch(self):
+        """
+        Event-driven main loop: Sleeps until a job is due on the dispatch heap or until a job is
+        added, removed or changes state - Idle cost does not scale with the number of registered jobs.
+        """
+        while self._state == SchedulerState.ACTIVE:
+            with self._wakeup:
+                if not (self._changed_job_ids or self._reload_requested):
+                    wait_time = self._next_wait_time()
+                    if wait_time > 0:
+                        self._wakeup.wait(timeout=wait_time)
+
+            self._dispatch_cycle()
+
+            # Check for thread health just in case
+            if not self._loop_threads_alive():
+                LOG.warning("Background loop thread is unexpectedly dead. Exiting.")
+                break
+
+    def _dispatch_cycle(self):
+        """
+        Dispatch due jobs and untrack finished ones - Once each time the dispatcher wakes
+        """
+        with self._wakeup:
+            reload_requested, self._reload_requested = self._reload_requested, False
+
+        if reload_requested:
+            self._reload_from_source()
+
+        with self._wakeup:
+            changed_job_ids = self._changed_job_ids
+            self._changed_job_ids = set()
+            jobs_to_run = self._pop_due_jobs()
+
+        # Untrack jobs that have finished/stopped fully
+        for job_id in self._collect_finished_jobs(changed_job_ids):
+            self.remove_job(job_id)
+
+        for job in jobs_to_run:
+            self.run_job(job)
+
+        if self.debug_mode and (changed_job_ids or jobs_to_run):
+            LOG.debug(
+                "Scheduler Main Loop: %s -- All Jobs: '%s' -- Running Jobs: '%s' -- Pending dispatch: '%s' ",
+                self._state,
+                self.count_jobs_all,
+                self.count_jobs_running,
+                len(self._dispatch_heap),
+            )
 
-                    elif job.state == JobState.SUSPENDED:
-                        paused_jobs.append(job.id)
+        self._after_dispatch_cycle()
+        self._maybe_save_checkpoints()
 
-                for job_id in jobs_to_remove:
-                    self.remove_job(job)
+    def _after_dispatch_cycle(self):
+        """
+        Hook for subclasses: Called on the dispatcher thread each time the main loop wakes.
+        """
+        pass
 
-                for job_id in jobs_to_run:
-                    self.run_job(job)
+    def start(self):
+        if isinstance(self._clock, VirtualClock):
+            raise RuntimeError("A scheduler on a VirtualClock is run by simulate(), not start()")
+        try:
+            self._start_loop_threads()
+            LOG.debug("Background thread event loop started.")
+            self._errors_future = asyncio.run_coroutine_threadsafe(
+                self._errors.run(), self._event_loop
+            )
+            if self._watchdog is not None:
+                self._watchdog.start(self._event_loop)
 
-                if self.count_jobs_running > 1:
-                    self._error_poller.resume("Running jobs")
-                else:
-                    self._error_poller.pause("No running jobs")
-
-                if self.debug_mode:
-                    num_paused = len(paused_jobs)
-                    LOG.debug(
-                        "Scheduler Main Loop: %s -- All Jobs: '%s' -- Running Jobs: '%s' -- Paused: '%s' ",
-                        self._state,
-                        self.count_jobs_all,
-                        self.count_jobs_running - num_paused,
-                        num_paused,
-                    )
-
-                # Check for thread health just in case
-                if not self._loop_thread or not self._loop_thread.is_alive():
-                    LOG.warning("Background loop thread is unexpectedly dead. Exiting.")
-                    break
+            with self._wakeup:
+                self._rebase_dispatch_heap()
+                self._state = SchedulerState.ACTIVE
+            self._dispatch()
 
         except KeyboardInterrupt:
             self._keyboard_interrupt()
 
         self.stop()
 
+    def simulate(self, duration: float):
+        """
+        Run the scheduler on its VirtualClock, in the calling thread, until duration virtual seconds have passed.
+        Jobs are left where they are, so that simulate() can be called again to carry on - call stop() when done.
+
+        Parameters:
+            duration (float): Virtual seconds to simulate
+        """
+        if not isinstance(self._clock, VirtualClock):
+            raise RuntimeError("simulate() requires a scheduler on a VirtualClock")
+        if self._state == SchedulerState.STOPPED:
+            raise RuntimeError("Scheduler has been stopped")
+        self._event_loop.run_until_complete(self._simulate(self._clock.monotonic() + duration))
+
+    async def _simulate(self, until: float):
+        if self._async_wakeup is None:
+            self._async_wakeup = asyncio.Event()
+        if self._state != SchedulerState.ACTIVE:
+            self._errors_future = asyncio.run_coroutine_threadsafe(
+                self._errors.run(), self._event_loop
+            )
+            with self._wakeup:
+                self._rebase_dispatch_heap()
+                self._state = SchedulerState.ACTIVE
+        await self._dispatch_async(until)
+
+    async def _dispatch_async(self, until: float = math.inf):
+        """
+        Counterpart of _dispatch() as a task on the event loop - Until stopped or the clock reaches until
+        """
+        async_wakeup = t.cast(asyncio.Event, self._async_wakeup)
+        while self._state == SchedulerState.ACTIVE and self._clock.monotonic() < until:
+            async_wakeup.clear()
+            self._dispatch_cycle()
+            with self._wakeup:
+                if self._changed_job_ids or self._reload_requested:
+                    wait_time = 0.0
+                else:
+                    wait_time = min(self._next_wait_time(), until - self._clock.monotonic())
+            if wait_time <= 0:
+                # Let jobs dispatched this cycle get going before the next one
+                await asyncio.sleep(0)
+                continue
+            try:
+                async with asyncio.timeout(wait_time):
+                    await async_wakeup.wait()
+            except TimeoutError:
+                pass
+
     def stop(self):
         LOG.debug("Stopping..")
         self._state = SchedulerState.STOPPED
+        self._notify_wakeup()
+        if self._watchdog is not None:
+            self._watchdog.stop()
 
+        try:
+            self._stop_loops()
+        finally:
+            self._release_shared_executors()
+            self._remove_signal_handlers()
+            self._cancel_pending_tasks()
+            self.save_checkpoints()
+            # Emit anything reported after the drain task was cancelled
+            self._errors.drain()
+            LOG.info("Stopped - Scheuduler finished cleanup.")
+
+    def _remove_signal_handlers(self):
+        if self._signal_handlers_added and threading.current_thread() is threading.main_thread():
+            self._signal_handlers_added = False
+            remove_signal_handlers_from_loop(self._event_loop, logger=LOG)
+
+    def _release_shared_executors(self):
+        if self._holds_shared_executors:
+            self._holds_shared_executors = False
+            release_shared_executors()
+
+    @staticmethod
+    def _cancel_loop_tasks(loop: LoopType):
         try:
             cleanup_future = asyncio.run_coroutine_threadsafe(
-                cancel_residual_loop_tasks(loop=self._event_loop, logger=LOG), self._event_loop
+                cancel_residual_loop_tasks(loop=loop, logger=LOG), loop
             )
             LOG.debug("Waiting for 'cancel_residual_loop_tasks'")
             cleanup_future.result(timeout=5)
         except Exception as ex:
             LOG.warning("Cleanup coroutine failed or timed out: %s", ex)
+
+    def _stop_loops(self):
+        if self._loop_thread is None and not self._event_loop.is_running():
+            # Never started on a thread (e.g. only simulated) -> Clean up on this one
+            self._event_loop.run_until_complete(
+                cancel_residual_loop_tasks(loop=self._event_loop, logger=LOG)
+            )
+            self._futures.clear()
+            return
+        try:
+            self._cancel_loop_tasks(self._event_loop)
         finally:
             self._event_loop.call_soon_threadsafe(self._event_loop.stop)
             self._cleanup_thread()
-            LOG.info("Stopped - Scheuduler finished cleanup.")
@@ -0,0 +1,373 @@
+from __future__ import annotations
+import asyncio
+import bisect
+import functools
+import logging
+import os
+import threading
+import typing as t
+from enum import StrEnum
+
+from kvcommon.datastore import VersionedDatastore
+from kvcommon.logger import get_logger
+
+from ..utils import LoopType
+from ..utils import call_on_loop_thread
+from .clock import Clock
+from .clock import VirtualClock
+from .event_loop import cancel_residual_loop_tasks
+from .event_loop import start_async_loop
+from .groups import JobGroup
+from .job import Job
+from .metrics import MetricsSink
+from .reload import JobSource
+from .scheduler import JobScheduler
+from .scheduler import SchedulerState
+from .status import JobState
+from .timing import stable_hash
+from .watchdog import LoopWatchdog
+
+
+LOG = get_logger("kvc_scheduler")
+
+
+class ShardAssignment(StrEnum):
+    HASH = "hash"  # Consistent hash of job.id
+    LEAST_LOADED = "least_loaded"  # Shard with the fewest jobs (then lowest loop lag)
+
+
+class ConsistentHashRing:
+    """
+    Maps keys onto a fixed number of nodes, using virtual nodes to even out the distribution.
+    Stable across processes (unlike the builtin hash()).
+    """
+
+    _ring_hashes: t.List[int]
+    _ring_nodes: t.List[int]
+
+    def __init__(self, num_nodes: int, replicas: int = 64) -> None:
+        points = sorted(
+            (stable_hash(f"{node}:{replica}"), node)
+            for node in range(num_nodes)
+            for replica in range(replicas)
+        )
+        self._ring_hashes = [point[0] for point in points]
+        self._ring_nodes = [point[1] for point in points]
+
+    def get_node(self, key: str) -> int:
+        index = bisect.bisect(self._ring_hashes, stable_hash(key)) % len(self._ring_hashes)
+        return self._ring_nodes[index]
+
+
+class LoopShard:
+    """
+    An event loop running on its own thread, plus the ids of the jobs assigned to it.
+    """
+
+    index: int
+    loop: LoopType
+    thread: threading.Thread | None = None
+    job_ids: t.Set[str]
+    lag: float = 0.0  # Exponentially-weighted moving average of loop lag (seconds)
+
+    def __init__(self, index: int, loop: LoopType) -> None:
+        self.index = index
+        self.loop = loop
+        self.job_ids = set()
+
+    def __repr__(self) -> str:
+        return f"<LoopShard|{self.index}|Jobs:'{len(self.job_ids)}'|Lag:'{self.lag:.4f}'>"
+
+    async def monitor_lag(
+        self,
+        interval: float,
+        threshold: float,
+        on_lag: t.Callable[[LoopShard], None],
+        smoothing: float = 0.3,
+    ):
+        """
+        Measure how late a timer fires on this loop; a busy/blocked loop fires it late.
+        Costs one timer per interval regardless of the number of jobs on the shard.
+        """
+        loop = self.loop
+        while True:
+            expected = loop.time() + interval
+            await asyncio.sleep(interval)
+            lag = max(loop.time() - expected, 0.0)
+            self.lag += smoothing * (lag - self.lag)
+            if self.lag > threshold:
+                on_lag(self)
+
+
+class ShardedJobScheduler(JobScheduler):
+    """
+    A JobScheduler that spreads jobs across multiple event loops, each running on its own thread,
+    so that one slow coroutine or a burst of due jobs only delays the jobs on the same shard.
+
+    Jobs are moved off a shard (one per cooldown period) while its loop lag exceeds lag_threshold.
+
+    Parameters:
+        num_shards (int): Number of event loops/threads. Shard 0 uses the scheduler's main event loop.
+        assignment (ShardAssignment): Strategy for assigning jobs to shards
+        lag_threshold (float): Loop lag (seconds) above which a shard is considered overloaded
+        lag_probe_interval (float): How often (seconds) each shard measures its loop lag
+        rebalance_cooldown (float): Minimum time (seconds) between rebalancing moves
+        clock (Clock): Source of time for the scheduler, its shards and every job added to them.
+            A VirtualClock requires num_shards=1, as simulate() only drives the main event loop.
+
+    See JobScheduler for the remaining parameters.
+    """
+
+    _shards: t.List[LoopShard]
+    _ring: ConsistentHashRing
+    _assignment: ShardAssignment
+    _assignments: t.Dict[str, int]
+    _hot_shards: t.Set[int]
+    _lag_threshold: float
+    _lag_probe_interval: float
+    _rebalance_cooldown: float
+    _last_rebalance: float = 0.0
+
+    def __init__(
+        self,
+        num_shards: int | None = None,
+        assignment: ShardAssignment = ShardAssignment.HASH,
+        lag_threshold: float = 0.1,
+        lag_probe_interval: float = 0.5,
+        rebalance_cooldown: float = 5.0,
+        event_loop: LoopType | None = None,
+        log_level=logging.INFO,
+        debug_mode: bool = False,
+        phase_spread: bool = False,
+        start_jitter: float = 0.0,
+        error_queue_size: int = 1000,
+        checkpoint_store: VersionedDatastore | None = None,
+        checkpoint_interval: float = 5.0,
+        metrics_sink: MetricsSink | None = None,
+        clock: Clock | None = None,
+        loop_watchdog: LoopWatchdog | bool = True,
+        priority_queue: bool = True,
+        priority_aging: float = 1.0,
+        job_groups: t.Sequence[JobGroup] | None = None,
+        job_source: JobSource | None = None,
+    ) -> None:
+        if num_shards is None:
+            num_shards = os.cpu_count() or 2
+        if num_shards < 1:
+            raise ValueError("num_shards must be at least 1")
+        if isinstance(clock, VirtualClock) and num_shards > 1:
+            raise ValueError(
+                "A ShardedJobScheduler on a VirtualClock must have num_shards=1 - simulate() only drives the main loop"
+            )
+
+        self._shards = []
+        self._assignment = assignment
+        self._assignments = dict()
+        self._hot_shards = set()
+        self._lag_threshold = lag_threshold
+        self._lag_probe_interval = lag_probe_interval
+        self._rebalance_cooldown = rebalance_cooldown
+        self._ring = ConsistentHashRing(num_shards)
+
+        super().__init__(
+            event_loop=event_loop,
+            log_level=log_level,
+            debug_mode=debug_mode,
+            phase_spread=phase_spread,
+            start_jitter=start_jitter,
+            error_queue_size=error_queue_size,
+            checkpoint_store=checkpoint_store,
+            checkpoint_interval=checkpoint_interval,
+            metrics_sink=metrics_sink,
+            clock=clock,
+            loop_watchdog=loop_watchdog,
+            priority_queue=priority_queue,
+            priority_aging=priority_aging,
+            job_groups=job_groups,
+            job_source=job_source,
+        )
+
+        self._shards.append(LoopShard(0, self._event_loop))
+        for index in range(1, num_shards):
+            loop = t.cast(LoopType, asyncio.new_event_loop())
+            loop.set_debug(self._event_loop.get_debug())
+            self._shards.append(LoopShard(index, loop))
+
+    def toggle_debug_mode(self, new_state: bool | None = None):
+        super().toggle_debug_mode(new_state)
+        if self._debug_mode:
+            for shard in self._shards:
+                shard.loop.set_debug(True)
+
+    @property
+    def num_shards(self) -> int:
+        return len(self._shards)
+
+    @property
+    def shards(self) -> t.List[LoopShard]:
+        return list(self._shards)
+
+    def get_shard_index(self, job_or_id: Job | str) -> int | None:
+        if isinstance(job_or_id, Job):
+            job_or_id = job_or_id.id
+        return self._assignments.get(job_or_id, None)
+
+    def _choose_shard(self, job: Job) -> LoopShard:
+        if self._assignment == ShardAssignment.LEAST_LOADED:
+            return min(self._shards, key=lambda shard: (len(shard.job_ids), shard.lag))
+        return self._shards[self._ring.get_node(job.id)]
+
+    def _loop_for_job(self, job: Job) -> LoopType:
+        with self._wakeup:
+            shard_index = self._assignments.get(job.id, None)
+            if shard_index is None:
+                shard_index = self._choose_shard(job).index
+                self._assignments[job.id] = shard_index
+            shard = self._shards[shard_index]
+            shard.job_ids.add(job.id)
+            return shard.loop
+
+    def _on_job_untracked(self, job_id: str):
+        shard_index = self._assignments.pop(job_id, None)
+        if shard_index is not None:
+            self._shards[shard_index].job_ids.discard(job_id)
+
+    def _run_shard_thread(self, shard: LoopShard, ready_event: threading.Event):
+        try:
+            start_async_loop(shard.loop, ready_event, LOG)
+        finally:
+            self._notify_wakeup()
+
+    def _start_loop_threads(self):
+        for shard in self._shards:
+            ready_event = threading.Event()
+            shard.thread = threading.Thread(
+                target=self._run_shard_thread,
+                args=(shard, ready_event),
+                daemon=True,
+                name=f"kvc-shard-{shard.index}",
+            )
+            self._launch_loop_thread(shard.thread, ready_event)
+            asyncio.run_coroutine_threadsafe(
+                shard.monitor_lag(
+                    interval=self._lag_probe_interval,
+                    threshold=self._lag_threshold,
+                    on_lag=self._on_shard_lag,
+                ),
+                shard.loop,
+            )
+        self._loop_thread = self._shards[0].thread
+
+    def _loop_threads_alive(self) -> bool:
+        return all(shard.thread is not None and shard.thread.is_alive() for shard in self._shards)
+
+    def _on_shard_lag(self, shard: LoopShard):
+        # Invoked on the lagging shard's loop thread
+        with self._wakeup:
+            self._hot_shards.add(shard.index)
+            self._wakeup.notify()
+
+    def _after_dispatch_cycle(self):
+        with self._wakeup:
+            if not self._hot_shards:
+                return
+            now = self._clock.monotonic()
+            if now - self._last_rebalance < self._rebalance_cooldown:
+                return
+            hot_shards = [self._shards[index] for index in self._hot_shards]
+            self._hot_shards.clear()
+            self._last_rebalance = now
+
+        for hot_shard in hot_shards:
+            self._rebalance_shard(hot_shard)
+
+    def _rebalance_shard(self, hot_shard: LoopShard):
+        target = min(self._shards, key=lambda shard: shard.lag)
+        if target is hot_shard or target.lag >= self._lag_threshold:
+            # Nowhere better to move jobs to
+            return
+
+        with self._wakeup:
+            job_ids = list(hot_shard.job_ids)
+
+        for job_id in job_ids:
+            job = self._jobs_running.get(job_id, None)
+            # Moving a job mid-execution would interrupt it
+            if job is not None and not job.is_executing:
+                LOG.info(
+                    "Moving job '%s' from shard %s (lag: %.3fs) to shard %s (lag: %.3fs)",
+                    job_id,
+                    hot_shard.index,
+                    hot_shard.lag,
+                    target.index,
+                    target.lag,
+                )
+                self._migrate_job(job, hot_shard, target)
+                return
+
+    def _migrate_job(self, job: Job, source: LoopShard, target: LoopShard):
+        """
+        Move a running job to the target shard. The job is detached on the source shard's thread, where it can't
+        start executing in the meantime, and only restarted on the target once its old run loop has fully exited -
+        So that two threads never run the same Job at once.
+        """
+        call_on_loop_thread(source.loop, self._detach_job, job, target)
+
+    def _detach_job(self, job: Job, target: LoopShard):
+        # On the job's current loop thread
+        run_task = job.run_task
+        if run_task is None or run_task.done() or job.is_executing:
+            # Not started, already finishing, or started executing since it was picked - Leave it where it is
+            return
+        with self._wakeup:
+            if job.id not in self._futures:
+                return
+            self._futures.pop(job.id)
+            self._on_job_untracked(job.id)
+            self._assignments[job.id] = target.index
+        run_task.add_done_callback(functools.partial(self._restart_migrated_job, job))
+        run_task.cancel()
+
+    def _restart_migrated_job(self, job: Job, run_task: asyncio.Task):
+        # On the old loop thread, once the old run loop has exited
+        with self._wakeup:
+            self._jobs_running.pop(job.id, None)
+            if (
+                self._state != SchedulerState.ACTIVE
+                or self._jobs_all.get(job.id, None) is not job
+                or job.state == JobState.FINISHED
+            ):
+                # Stopped or removed while it was moving
+                self._on_job_untracked(job.id)
+                return
+        # Job.run keeps its schedule from JobStatus, so the restarted run carries on where it left off
+        self.run_job(job)
+
+    def _stop_loops(self):
+        if not any(shard.thread is not None for shard in self._shards):
+            # Never started on threads -> Clean up on this one, as JobScheduler does
+            for shard in self._shards:
+                if not shard.loop.is_closed():
+                    shard.loop.run_until_complete(
+                        cancel_residual_loop_tasks(loop=shard.loop, logger=LOG)
+                    )
+                if shard.index > 0 and not shard.loop.is_closed():
+                    shard.loop.close()
+            self._futures.clear()
+            return
+        try:
+            for shard in self._shards:
+                self._cancel_loop_tasks(shard.loop)
+        finally:
+            for shard in self._shards:
+                shard.loop.call_soon_threadsafe(shard.loop.stop)
+
+            LOG.debug("Cancelling lingering futures..")
+            self._cancel_all_futures()
+
+            LOG.debug("Cleaning up threads..")
+            for shard in self._shards:
+                if shard.thread and shard.thread.is_alive():
+                    shard.thread.join()
+                if shard.index > 0 and not (shard.loop.is_running() or shard.loop.is_closed()):
+                    shard.loop.close()
@@ -5,14 +5,22 @@ import logging
 import typing as t
 from enum import StrEnum
 
-from kvcommon.datetime import EPOCH
 from kvcommon.datetime import NEVER
-from kvcommon.datetime import utcnow
+from kvcommon.datetime import from_epoch_micros
+from kvcommon.datetime import to_epoch_micros
 from kvcommon.logger import get_logger
 
+from .checkpoint import JobCheckpoint
+from .clock import SYSTEM_CLOCK
+from .clock import Clock
+from .resilience import CircuitBreaker
+from .resilience import CircuitState
+
 
 LOG = get_logger("kvc_job")
 
+_NEVER_MICROS = to_epoch_micros(NEVER)
+
 
 class JobState(StrEnum):
     READY = "ready"
@@ -21,7 +29,7 @@ class JobState(StrEnum):
     FINISHED = "finished"
 
 
-@dataclasses.dataclass(kw_only=True)
+@dataclasses.dataclass(kw_only=True, slots=True)
 class TimeDifferential:
     late: bool = False
     delta: datetime.timedelta
@@ -35,19 +43,58 @@ class TimeDifferential:
 
 
 class JobStatus:
-    _executions: int = 0
-    # _max_executions: int | None = None
-    _delay: bool = False
-    _repeat: bool = False
-    _continue: bool = True
-    _stop_on_exception: bool = False
+    """
+    A job's state, counters and run times. Slotted, with run times held as microseconds since the epoch
+    (datetimes are only built when asked for), since there's one per registered job.
+    """
+
+    __slots__ = (
+        "_executions",
+        "_runs_skipped",
+        "_runs_coalesced",
+        "_runs_failed",
+        "_runs_timed_out",
+        "_runs_rejected",
+        "_runs_standby",
+        "_retries",
+        "_circuit_breaker",
+        "_clock",
+        "_delay",
+        "_repeat",
+        "_continue",
+        "_stop_on_exception",
+        "_interval",
+        "_current_state",
+        "_run_time_prev_us",
+        "_run_time_next_us",
+        "_run_time_first_us",
+        "_logger",
+        "_state_listeners",
+    )
+
+    _executions: int
+    _runs_skipped: int
+    _runs_coalesced: int
+    _runs_failed: int
+    _runs_timed_out: int
+    _runs_rejected: int
+    _runs_standby: int
+    _retries: int
+    _circuit_breaker: CircuitBreaker | None
+    _clock: Clock
+    # _max_executions: int | None
+    _delay: bool
+    _repeat: bool
+    _continue: bool
+    _stop_on_exception: bool
     _interval: datetime.timedelta
     # _max_duration: datetime.timedelta
-    _current_state: JobState = JobState.READY
-    _run_time_prev: datetime.datetime = NEVER
-    _run_time_next: datetime.datetime = NEVER
-    _run_time_first: datetime.datetime = NEVER
-    _logger: logging.Logger
+    _current_state: JobState
+    _run_time_prev_us: int
+    _run_time_next_us: int
+    _run_time_first_us: int
+    _logger: logging.Logger | logging.LoggerAdapter
+    _state_listeners: list[t.Callable[[JobState], None]]
 
     def __init__(
         self,
@@ -55,23 +102,40 @@ class JobStatus:
         delay: bool = False,
         repeat: bool = True,
         stop_on_exception: bool = False,
-        logger: logging.Logger = LOG
+        logger: logging.Logger | logging.LoggerAdapter = LOG,
+        clock: Clock = SYSTEM_CLOCK,
     ) -> None:
         if isinstance(interval, (int, float)):
             interval = datetime.timedelta(seconds=interval)
+        self._executions = 0
+        self._runs_skipped = 0
+        self._runs_coalesced = 0
+        self._runs_failed = 0
+        self._runs_timed_out = 0
+        self._runs_rejected = 0
+        self._runs_standby = 0
+        self._retries = 0
+        self._circuit_breaker = None
+        self._continue = True
+        self._current_state = JobState.READY
+        self._run_time_prev_us = _NEVER_MICROS
+        self._run_time_next_us = _NEVER_MICROS
+        self._run_time_first_us = _NEVER_MICROS
         self._interval = interval
         self._repeat = repeat
         self._delay = delay
         self._stop_on_exception = stop_on_exception
         self._logger = logger
+        self._clock = clock
+        self._state_listeners = []
 
     def __repr__(self) -> str:
         return f"<JobStatus|{self.__str__()}>"
 
     def __str__(self) -> str:
         out = f"Runs:'{self._executions}'"
-        f"|Prev:'{self._run_time_prev.isoformat()}'"
-        f"|Next:'{self._run_time_next.isoformat()}'"
+        f"|Prev:'{self.run_time_prev.isoformat()}'"
+        f"|Next:'{self.run_time_next.isoformat()}'"
         return out
 
     @property
@@ -94,6 +158,10 @@ class JobStatus:
     def periodic(self) -> bool:
         return self._repeat
 
+    @property
+    def clock(self) -> Clock:
+        return self._clock
+
     @property
     def state(self) -> JobState:
         return self._current_state
@@ -102,33 +170,93 @@ class JobStatus:
     def interval(self) -> datetime.timedelta:
         return self._interval
 
+    def set_interval(self, interval: datetime.timedelta):
+        self._interval = interval
+
     @property
     def execution_count(self) -> int:
         return self._executions
 
+    @property
+    def skipped_count(self) -> int:
+        """
+        Scheduled runs that were dropped by the job's OverlapPolicy
+        """
+        return self._runs_skipped
+
+    @property
+    def coalesced_count(self) -> int:
+        """
+        Scheduled runs that were folded into another (catch-up) run by the job's OverlapPolicy
+        """
+        return self._runs_coalesced
+
+    @property
+    def failure_count(self) -> int:
+        """
+        Runs that raised an exception (including those that timed out)
+        """
+        return self._runs_failed
+
+    @property
+    def timeout_count(self) -> int:
+        return self._runs_timed_out
+
+    @property
+    def retry_count(self) -> int:
+        """
+        Attempts made by a RetryPolicy after a failed attempt
+        """
+        return self._retries
+
+    @property
+    def rejected_count(self) -> int:
+        """
+        Scheduled runs that were not executed because the job's circuit breaker was open
+        """
+        return self._runs_rejected
+
+    @property
+    def standby_count(self) -> int:
+        """
+        Scheduled runs that were not executed because another replica holds the job's lease
+        """
+        return self._runs_standby
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        return self._circuit_breaker
+
+    @property
+    def circuit_state(self) -> CircuitState | None:
+        if self._circuit_breaker is None:
+            return None
+        return self._circuit_breaker.state
+
     @property
     def has_run(self) -> bool:
         return self._executions >= 1
 
     @property
     def is_due(self) -> bool:
-        return utcnow() > self._run_time_next
+        return to_epoch_micros(self._clock.now()) > self._run_time_next_us
 
     @property
     def is_late(self) -> bool:
-        return utcnow() > (self._run_time_next + self._interval)
+        return self._clock.now() > (self.run_time_next + self._interval)
 
     @property
     def time_differential(self) -> TimeDifferential:
         """
         Returns the time before (ready) / after (late) this job is next scheduled to run
         """
-        now = utcnow()
-        if now <= self._run_time_next:
-            delta = self._run_time_next - now
+        now = self._clock.now()
+        run_time_next = self.run_time_next
+        if now <= run_time_next:
+            delta = run_time_next - now
             late = False
         else:
-            delta = now - self._run_time_prev
+            delta = now - self.run_time_prev
             late = True
         return TimeDifferential(late=late, delta=delta)
 
@@ -148,47 +276,117 @@ class JobStatus:
 
     @property
     def run_time_first(self) -> datetime.datetime:
-        return self._run_time_first
+        return from_epoch_micros(self._run_time_first_us)
 
     @property
     def run_time_prev(self) -> datetime.datetime:
-        return self._run_time_prev
+        return from_epoch_micros(self._run_time_prev_us)
 
     @property
     def run_time_next(self) -> datetime.datetime:
-        return self._run_time_next
+        return from_epoch_micros(self._run_time_next_us)
+
+    def add_state_listener(self, callback: t.Callable[[JobState], None]):
+        """
+        Register a callback to be invoked with the new JobState whenever the state changes.
+        Callbacks may be invoked from whichever thread changed the state.
+        """
+        self._state_listeners.append(callback)
+
+    def _set_state(self, new_state: JobState):
+        if self._current_state == new_state:
+            return
+        self._current_state = new_state
+        for callback in self._state_listeners:
+            try:
+                callback(new_state)
+            except Exception as ex:
+                self.LOG.error("State listener raised: '%s' - %s", type(ex).__name__, ex)
 
     def start(self):
-        self._current_state = JobState.ACTIVE
+        self._set_state(JobState.ACTIVE)
 
     def pause(self):
-        self._current_state = JobState.SUSPENDED
+        self._set_state(JobState.SUSPENDED)
         # self._continue = False
 
     def stop(self):
-        self._current_state = JobState.FINISHED
         self._continue = False
+        self._set_state(JobState.FINISHED)
 
     def _ensure_first_run_time(self, dt: datetime.datetime | None):
-        if self._run_time_first == NEVER:
+        if self._run_time_first_us == _NEVER_MICROS:
             if not dt:
-                dt = utcnow()
-            self._run_time_first = dt
+                dt = self._clock.now()
+            self._run_time_first_us = to_epoch_micros(dt)
 
     def _update_prev_run_time(self, dt: datetime.datetime | None):
         if not dt:
-            dt = utcnow()
-        self._run_time_prev = dt
-
-    def record_run(self, current_run_time: datetime.datetime, next_run_time: datetime.datetime, any_exceptions: bool = False):
+            dt = self._clock.now()
+        self._run_time_prev_us = to_epoch_micros(dt)
+
+    def record_skipped(self, count: int = 1):
+        self._runs_skipped += count
+
+    def record_coalesced(self, count: int = 1):
+        self._runs_coalesced += count
+
+    def record_retry(self):
+        self._retries += 1
+
+    def record_rejected(self):
+        self._runs_rejected += 1
+
+    def record_standby(self):
+        self._runs_standby += 1
+
+    def to_checkpoint(self) -> JobCheckpoint:
+        return JobCheckpoint(
+            run_time_first=self.run_time_first,
+            run_time_prev=self.run_time_prev,
+            run_time_next=self.run_time_next,
+            executions=self._executions,
+            skipped=self._runs_skipped,
+            coalesced=self._runs_coalesced,
+            failed=self._runs_failed,
+            timed_out=self._runs_timed_out,
+            retries=self._retries,
+            rejected=self._runs_rejected,
+        )
+
+    def restore_checkpoint(self, checkpoint: JobCheckpoint):
+        self._run_time_first_us = to_epoch_micros(checkpoint.run_time_first)
+        self._run_time_prev_us = to_epoch_micros(checkpoint.run_time_prev)
+        self._run_time_next_us = to_epoch_micros(checkpoint.run_time_next)
+        self._executions = checkpoint.executions
+        self._runs_skipped = checkpoint.skipped
+        self._runs_coalesced = checkpoint.coalesced
+        self._runs_failed = checkpoint.failed
+        self._runs_timed_out = checkpoint.timed_out
+        self._retries = checkpoint.retries
+        self._runs_rejected = checkpoint.rejected
+
+    def record_run(
+        self,
+        current_run_time: datetime.datetime,
+        next_run_time: datetime.datetime,
+        any_exceptions: bool = False,
+        timed_out: bool = False,
+    ):
         self._executions += 1
+        if any_exceptions or timed_out:
+            self._runs_failed += 1
+        if timed_out:
+            self._runs_timed_out += 1
         if self.execution_count <= 1:
             self._ensure_first_run_time(current_run_time)
         self._update_prev_run_time(current_run_time)
-        self._run_time_next = next_run_time
+        self._run_time_next_us = to_epoch_micros(next_run_time)
 
         log_str = "Execution completed"
-        if any_exceptions:
+        if timed_out:
+            log_str = f"{log_str} (TIMED OUT)"
+        elif any_exceptions:
             log_str = f"{log_str} (with ERRORS)"
         if self.periodic:
             log_str = f"{log_str} - Cycles: {self.execution_count}"
@@ -0,0 +1,45 @@
+from __future__ import annotations
+import asyncio
+import typing as t
+from concurrent.futures import Future
+
+
+class TaskRecord:
+    """
+    An anonymous one-shot task submitted via JobScheduler.submit(): The call to make and the future for its result.
+    Stands in for a Job when the task's error is reported, under an ID shared by every task of the same func -
+    So that per-task cost stays constant and error rates are grouped by func rather than growing per task.
+    """
+
+    __slots__ = ("func", "args", "kwargs", "future", "task")
+
+    func: t.Callable
+    args: t.Tuple
+    kwargs: t.Dict[str, t.Any]
+    future: Future | asyncio.Future
+    task: asyncio.Future | None
+
+    def __init__(
+        self,
+        func: t.Callable,
+        args: t.Tuple,
+        kwargs: t.Dict[str, t.Any],
+        future: Future | asyncio.Future | None = None,
+    ) -> None:
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.future = Future() if future is None else future
+        # The task/executor future running it, once started on the event loop
+        self.task = None
+
+    def __repr__(self) -> str:
+        return f"<TaskRecord|{self.id}>"
+
+    @property
+    def id(self) -> str:
+        return task_id(self.func)
+
+
+def task_id(func: t.Callable) -> str:
+    return f"task:{getattr(func, '__qualname__', type(func).__name__)}"
@@ -0,0 +1,28 @@
+import hashlib
+import random
+
+
+def stable_hash(key: str) -> int:
+    """
+    64-bit hash of a string that is stable across processes (unlike the builtin hash())
+    """
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+def phase_offset(key: str, period_seconds: float) -> float:
+    """
+    Deterministic offset in [0, period_seconds) derived from key.
+    Spreads many same-period jobs evenly across their period instead of starting them all at once.
+    """
+    if period_seconds <= 0:
+        return 0.0
+    return (stable_hash(key) / 2**64) * period_seconds
+
+
+def random_delay(max_seconds: float) -> float:
+    """
+    Random delay in [0, max_seconds)
+    """
+    if max_seconds <= 0:
+        return 0.0
+    return random.uniform(0, max_seconds)
@@ -0,0 +1,295 @@
+from __future__ import annotations
+import asyncio
+import bisect
+import collections
+import concurrent.futures
+import dataclasses
+import datetime
+import itertools
+import sys
+import threading
+import time
+import traceback
+import typing as t
+
+from kvcommon.datetime import utcnow
+from kvcommon.logger import get_logger
+
+from ..utils import LoopType
+
+
+LOG = get_logger("kvc_watchdog")
+
+# Upper bounds (seconds) of the loop lag histogram's buckets - Prometheus-style, plus an implicit +Inf
+DEFAULT_LAG_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LagHistogram:
+    """
+    Thread-safe histogram of loop lag samples (seconds) with fixed bucket upper bounds
+
+    Parameters:
+        buckets (sequence of float): Ascending bucket upper bounds. Samples above the last go in a +Inf bucket.
+    """
+
+    _bounds: t.Tuple[float, ...]
+    _counts: t.List[int]
+    _count: int = 0
+    _sum: float = 0.0
+    _max: float = 0.0
+    _lock: threading.Lock
+
+    def __init__(self, buckets: t.Sequence[float] = DEFAULT_LAG_BUCKETS) -> None:
+        bounds = tuple(buckets)
+        if not bounds or list(bounds) != sorted(set(bounds)):
+            raise ValueError("Buckets must be a non-empty ascending sequence")
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value
+            if value > self._max:
+                self._max = value
+
+    def snapshot(self) -> t.Dict[float, int]:
+        """
+        Cumulative count of samples <= each bucket's upper bound (the last bound being +Inf)
+        """
+        with self._lock:
+            counts = list(self._counts)
+        return dict(zip(self._bounds + (float("inf"),), itertools.accumulate(counts)))
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the q-th quantile (0 < q <= 1) - e.g. quantile(0.99) for p99 lag.
+        Returns the largest sample seen if it falls in the +Inf bucket, or 0.0 with no samples.
+        """
+        if not 0 < q <= 1:
+            raise ValueError("q must be in (0, 1]")
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            largest = self._max
+        if total == 0:
+            return 0.0
+        rank = q * total
+        for bound, cumulative in zip(self._bounds, itertools.accumulate(counts)):
+            if cumulative >= rank:
+                return bound
+        return largest
+
+
+@dataclasses.dataclass(kw_only=True, frozen=True, slots=True)
+class LoopStall:
+    """
+    A period for which the event loop didn't respond, and what it was doing at the time.
+
+    Parameters:
+        detected_at (datetime.datetime): When the watchdog noticed the stall
+        duration (float): Seconds the loop was unresponsive for
+        task_name (str): Name of the task running on the loop - "job:<id>" for a job, "task:<func>" for a
+            submitted task. None if the loop was blocked outside of any task (e.g. in a callback)
+        stack (tuple of str): Innermost frames of the loop thread ("file:line in func"), innermost last
+    """
+
+    detected_at: datetime.datetime
+    duration: float
+    task_name: str | None = None
+    stack: t.Tuple[str, ...] = ()
+
+    @property
+    def location(self) -> str | None:
+        """
+        Where the loop thread was blocked - The innermost frame
+        """
+        return self.stack[-1] if self.stack else None
+
+
+class LoopWatchdog:
+    """
+    Always-on, low-overhead monitor of an event loop's responsiveness - Cheap enough for production,
+    unlike asyncio debug mode.
+
+    A probe task on the loop measures how late a timer fires every interval (the loop lag) into a histogram.
+    A watchdog thread notices when the probe is overdue by more than stall_threshold, and samples what the loop
+    thread is doing at that moment - the running task and its stack - to pin the stall on the sync code
+    responsible. Costs one timer per interval on the loop, and one wake-up per stall_threshold/2 on the thread.
+
+    Parameters:
+        interval (float): Seconds between probes
+        stall_threshold (float): Seconds beyond its due time that the probe must be overdue to count as a stall
+        buckets (sequence of float): Bucket upper bounds (seconds) of the lag histogram
+        max_stalls (int): Number of recent stalls kept
+        stack_depth (int): Number of innermost frames captured per stall
+        on_lag (callable): Called on the loop thread with each lag sample (seconds) - e.g. Histogram.observe
+        on_stall (callable): Called on the watchdog thread with each LoopStall once the loop responds again
+    """
+
+    _interval: float = 0.1
+    _stall_threshold: float = 0.1
+    _histogram: LagHistogram
+    _stalls: collections.deque[LoopStall]
+    _stall_count: int = 0
+    _stack_depth: int = 8
+    _on_lag: t.Callable[[float], None] | None = None
+    _on_stall: t.Callable[[LoopStall], None] | None = None
+    _loop: LoopType | None = None
+    _loop_thread_id: int | None = None
+    _probe_future: concurrent.futures.Future | None = None
+    _thread: threading.Thread | None = None
+    _stopped: threading.Event
+    _probe_due: float = 0.0
+    _last_lag: float = 0.0
+    # Largest lag seen since the pending stall was detected
+    _stall_lag: float = 0.0
+    _pending_stall: LoopStall | None = None
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        stall_threshold: float = 0.1,
+        buckets: t.Sequence[float] = DEFAULT_LAG_BUCKETS,
+        max_stalls: int = 100,
+        stack_depth: int = 8,
+        on_lag: t.Callable[[float], None] | None = None,
+        on_stall: t.Callable[[LoopStall], None] | None = None,
+    ) -> None:
+        if interval <= 0 or stall_threshold <= 0:
+            raise ValueError("interval and stall_threshold must be positive")
+        self._interval = interval
+        self._stall_threshold = stall_threshold
+        self._histogram = LagHistogram(buckets)
+        self._stalls = collections.deque(maxlen=max_stalls)
+        self._stack_depth = stack_depth
+        self._on_lag = on_lag
+        self._on_stall = on_stall
+        self._stopped = threading.Event()
+
+    @property
+    def histogram(self) -> LagHistogram:
+        return self._histogram
+
+    @property
+    def stall_count(self) -> int:
+        return self._stall_count
+
+    @property
+    def stalls(self) -> t.List[LoopStall]:
+        """
+        The most recent stalls, oldest first
+        """
+        return list(self._stalls)
+
+    @property
+    def last_lag(self) -> float:
+        return self._last_lag
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, loop: LoopType):
+        """
+        Start monitoring a running (or about to run) event loop. Safe to call from any thread.
+        """
+        if self.running:
+            return
+        self._loop = loop
+        self._stopped.clear()
+        self._probe_due = time.monotonic() + self._interval + self._stall_threshold
+        self._probe_future = asyncio.run_coroutine_threadsafe(self._probe(), loop)
+        self._thread = threading.Thread(target=self._watch, daemon=True, name="kvc-loop-watchdog")
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._probe_future is not None:
+            self._probe_future.cancel()
+            self._probe_future = None
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=1)
+        self._thread = None
+
+    async def _probe(self):
+        current_task = asyncio.current_task()
+        if current_task is not None:
+            current_task.set_name("kvc-loop-watchdog")
+        self._loop_thread_id = threading.get_ident()
+        while True:
+            expected = time.monotonic() + self._interval
+            self._probe_due = expected
+            await asyncio.sleep(self._interval)
+            lag = max(time.monotonic() - expected, 0.0)
+            self._last_lag = lag
+            self._stall_lag = max(self._stall_lag, lag)
+            self._histogram.observe(lag)
+            if self._on_lag is not None:
+                try:
+                    self._on_lag(lag)
+                except Exception as ex:
+                    LOG.error("Loop lag callback raised: '%s' - %s", type(ex).__name__, ex)
+
+    def _watch(self):
+        while not self._stopped.wait(self._stall_threshold / 2):
+            overdue = time.monotonic() - self._probe_due
+            if overdue > self._stall_threshold:
+                if self._pending_stall is None:
+                    self._stall_lag = 0.0
+                    self._pending_stall = self._sample_stall()
+            elif self._pending_stall is not None:
+                # The probe ran again, so the loop has recovered
+                self._finish_stall(self._pending_stall)
+                self._pending_stall = None
+
+    def _sample_stall(self) -> LoopStall:
+        loop = self._loop
+        task_name = None
+        if loop is not None:
+            task = asyncio.current_task(loop)
+            if task is not None:
+                task_name = task.get_name()
+        stack: t.Tuple[str, ...] = ()
+        frame = (
+            sys._current_frames().get(self._loop_thread_id)
+            if self._loop_thread_id is not None
+            else None
+        )
+        if frame is not None:
+            stack = tuple(
+                f"{summary.filename}:{summary.lineno} in {summary.name}"
+                for summary in traceback.extract_stack(frame, limit=self._stack_depth)
+            )
+        return LoopStall(detected_at=utcnow(), duration=0.0, task_name=task_name, stack=stack)
+
+    def _finish_stall(self, stall: LoopStall):
+        stall = dataclasses.replace(stall, duration=max(self._stall_lag, self._stall_threshold))
+        self._stalls.append(stall)
+        self._stall_count += 1
+        LOG.warning(
+            "Event loop blocked for %.3fs - Task: '%s' at: %s",
+            stall.duration,
+            stall.task_name,
+            stall.location,
+        )
+        if self._on_stall is not None:
+            try:
+                self._on_stall(stall)
+            except Exception as ex:
+                LOG.error("Loop stall callback raised: '%s' - %s", type(ex).__name__, ex)
@@ -1,45 +1,159 @@
 import asyncio
 import functools
 import inspect
+import sys
 import typing as t
+import weakref
 from asyncio import AbstractEventLoop
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from enum import StrEnum
 
 from kvcommon.logger import get_logger
 
+from .executors import get_executor
+from .executors import reset_shared_process_pool
+
 
 LoopType = asyncio.BaseEventLoop  # AbstractEventLoop is too abstract for code introspection
 
 
 LOG = get_logger("kvc_async")
 
+# Eagerly-started tasks run synchronously until their first suspension, skipping a loop cycle if they never suspend.
+# Needs Task(eager_start=True) - On Python 3.11, eager=True tasks are regular tasks.
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
+
+class CallableKind(StrEnum):
+    """
+    How a callable gets run
+    """
+
+    COROUTINE_FUNCTION = "coroutine_function"  # Called, and the coroutine awaited on the event loop
+    AWAITABLE = "awaitable"  # Already a coroutine (or other awaitable) - Awaited as-is, once
+    SYNC = "sync"  # Called on an executor
+
+
+# Keyed by the underlying function, so that fresh bound methods/partials of an already-classified one are cache hits
+_CALLABLE_KINDS: weakref.WeakKeyDictionary[t.Callable, CallableKind] = weakref.WeakKeyDictionary()
+
+
+def classify_callable(func: t.Callable | t.Awaitable) -> CallableKind:
+    """
+    How func should be run. Sees through partials, bound methods and callable instances (by their class' __call__),
+    and caches the result per underlying function so that repeat calls skip the introspection.
+
+    raises: `TypeError` if func is neither callable nor awaitable
+    """
+    while isinstance(func, functools.partial):
+        func = func.func
+    if inspect.ismethod(func):
+        func = func.__func__
+    elif inspect.isclass(func):
+        # Calling a class constructs an instance
+        return CallableKind.SYNC
+    elif not callable(func):
+        if inspect.isawaitable(func):
+            return CallableKind.AWAITABLE
+        raise TypeError(f"Expected a callable or awaitable, got: {type(func).__name__}")
+    elif not (inspect.isfunction(func) or inspect.isbuiltin(func)):
+        func = type(func).__call__
+
+    try:
+        return _CALLABLE_KINDS[func]
+    except (KeyError, TypeError):
+        pass
+    kind = (
+        CallableKind.COROUTINE_FUNCTION if inspect.iscoroutinefunction(func) else CallableKind.SYNC
+    )
+    try:
+        _CALLABLE_KINDS[func] = kind
+    except TypeError:
+        # Not weak-referenceable (e.g. a builtin) - Cheap to classify again
+        pass
+    return kind
+
+
+def create_task(
+    loop: AbstractEventLoop, coro: t.Coroutine, name: str | None = None, eager: bool = False
+) -> asyncio.Task:
+    """
+    loop.create_task(), optionally started eagerly: Run synchronously up to its first suspension, so that a coroutine
+    that finishes without ever suspending (e.g. on a cache hit) costs no trip through the loop.
+
+    Eager start needs Python 3.12+. On 3.11, eager is ignored and a regular task is created, so the fast path does
+    nothing there. It isn't emulated by stepping the coroutine by hand, because that first step would run with no
+    current task, which breaks asyncio.timeout() and asyncio.current_task() in the coroutine.
+    """
+    if eager and _EAGER_TASKS:
+        return asyncio.Task(coro, loop=loop, name=name, eager_start=True)  # type: ignore[call-arg]
+    return loop.create_task(coro, name=name)
+
 
 async def call_sync_async(
     func: t.Callable,
     func_args: t.Tuple | None = None,
     func_kwargs: t.Dict | None = None,
     loop: AbstractEventLoop | None = None,
+    executor: Executor | str | None = None,
 ):
     """
-    Push a synchronous function to ThreadPoolExecutor with kwargs support
+    Push a synchronous function to an executor with kwargs support.
+    executor may be given by name (see executors.register_executor/create_thread_pool).
+    Uses the loop's default ThreadPoolExecutor if executor is None.
     """
     loop = asyncio.get_running_loop() if loop is None else loop
+    if isinstance(executor, str):
+        executor = get_executor(executor)
     func_args = tuple() if func_args is None else func_args
     func_kwargs = dict() if func_kwargs is None else func_kwargs
 
     partial_func = functools.partial(func, *func_args, **func_kwargs)
-    return await loop.run_in_executor(None, partial_func)
+    try:
+        return await loop.run_in_executor(executor, partial_func)
+    except BrokenProcessPool:
+        # A worker died - Discard the pool so that subsequent calls get a fresh one
+        if isinstance(executor, ProcessPoolExecutor):
+            reset_shared_process_pool(executor)
+        raise
 
 
 async def run_callable_safely(loop: LoopType, func: t.Callable | t.Coroutine, *args: t.Tuple, **kwargs):
     """
-    Runs an async function directly or pushes a sync function to the ThreadPoolExecutor.
+    Runs any kind of callable (see classify_callable): Awaits coroutine functions and awaitables on the loop, and
+    pushes anything else to the loop's default ThreadPoolExecutor. A sync callable's awaitable result is awaited too.
     """
+    kind = classify_callable(func)
+    if kind == CallableKind.COROUTINE_FUNCTION:
+        return await func(*args, **kwargs)
+    if kind == CallableKind.AWAITABLE:
+        if args or kwargs:
+            raise TypeError("Arguments can't be passed to an awaitable")
+        return await func
+
+    value = await call_sync_async(func=func, func_args=args, func_kwargs=kwargs, loop=loop)
+    if inspect.isawaitable(value):
+        # e.g. a lambda wrapping a coroutine function
+        return await value
+    return value
+
 
-    if inspect.isfunction(func):
-        if inspect.iscoroutinefunction(func):
-            return await func(*args, **kwargs)
+def is_loop_thread(loop: AbstractEventLoop) -> bool:
+    """Checks if loop is the event loop running in the current thread."""
+    return asyncio._get_running_loop() is loop
 
-        return await call_sync_async(func=func, func_args=args, func_kwargs=kwargs, loop=loop)
+
+def call_on_loop_thread(loop: AbstractEventLoop, callback: t.Callable, *args):
+    """
+    Call callback(*args) on loop's thread: Right away if already on it - sparing call_soon_threadsafe's wake-up of
+    the loop - otherwise scheduled there. Only for callbacks that are safe to call synchronously (e.g. setting a flag).
+    """
+    if is_loop_thread(loop):
+        callback(*args)
+    else:
+        loop.call_soon_threadsafe(callback, *args)
 
 
 def is_running_async():
@@ -4,6 +4,19 @@ import typing as t
 EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
 NEVER = datetime.datetime(3000, 1, 1, tzinfo=datetime.timezone.utc)
 
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
 
 def utcnow() -> datetime.datetime:
     return datetime.datetime.now(tz=datetime.UTC)
+
+
+def to_epoch_micros(dt: datetime.datetime) -> int:
+    """
+    Microseconds since EPOCH for a timezone-aware datetime - An exact, compact stand-in for storing it
+    """
+    return (dt - EPOCH) // _MICROSECOND
+
+
+def from_epoch_micros(micros: int) -> datetime.datetime:
+    return EPOCH + datetime.timedelta(microseconds=micros)
@@ -1,10 +1,15 @@
 import typing as t
 
 from kvcommon.asynchronous.jobs.metrics import JobTimer
+from kvcommon.asynchronous.jobs.metrics import RunMetrics
+from kvcommon.asynchronous.jobs.watchdog import DEFAULT_LAG_BUCKETS
+from kvcommon.asynchronous.jobs.watchdog import LoopStall
+from kvcommon.asynchronous.jobs.watchdog import LoopWatchdog
 
 
 from . import PROMETHEUS_AVAILABLE
 if PROMETHEUS_AVAILABLE:
+    from prometheus_client import Counter
     from prometheus_client import Histogram
     from prometheus_client import Summary
     from kvcommon.prometheus import RobustSummary
@@ -12,17 +17,79 @@ if PROMETHEUS_AVAILABLE:
 
 
 class JobTimerPrometheus(JobTimer):
+    """
+    Observes successful runs' execution time (seconds) in metric. Optionally also observes every run's
+    scheduling lag and executor queue wait, to tell a slow loop or starved pool apart from a slow job.
+    If queue_metric has a "priority" label, queue wait is observed per priority class (see JobPriority).
+    """
+
     _metric: Histogram | Summary
-    _start_time: float | None = None
+    _lag_metric: Histogram | Summary | None = None
+    _queue_metric: Histogram | Summary | None = None
 
     def __init__(
             self,
             metric: Histogram | Summary | RobustHistogram | RobustSummary,
-            start_callback: t.Callable | None = None
+            start_callback: t.Callable | None = None,
+            lag_metric: Histogram | Summary | RobustHistogram | RobustSummary | None = None,
+            queue_metric: Histogram | Summary | RobustHistogram | RobustSummary | None = None,
         ) -> None:
         self._metric = metric
+        self._lag_metric = lag_metric
+        self._queue_metric = queue_metric
 
         def callback_stop(duration: float):
             metric.observe(duration)
 
         super().__init__(stop_callback=callback_stop, start_callback=start_callback)
+
+    def record(self, metrics: RunMetrics) -> None:
+        super().record(metrics)
+        if self._lag_metric is not None:
+            self._lag_metric.observe(max(metrics.scheduling_lag, 0.0))
+        queue_metric = self._queue_metric
+        if queue_metric is not None:
+            if "priority" in getattr(queue_metric, "_labelnames", ()):
+                queue_metric = queue_metric.labels(priority=str(int(metrics.priority)))
+            queue_metric.observe(metrics.queue_wait)
+
+
+class LoopWatchdogPrometheus(LoopWatchdog):
+    """
+    LoopWatchdog that observes every loop lag sample in lag_metric and counts stalls in stall_metric.
+    If stall_metric has a "task" label, stalls are counted per task name (e.g. "job:<id>").
+
+    See LoopWatchdog for the remaining parameters.
+    """
+
+    _lag_metric: Histogram | Summary
+    _stall_metric: Counter | None = None
+
+    def __init__(
+            self,
+            lag_metric: Histogram | Summary | RobustHistogram | RobustSummary,
+            stall_metric: Counter | None = None,
+            interval: float = 0.1,
+            stall_threshold: float = 0.1,
+            buckets: t.Sequence[float] = DEFAULT_LAG_BUCKETS,
+            max_stalls: int = 100,
+        ) -> None:
+        self._lag_metric = lag_metric
+        self._stall_metric = stall_metric
+        super().__init__(
+            interval=interval,
+            stall_threshold=stall_threshold,
+            buckets=buckets,
+            max_stalls=max_stalls,
+            on_lag=lag_metric.observe,
+            on_stall=self._count_stall,
+        )
+
+    def _count_stall(self, stall: LoopStall):
+        metric = self._stall_metric
+        if metric is None:
+            return
+        if "task" in getattr(metric, "_labelnames", ()):
+            metric.labels(task=stall.task_name or "unknown").inc()
+        else:
+            metric.inc()
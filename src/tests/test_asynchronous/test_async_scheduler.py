@@ -0,0 +1,76 @@
+import asyncio
+import threading
+
+import pytest
+
+from kvcommon.asynchronous.jobs import AsyncJobScheduler
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs.job import JobParams
+
+
+async def tick():
+    pass
+
+
+async def double(value: int) -> int:
+    return value * 2
+
+
+def periodic(id: str, interval: float = 0.01) -> PeriodicJob:
+    return PeriodicJob(JobParams(func=tick, id=id, interval=interval))
+
+
+class Test_AsyncJobScheduler:
+
+    def test_runs_jobs_on_the_current_loop(self):
+        job = periodic("a")
+
+        async def main():
+            threads_before = threading.active_count()
+            async with AsyncJobScheduler() as scheduler:
+                scheduler.add_job(job)
+                await asyncio.sleep(0.1)
+                assert threading.active_count() == threads_before
+                assert scheduler.count_jobs_running == 1
+            return scheduler
+
+        scheduler = asyncio.run(main())
+        assert job.status.execution_count >= 3
+        assert scheduler._futures == {}
+
+    def test_submit_returns_awaitable_futures(self):
+        async def main():
+            async with AsyncJobScheduler() as scheduler:
+                future = scheduler.submit(double, 21)
+                assert isinstance(future, asyncio.Future)
+                assert await future == 42
+                results = await asyncio.gather(*scheduler.submit_many(double, [(1,), (2,), (3,)]))
+                assert results == [2, 4, 6]
+                pending = scheduler.submit(asyncio.sleep, 60)
+            return pending
+
+        assert asyncio.run(main()).cancelled()
+
+    def test_serve_until_stopped(self):
+        job = periodic("a")
+
+        async def main():
+            scheduler = AsyncJobScheduler()
+            scheduler.add_job(job)
+            asyncio.get_running_loop().call_later(0.1, scheduler.stop)
+            await asyncio.wait_for(scheduler.serve(), timeout=2)
+            with pytest.raises(RuntimeError):
+                await scheduler.serve()
+
+        asyncio.run(main())
+        assert job.status.execution_count >= 3
+
+    def test_misuse(self):
+        scheduler = AsyncJobScheduler()
+        with pytest.raises(RuntimeError):
+            scheduler.start()
+        with pytest.raises(RuntimeError):
+            scheduler.submit(double, 1)
+        with pytest.raises(ValueError):
+            AsyncJobScheduler(clock=VirtualClock())
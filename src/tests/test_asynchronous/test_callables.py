@@ -0,0 +1,146 @@
+import asyncio
+import functools
+
+import pytest
+
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs.job import JobFunc
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.asynchronous.utils import _CALLABLE_KINDS
+from kvcommon.asynchronous.utils import _EAGER_TASKS
+from kvcommon.asynchronous.utils import CallableKind
+from kvcommon.asynchronous.utils import classify_callable
+from kvcommon.asynchronous.utils import create_task
+from kvcommon.asynchronous.utils import run_callable_safely
+
+
+async def add_async(a: int, b: int) -> int:
+    return a + b
+
+
+def add_sync(a: int, b: int) -> int:
+    return a + b
+
+
+class Adder:
+    def add(self, a: int, b: int) -> int:
+        return a + b
+
+    async def add_async(self, a: int, b: int) -> int:
+        return a + b
+
+
+class AsyncCallable:
+    async def __call__(self, a: int, b: int) -> int:
+        return a + b
+
+
+class SyncCallable:
+    def __call__(self, a: int, b: int) -> int:
+        return a + b
+
+
+class Test_ClassifyCallable:
+
+    @pytest.mark.parametrize(
+        "func, kind",
+        [
+            (add_async, CallableKind.COROUTINE_FUNCTION),
+            (add_sync, CallableKind.SYNC),
+            (Adder().add, CallableKind.SYNC),
+            (Adder().add_async, CallableKind.COROUTINE_FUNCTION),
+            (functools.partial(add_async, 1), CallableKind.COROUTINE_FUNCTION),
+            (functools.partial(functools.partial(add_sync, 1), 2), CallableKind.SYNC),
+            (AsyncCallable(), CallableKind.COROUTINE_FUNCTION),
+            (SyncCallable(), CallableKind.SYNC),
+            (AsyncCallable, CallableKind.SYNC),
+            (len, CallableKind.SYNC),
+        ],
+    )
+    def test_kinds(self, func, kind):
+        assert classify_callable(func) == kind
+
+    def test_coroutine_objects_and_non_callables(self):
+        coro = add_async(1, 2)
+        assert classify_callable(coro) == CallableKind.AWAITABLE
+        coro.close()
+        with pytest.raises(TypeError):
+            classify_callable(42)
+
+    def test_cached_per_underlying_function(self):
+        adder = Adder()
+        classify_callable(adder.add_async)
+        assert _CALLABLE_KINDS[Adder.add_async] == CallableKind.COROUTINE_FUNCTION
+        classify_callable(AsyncCallable())
+        assert _CALLABLE_KINDS[AsyncCallable.__call__] == CallableKind.COROUTINE_FUNCTION
+
+
+class Test_RunCallableSafely:
+
+    @pytest.mark.parametrize(
+        "func",
+        [
+            add_async,
+            add_sync,
+            Adder().add,
+            Adder().add_async,
+            functools.partial(add_sync, 1),
+            AsyncCallable(),
+            SyncCallable(),
+            lambda a, b: add_async(a, b),
+        ],
+    )
+    def test_every_kind_returns_its_result(self, func):
+        async def main():
+            loop = asyncio.get_running_loop()
+            if isinstance(func, functools.partial):
+                return await run_callable_safely(loop, func, 2)
+            return await run_callable_safely(loop, func, 1, 2)
+
+        assert asyncio.run(main()) == 3
+
+    def test_awaitable(self):
+        async def main():
+            return await run_callable_safely(asyncio.get_running_loop(), add_async(1, 2))
+
+        assert asyncio.run(main()) == 3
+
+
+class Test_CreateTask:
+
+    def test_eager_start_where_supported(self):
+        async def timed_add(a: int, b: int) -> int:
+            async with asyncio.timeout(1):
+                assert asyncio.current_task() is not None
+                return await add_async(a, b)
+
+        async def main():
+            task = create_task(asyncio.get_running_loop(), timed_add(1, 2), name="add", eager=True)
+            done_at_creation = task.done()
+            return done_at_creation, await task, task.get_name()
+
+        done_at_creation, value, name = asyncio.run(main())
+        assert (value, name) == (3, "add")
+        # Finished without a trip through the loop on 3.12+ - A regular task on 3.11
+        assert done_at_creation == _EAGER_TASKS
+
+
+class Test_JobFuncKinds:
+
+    def test_partial_job_runs(self):
+        job_func = JobFunc(func=functools.partial(add_sync, 1), func_args=(2,))
+
+        async def main():
+            return await job_func.run(asyncio.get_running_loop(), "partial")
+
+        assert job_func.kind == CallableKind.SYNC
+        assert asyncio.run(main()) == 3
+
+    def test_coroutine_object_only_for_one_off_jobs(self):
+        coro = add_async(1, 2)
+        with pytest.raises(ValueError):
+            PeriodicJob(JobParams(func=coro, id="periodic", interval=1))
+        job = OneOffJob(JobParams(func=coro, id="once", interval=0, repeat=False))
+        assert job._func.kind == CallableKind.AWAITABLE
+        coro.close()
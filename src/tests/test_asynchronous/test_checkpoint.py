@@ -0,0 +1,106 @@
+import asyncio
+import datetime
+
+import pytest
+
+from kvcommon.asynchronous.jobs import CatchUpPolicy
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs.checkpoint import JobCheckpoint
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.datastore import InMemoryDatastore
+from kvcommon.datastore import VersionedDatastore
+from kvcommon.datastore.backend import TOMLBackend
+
+NOW = datetime.datetime(2024, 1, 1, 12, tzinfo=datetime.timezone.utc)
+HOUR = datetime.timedelta(hours=1)
+
+
+def _noop():
+    pass
+
+
+def make_job(catch_up: CatchUpPolicy = CatchUpPolicy.RUN_ONCE) -> PeriodicJob:
+    return PeriodicJob(JobParams(func=_noop, id="hourly", interval=HOUR, catch_up=catch_up))
+
+
+def checkpoint(next_run: datetime.datetime) -> JobCheckpoint:
+    return JobCheckpoint(
+        run_time_first=NOW - 10 * HOUR,
+        run_time_prev=next_run - HOUR,
+        run_time_next=next_run,
+        executions=10,
+    )
+
+
+class Test_JobCheckpoint:
+
+    def test_dict_round_trip(self):
+        original = checkpoint(NOW)
+        assert JobCheckpoint.from_dict(original.to_dict()) == original
+
+    def test_toml_round_trip(self, tmp_path):
+        datastore = VersionedDatastore(TOMLBackend(tmp_path, "jobs"), config_version=1)
+        scheduler = JobScheduler(checkpoint_store=datastore)
+        job = make_job()
+        job.status.restore_checkpoint(checkpoint(NOW))
+        scheduler.add_job(job)
+        assert scheduler.save_checkpoints() == 1
+        # Unchanged -> Not rewritten
+        assert scheduler.save_checkpoints() == 0
+        scheduler.stop()
+
+        restored = JobScheduler(
+            checkpoint_store=VersionedDatastore(TOMLBackend(tmp_path, "jobs"), config_version=1)
+        )
+        job = make_job()
+        restored.add_job(job)
+        restored.stop()
+        assert job.status.execution_count == 10
+        assert job.status.run_time_next >= NOW
+
+
+class Test_CatchUpPolicy:
+
+    @pytest.mark.parametrize(
+        "policy, runs",
+        [(CatchUpPolicy.RUN_ONCE, 1), (CatchUpPolicy.RUN_ALL, 5), (CatchUpPolicy.SKIP, 0)],
+    )
+    def test_missed_runs(self, policy, runs):
+        job = make_job(policy)
+        # Next run was due 4.5 hours ago -> 5 ticks missed
+        assert job.restore_checkpoint(checkpoint(NOW - 4.5 * HOUR), now=NOW) == runs
+        assert job.status.skipped_count == 5 - runs
+        assert job.status.run_time_next == NOW + 0.5 * HOUR
+
+    def test_not_yet_due_keeps_schedule(self):
+        job = make_job()
+        assert job.restore_checkpoint(checkpoint(NOW + 0.5 * HOUR), now=NOW) == 0
+        assert job.status.run_time_next == NOW + 0.5 * HOUR
+
+    @pytest.mark.asyncio
+    async def test_restored_job_does_not_fire_immediately(self):
+        ran = []
+        job = PeriodicJob(JobParams(func=lambda: ran.append(True), id="hourly", interval=HOUR))
+        now = datetime.datetime.now(datetime.timezone.utc)
+        job.restore_checkpoint(checkpoint(now + HOUR), now=now)
+
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        await asyncio.sleep(0.05)
+        job.stop()
+        await asyncio.wait_for(task, timeout=1)
+        assert ran == []
+
+    def test_scheduler_restores_on_add(self):
+        datastore = InMemoryDatastore(config_version=1)
+        scheduler = JobScheduler(checkpoint_store=datastore, phase_spread=True)
+        job = make_job()
+        job.status.restore_checkpoint(checkpoint(NOW))
+        scheduler.add_job(job)
+        scheduler.stop()
+
+        restarted = JobScheduler(checkpoint_store=datastore, phase_spread=True)
+        restarted.add_job(make_job())
+        # Restored jobs are dispatched straight away to wait out their own schedule (no phase offset)
+        assert [due for due, _, _ in restarted._dispatch_heap] == [0.0]
+        restarted.stop()
@@ -0,0 +1,132 @@
+import asyncio
+import datetime
+import time
+
+import pytest
+
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs.clock import VIRTUAL_EPOCH
+from kvcommon.asynchronous.jobs.job import JobParams
+
+
+async def noop():
+    pass
+
+
+def periodic(id: str, interval: float = 1, func=noop, **kwargs) -> PeriodicJob:
+    return PeriodicJob(JobParams(func=func, id=id, interval=interval, **kwargs))
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = JobScheduler(clock=VirtualClock())
+    yield scheduler
+    scheduler.stop()
+
+
+class Test_VirtualClock:
+
+    def test_advance(self):
+        clock = VirtualClock()
+        assert clock.now() == VIRTUAL_EPOCH
+        clock.advance(90)
+        assert clock.monotonic() == 90
+        assert clock.perf_counter_ns() == 90_000_000_000
+        assert clock.now() == VIRTUAL_EPOCH + datetime.timedelta(seconds=90)
+        with pytest.raises(ValueError):
+            clock.advance(-1)
+
+    def test_loop_skips_sleeps(self):
+        clock = VirtualClock()
+        loop = clock.new_event_loop()
+        started = time.monotonic()
+        try:
+            loop.run_until_complete(asyncio.sleep(3600))
+        finally:
+            loop.close()
+        assert clock.elapsed == pytest.approx(3600)
+        assert time.monotonic() - started < 1
+
+    def test_executor_work_takes_no_virtual_time(self):
+        clock = VirtualClock()
+        loop = clock.new_event_loop()
+
+        async def work():
+            # The timer would fire first if virtual time moved while the worker slept
+            timer = loop.create_task(asyncio.sleep(10))
+            await loop.run_in_executor(None, time.sleep, 0.05)
+            elapsed = clock.elapsed
+            timer.cancel()
+            return elapsed
+
+        try:
+            assert loop.run_until_complete(work()) == 0
+        finally:
+            loop.close()
+
+
+class Test_Simulate:
+
+    def test_runs_on_schedule(self, scheduler: JobScheduler):
+        jobs = [periodic(f"job_{index}", interval=index + 1) for index in range(5)]
+        for job in jobs:
+            scheduler.add_job(job)
+
+        scheduler.simulate(3600)
+
+        for index, job in enumerate(jobs):
+            # First run at 0s, last at 3600s
+            assert job.status.execution_count == 3600 // (index + 1) + 1
+            assert job.last_run_metrics.scheduling_lag_ns == 0
+        assert scheduler.clock.elapsed == 3600
+
+    def test_continues(self, scheduler: JobScheduler):
+        job = periodic("job", interval=10)
+        scheduler.add_job(job)
+        scheduler.simulate(100)
+        scheduler.simulate(100)
+        assert job.status.execution_count == 21
+        assert job.last_result.started_at == VIRTUAL_EPOCH + datetime.timedelta(seconds=200)
+
+    def test_cron_uses_virtual_time(self, scheduler: JobScheduler):
+        job = PeriodicJob(JobParams(func=noop, id="hourly", cron="0 * * * *"))
+        scheduler.add_job(job)
+        scheduler.simulate(datetime.timedelta(days=2, minutes=30).total_seconds())
+        # Fires strictly after the (midnight) start: 01:00 on day one to 00:00 on day three
+        assert job.status.execution_count == 48
+        assert {result.started_at.minute for result in job.results} == {0}
+
+    def test_reproducible(self):
+        def simulate() -> list:
+            scheduler = JobScheduler(clock=VirtualClock(), phase_spread=True)
+            for index in range(10):
+                scheduler.add_job(periodic(f"job_{index}", interval=7))
+            scheduler.add_job(
+                OneOffJob(JobParams(func=noop, id="once", interval=30, delay_first_run=True))
+            )
+            scheduler.simulate(600)
+            try:
+                return [
+                    result.started_at
+                    for job_id in sorted(scheduler.keys_jobs_all)
+                    for result in scheduler.get_job(job_id).results
+                ]
+            finally:
+                scheduler.stop()
+
+        assert simulate() == simulate()
+
+    def test_start_not_allowed(self, scheduler: JobScheduler):
+        with pytest.raises(RuntimeError):
+            scheduler.start()
+
+    def test_requires_virtual_clock(self):
+        scheduler = JobScheduler()
+        try:
+            with pytest.raises(RuntimeError):
+                scheduler.simulate(1)
+        finally:
+            scheduler.stop()
@@ -0,0 +1,100 @@
+import asyncio
+import datetime
+
+import pytest
+
+from kvcommon.asynchronous.exceptions import CronExpressionError
+from kvcommon.asynchronous.jobs import CronExpression
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs.job import JobParams
+
+UTC = datetime.timezone.utc
+
+
+def utc(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=UTC)
+
+
+class Test_CronExpression:
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["", "* * * *", "60 * * * *", "* * 0 * *", "*/0 * * * *", "5-1 * * * *", "* * * FOO *"],
+    )
+    def test_invalid_expressions(self, expression):
+        with pytest.raises(CronExpressionError):
+            CronExpression(expression)
+
+    def test_every_five_minutes(self):
+        cron = CronExpression("*/5 * * * *")
+        assert cron.next_fire(utc(2024, 1, 1, 10, 3, 12)) == utc(2024, 1, 1, 10, 5)
+        # Strictly after
+        assert cron.next_fire(utc(2024, 1, 1, 10, 5)) == utc(2024, 1, 1, 10, 10)
+
+    def test_seconds_field(self):
+        cron = CronExpression("*/15 * * * * *")
+        assert cron.next_fire(utc(2024, 1, 1, 10, 0, 16)) == utc(2024, 1, 1, 10, 0, 30)
+
+    def test_names_and_ranges(self):
+        cron = CronExpression("0 9 * JAN-MAR MON-FRI")
+        # Saturday 6th Jan -> Monday 8th Jan
+        assert cron.next_fire(utc(2024, 1, 6, 12)) == utc(2024, 1, 8, 9)
+        # End of March -> Next January
+        assert cron.next_fire(utc(2024, 3, 29, 12)) == utc(2025, 1, 1, 9)
+
+    def test_day_of_month_or_day_of_week(self):
+        # Both restricted -> Either may match
+        cron = CronExpression("0 0 13 * FRI")
+        assert cron.next_fire(utc(2024, 1, 1)) == utc(2024, 1, 5)
+        assert cron.next_fire(utc(2024, 1, 12, 1)) == utc(2024, 1, 13)
+
+    def test_leap_day(self):
+        cron = CronExpression("0 0 29 2 *")
+        assert cron.next_fire(utc(2024, 3, 1)) == utc(2028, 2, 29)
+
+    def test_macro(self):
+        assert CronExpression("@daily").next_fire(utc(2024, 1, 1, 0, 0, 1)) == utc(2024, 1, 2)
+
+    def test_timezone_dst_gap_is_skipped(self):
+        # 02:30 doesn't exist in New York on 10th March 2024
+        cron = CronExpression("30 2 * * *", tz="America/New_York")
+        fire = cron.next_fire(utc(2024, 3, 9, 12))
+        assert fire == utc(2024, 3, 11, 6, 30)
+
+    def test_timezone_dst_overlap_fires_once(self):
+        # 01:30 happens twice in New York on 3rd November 2024
+        cron = CronExpression("30 1 * * *", tz="America/New_York")
+        first = cron.next_fire(utc(2024, 11, 3, 0))
+        assert first == utc(2024, 11, 3, 5, 30)
+        assert cron.next_fire(first) == utc(2024, 11, 4, 6, 30)
+
+    def test_get_is_cached(self):
+        assert CronExpression.get("*/5 * * * *") is CronExpression.get("*/5 * * * *")
+
+
+class Test_CronJob:
+
+    def test_params_require_interval_or_cron(self):
+        with pytest.raises(ValueError):
+            JobParams(func=lambda: None, id="job")
+
+    def test_params_interval_from_cron(self):
+        params = JobParams(func=lambda: None, id="job", cron="*/10 * * * * *")
+        assert params.interval == datetime.timedelta(seconds=10)
+        assert params.cron.expression == "*/10 * * * * *"
+
+    @pytest.mark.asyncio
+    async def test_runs_on_fire_times(self):
+        fires = []
+
+        async def record():
+            fires.append(datetime.datetime.now(UTC))
+
+        job = PeriodicJob(JobParams(func=record, id="job", cron="* * * * * *"))
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        await asyncio.sleep(2.2)
+        job.stop()
+        await asyncio.wait_for(task, timeout=2)
+
+        assert len(fires) >= 2
+        assert all(fire.microsecond < 200_000 for fire in fires[1:])
@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs.job import JobParams
+
+
+def _noop():
+    pass
+
+
+class Test_JobDependencies:
+
+    def test_params(self):
+        params = JobParams(func=_noop, id="b", depends_on=["a"])
+        assert params.depends_on == ("a",)
+        with pytest.raises(ValueError):
+            JobParams(func=_noop, id="a", depends_on=["a"])
+        with pytest.raises(ValueError):
+            JobParams(func=_noop, id="b", depends_on=["a"], cron="* * * * *")
+
+    def test_upstreams_must_be_added_first(self):
+        scheduler = JobScheduler()
+        try:
+            with pytest.raises(KeyError):
+                scheduler.add_job(PeriodicJob(JobParams(func=_noop, id="b", depends_on=["a"])))
+            scheduler.add_job(PeriodicJob(JobParams(func=_noop, id="a", interval=60)))
+            scheduler.add_job(PeriodicJob(JobParams(func=_noop, id="b", depends_on=["a"])))
+            # Dependents wait on their upstreams rather than being spread/delayed
+            assert {job_id: due for due, _, job_id in scheduler._dispatch_heap}["b"] == 0
+        finally:
+            scheduler.stop()
+
+    @pytest.mark.asyncio
+    async def test_diamond_runs_branches_concurrently_and_passes_results(self):
+        loop = asyncio.get_running_loop()
+
+        async def root():
+            return 1
+
+        async def branch(upstream_results):
+            await asyncio.sleep(0.1)
+            return upstream_results["root"].value + 1
+
+        async def join(upstream_results):
+            return {job_id: result.value for job_id, result in upstream_results.items()}
+
+        root_job = OneOffJob(JobParams(func=root, id="root", interval=0.05, repeat=False))
+        left = OneOffJob(JobParams(func=branch, id="left", repeat=False, depends_on=["root"]))
+        right = OneOffJob(JobParams(func=branch, id="right", repeat=False, depends_on=["root"]))
+        joined = OneOffJob(
+            JobParams(func=join, id="join", repeat=False, depends_on=["left", "right"])
+        )
+        left.link_upstreams([root_job])
+        right.link_upstreams([root_job])
+        joined.link_upstreams([left, right])
+
+        start = time.monotonic()
+        await asyncio.wait_for(
+            asyncio.gather(*(job.run(loop=loop) for job in (joined, left, right, root_job))),
+            timeout=2,
+        )
+        elapsed = time.monotonic() - start
+
+        assert joined.last_result.value == {"left": 2, "right": 2}
+        # Branches overlapped: Total is the root's delay + one branch, not two
+        assert elapsed < 0.25
+
+    @pytest.mark.asyncio
+    async def test_failed_upstream_skips_run(self):
+        loop = asyncio.get_running_loop()
+        ran = []
+
+        def fail():
+            raise ValueError()
+
+        upstream = OneOffJob(JobParams(func=fail, id="up", interval=0.01, repeat=False))
+        dependent = PeriodicJob(
+            JobParams(func=lambda: ran.append(True), id="down", depends_on=["up"])
+        )
+        dependent.link_upstreams([upstream])
+
+        await asyncio.wait_for(
+            asyncio.gather(dependent.run(loop=loop), upstream.run(loop=loop)), timeout=1
+        )
+        assert ran == []
+        assert dependent.status.skipped_count == 1
+        # Upstream finished for good, so the dependent does too
+        assert dependent.status.should_continue is False
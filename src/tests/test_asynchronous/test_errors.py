@@ -0,0 +1,88 @@
+import asyncio
+import logging
+
+import pytest
+
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs.errors import ErrorPipeline
+from kvcommon.asynchronous.jobs.job import JobExceptionStruct
+from kvcommon.asynchronous.jobs.job import JobParams
+
+LOGGER = logging.getLogger("test_errors")
+
+
+def make_job(job_id: str) -> PeriodicJob:
+    return PeriodicJob(JobParams(func=lambda: None, id=job_id, interval=60))
+
+
+def report(pipeline: ErrorPipeline, job: PeriodicJob, count: int):
+    for i in range(count):
+        pipeline.put(JobExceptionStruct(job=job, exception=ValueError(i)))
+
+
+class Test_ErrorPipeline:
+
+    def test_bounded_with_drop_count(self):
+        pipeline = ErrorPipeline(maxsize=10, logger=LOGGER)
+        report(pipeline, make_job("a"), 25)
+        assert pipeline.pending_count == 10
+        assert pipeline.dropped_count == 15
+        assert pipeline.drain() == 10
+        assert pipeline.pending_count == 0
+
+    def test_per_job_error_counts_and_rates(self):
+        pipeline = ErrorPipeline(rate_window=10, logger=LOGGER)
+        report(pipeline, make_job("a"), 5)
+        report(pipeline, make_job("b"), 1)
+        assert pipeline.error_count("a") == 5
+        assert pipeline.error_rate("a") == pytest.approx(0.5)
+        assert pipeline.error_rates() == {"a": pytest.approx(0.5), "b": pytest.approx(0.1)}
+        assert pipeline.error_rate("c") == 0.0
+
+    def test_forget(self):
+        pipeline = ErrorPipeline(logger=LOGGER)
+        report(pipeline, make_job("a"), 3)
+        pipeline.forget("a")
+        assert pipeline.error_count("a") == 0
+        assert pipeline.error_rates() == {}
+        assert not pipeline._job_error_times and not pipeline._job_error_totals
+
+    def test_rates_follow_the_clock(self):
+        clock = VirtualClock()
+        pipeline = ErrorPipeline(rate_window=10, logger=LOGGER, clock=clock)
+        report(pipeline, make_job("a"), 5)
+        clock.advance(5)
+        assert pipeline.error_rate("a") == pytest.approx(0.5)
+        clock.advance(6)
+        assert pipeline.error_rate("a") == 0.0
+        assert pipeline.error_count("a") == 5
+
+    @pytest.mark.asyncio
+    async def test_drain_task_wakes_on_arrival_and_batches(self):
+        pipeline = ErrorPipeline(batch_size=50, logger=LOGGER)
+        task = asyncio.create_task(pipeline.run())
+        await asyncio.sleep(0)
+
+        # Reported from another thread, as jobs on other loops would
+        await asyncio.to_thread(report, pipeline, make_job("a"), 500)
+        for _ in range(100):
+            if pipeline.emitted_count == 500:
+                break
+            await asyncio.sleep(0.001)
+        assert pipeline.emitted_count == 500
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    @pytest.mark.asyncio
+    async def test_pending_errors_emitted_on_cancel(self):
+        pipeline = ErrorPipeline(logger=LOGGER)
+        task = asyncio.create_task(pipeline.run())
+        await asyncio.sleep(0)
+        report(pipeline, make_job("a"), 3)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert pipeline.emitted_count == 3
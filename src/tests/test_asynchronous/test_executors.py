@@ -0,0 +1,162 @@
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from kvcommon.asynchronous.exceptions import PicklingCheckError
+from kvcommon.asynchronous.exceptions import UnknownExecutorException
+from kvcommon.asynchronous import executors
+from kvcommon.asynchronous.executors import ExecutorKind
+from kvcommon.asynchronous.executors import create_thread_pool
+from kvcommon.asynchronous.executors import executor_stats
+from kvcommon.asynchronous.executors import get_shared_process_pool
+from kvcommon.asynchronous.executors import shutdown_shared_executors
+from kvcommon.asynchronous.executors import unregister_executor
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs.job import JobFunc
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.asynchronous.jobs.priority import ExecutionQueues
+from kvcommon.asynchronous.utils import call_sync_async
+
+
+def _get_pid(offset: int = 0) -> int:
+    return os.getpid() + offset
+
+
+def _raise_value_error():
+    raise ValueError("from worker")
+
+
+async def _coro():
+    pass
+
+
+class Test_ProcessExecutor:
+
+    def test_unpicklable_func_rejected_on_add(self):
+        scheduler = JobScheduler()
+        job = OneOffJob(
+            JobParams(
+                func=lambda: None,
+                id="lambda",
+                interval=0,
+                repeat=False,
+                executor=ExecutorKind.PROCESS,
+            )
+        )
+        try:
+            with pytest.raises(PicklingCheckError):
+                scheduler.add_job(job)
+            with pytest.raises(KeyError):
+                scheduler.get_job("lambda")
+        finally:
+            scheduler.stop()
+
+    def test_unknown_executor_rejected_on_add(self):
+        scheduler = JobScheduler()
+        job = OneOffJob(
+            JobParams(func=_get_pid, id="unknown", interval=0, repeat=False, executor="nope")
+        )
+        try:
+            with pytest.raises(UnknownExecutorException):
+                scheduler.add_job(job)
+        finally:
+            scheduler.stop()
+
+    def test_coroutine_func_rejected(self):
+        with pytest.raises(ValueError):
+            JobParams(
+                func=_coro, id="coro", interval=0, repeat=False, executor=ExecutorKind.PROCESS
+            )
+
+    @pytest.mark.asyncio
+    async def test_runs_in_other_process(self):
+        job_func = JobFunc(func=_get_pid, func_kwargs=dict(offset=0), executor=ExecutorKind.PROCESS)
+        loop = asyncio.get_running_loop()
+        try:
+            pid = await job_func.run(loop, "pid")
+            assert pid != os.getpid()
+
+            job_func = JobFunc(func=_raise_value_error, executor=ExecutorKind.PROCESS)
+            with pytest.raises(ValueError, match="from worker"):
+                await job_func.run(loop, "raises")
+        finally:
+            shutdown_shared_executors(wait=True)
+
+    def test_shared_pool_outlives_each_scheduler(self, monkeypatch):
+        monkeypatch.setattr(executors, "_shared_executor_users", 0)
+        scheduler_a = JobScheduler(clock=VirtualClock())
+        scheduler_b = JobScheduler(clock=VirtualClock())
+        pool = get_shared_process_pool()
+        try:
+            scheduler_a.stop()
+            scheduler_a.stop()
+            assert get_shared_process_pool() is pool
+        finally:
+            scheduler_b.stop()
+        assert executors._shared_process_pool is None
+
+
+@pytest.fixture
+def pool_name():
+    yield "test-pool"
+    unregister_executor("test-pool", shutdown=True)
+
+
+class Test_InstrumentedThreadPool:
+
+    def test_stats(self, pool_name):
+        pool = create_thread_pool(pool_name, max_workers=1)
+        futures = [pool.submit(time.sleep, 0.05) for _ in range(3)]
+        for future in futures:
+            future.result(timeout=5)
+
+        stats = executor_stats()[pool_name]
+        assert (stats.max_workers, stats.threads, stats.active, stats.queue_depth) == (1, 1, 0, 0)
+        assert stats.completed == stats.wait_count == 3
+        assert stats.wait_max >= 0.09
+        assert 0 < stats.wait_mean <= stats.wait_max
+        with pytest.raises(KeyError):
+            create_thread_pool(pool_name, max_workers=1)
+
+    def test_grows_while_saturated(self, pool_name):
+        pool = create_thread_pool(pool_name, max_workers=1, max_workers_limit=2, scale_after=0.05)
+        release = threading.Event()
+        queue = ExecutionQueues().get(pool_name, None)
+        futures = [pool.submit(release.wait, 5) for _ in range(3)]
+        time.sleep(0.1)
+        assert pool.stats().saturated
+        futures.append(pool.submit(release.wait, 5))
+
+        stats = pool.stats()
+        assert (stats.max_workers, stats.threads, stats.resizes) == (2, 2, 1)
+        assert queue.capacity == 2
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+        with pytest.raises(ValueError):
+            pool.resize(1)
+
+    def test_grows_without_further_events(self, pool_name):
+        pool = create_thread_pool(pool_name, max_workers=1, max_workers_limit=3, scale_after=0.05)
+        release = threading.Event()
+        futures = [pool.submit(release.wait, 5) for _ in range(3)]
+        time.sleep(0.3)
+
+        stats = pool.stats()
+        assert (stats.max_workers, stats.threads, stats.active, stats.resizes) == (3, 3, 3, 2)
+        release.set()
+        for future in futures:
+            future.result(timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_call_sync_async_by_name(self, pool_name):
+        create_thread_pool(pool_name, max_workers=1)
+        thread_name = await call_sync_async(
+            lambda: threading.current_thread().name, executor=pool_name
+        )
+        assert thread_name.startswith(pool_name)
@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+import pytest
+
+from kvcommon.asynchronous.jobs import JobGroup
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs.groups import TokenBucket
+from kvcommon.asynchronous.jobs.job import JobParams
+
+
+class CallRecorder:
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.started_at = []
+
+    async def __call__(self, duration: float = 0.0):
+        loop = asyncio.get_running_loop()
+        self.started_at.append(loop.time())
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            self.running -= 1
+
+
+def tagged_jobs(recorder: CallRecorder, count: int, tag: str, duration: float = 0.0):
+    return [
+        OneOffJob(
+            JobParams(
+                func=recorder,
+                func_args=(duration,),
+                id=f"{tag}_{index}",
+                interval=0,
+                repeat=False,
+                tags=[tag],
+            )
+        )
+        for index in range(count)
+    ]
+
+
+class Test_TokenBucket:
+
+    def test_reserve(self):
+        bucket = TokenBucket(rate=10, burst=2)
+        assert [bucket.reserve(0.0) for _ in range(3)] == [0.0, 0.0, pytest.approx(0.1)]
+        assert bucket.reserve(0.1) == pytest.approx(0.1)
+        assert bucket.reserve(1.0) == 0.0
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class Test_JobGroups:
+
+    def test_concurrency_limit(self):
+        recorder = CallRecorder()
+        scheduler = JobScheduler(
+            clock=VirtualClock(), job_groups=[JobGroup("k8s", max_concurrent=2)]
+        )
+        for job in tagged_jobs(recorder, 6, "k8s", duration=1.0):
+            scheduler.add_job(job)
+        scheduler.simulate(5)
+        stats = scheduler.group_stats()["k8s"]
+        scheduler.stop()
+
+        assert len(recorder.started_at) == 6
+        assert recorder.max_running == 2
+        assert (stats.admitted, stats.throttled, stats.running, stats.waiting) == (6, 4, 0, 0)
+
+    def test_rate_limit(self):
+        recorder = CallRecorder()
+        scheduler = JobScheduler(
+            clock=VirtualClock(), job_groups=[JobGroup("api", rate=2, burst=1)]
+        )
+        for job in tagged_jobs(recorder, 5, "api"):
+            scheduler.add_job(job)
+        scheduler.simulate(5)
+        stats = scheduler.get_group("api").stats()
+        scheduler.stop()
+
+        gaps = [
+            later - earlier for earlier, later in zip(recorder.started_at, recorder.started_at[1:])
+        ]
+        assert len(gaps) == 4
+        assert all(gap >= 0.5 - 1e-6 for gap in gaps)
+        assert stats.rate_limited == 4
+
+    def test_groups_link_to_tagged_jobs(self):
+        scheduler = JobScheduler()
+        recorder = CallRecorder()
+        (job,) = tagged_jobs(recorder, 1, "k8s")
+        try:
+            scheduler.add_job(job)
+            assert job.groups == ()
+            group = JobGroup("k8s", max_concurrent=1)
+            scheduler.add_group(group)
+            assert job.groups == (group,)
+            with pytest.raises(KeyError):
+                scheduler.add_group(JobGroup("k8s"))
+        finally:
+            scheduler.stop()
+
+    def test_timed_out_sync_run_holds_its_slot(self):
+        group = JobGroup("k8s", max_concurrent=1)
+        finished_at = []
+
+        def slow():
+            time.sleep(0.2)
+            finished_at.append(time.monotonic())
+
+        def quick():
+            return time.monotonic()
+
+        stuck = OneOffJob(
+            JobParams(func=slow, id="stuck", interval=0, repeat=False, timeout=0.02, tags=["k8s"])
+        )
+        waiting = OneOffJob(
+            JobParams(func=quick, id="waiting", interval=0, repeat=False, tags=["k8s"])
+        )
+        for job in (stuck, waiting):
+            job.set_groups([group])
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            await stuck.run(loop=loop)
+            assert group.stats().running == 1
+            await waiting.run(loop=loop)
+
+        asyncio.run(main())
+        assert waiting.last_result.value >= finished_at[0]
+        assert group.stats().running == 0
@@ -0,0 +1,176 @@
+import asyncio
+import datetime
+import logging
+
+import pytest
+
+from kvcommon.asynchronous.jobs import JobState
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs import OverlapPolicy
+from kvcommon.asynchronous.jobs.job import JobParams
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.count = 0
+
+
+async def _increment(counter: Counter):
+    counter.count += 1
+
+
+def make_job(counter: Counter, interval: float = 60) -> PeriodicJob:
+    return PeriodicJob(
+        JobParams(func=_increment, id="job", interval=interval, func_args=(counter,))
+    )
+
+
+class Test_JobWake:
+
+    @pytest.mark.asyncio
+    async def test_paused_job_resumes_promptly(self):
+        counter = Counter()
+        job = make_job(counter)
+        job.pause()
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        await asyncio.sleep(0.05)
+        assert counter.count == 0
+        assert job._waiter is not None
+
+        job.resume()
+        await asyncio.sleep(0.05)
+        assert counter.count == 1
+
+        job.stop()
+        await asyncio.wait_for(task, timeout=1)
+        assert job.state == JobState.FINISHED
+
+    @pytest.mark.asyncio
+    async def test_stop_interrupts_interval_wait(self):
+        counter = Counter()
+        job = make_job(counter, interval=3600)
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        await asyncio.sleep(0.05)
+        assert counter.count == 1
+
+        job.stop()
+        await asyncio.wait_for(task, timeout=1)
+        assert counter.count == 1
+
+    @pytest.mark.asyncio
+    async def test_pause_during_interval_wait_parks(self):
+        counter = Counter()
+        job = make_job(counter, interval=0.1)
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        await asyncio.sleep(0.05)
+        job.pause()
+        await asyncio.sleep(0.2)
+        assert counter.count == 1
+        assert job.state == JobState.SUSPENDED
+
+        job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+
+class SlowRunTracker:
+    def __init__(self) -> None:
+        self.running = 0
+        self.max_running = 0
+        self.count = 0
+
+
+async def _slow(tracker: SlowRunTracker):
+    tracker.running += 1
+    tracker.count += 1
+    tracker.max_running = max(tracker.max_running, tracker.running)
+    await asyncio.sleep(0.12)
+    tracker.running -= 1
+
+
+async def run_overlapping_job(
+    overlap: OverlapPolicy, overlap_limit: int = 1
+) -> tuple[PeriodicJob, SlowRunTracker]:
+    tracker = SlowRunTracker()
+    job = PeriodicJob(
+        JobParams(
+            func=_slow,
+            id=f"overlap-{overlap}",
+            interval=0.05,
+            overlap=overlap,
+            overlap_limit=overlap_limit,
+            func_args=(tracker,),
+        )
+    )
+    task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+    await asyncio.sleep(0.5)
+    job.stop()
+    await asyncio.wait_for(task, timeout=1)
+    return job, tracker
+
+
+class Test_OverlapPolicy:
+
+    @pytest.mark.asyncio
+    async def test_skip(self):
+        job, tracker = await run_overlapping_job(OverlapPolicy.SKIP)
+        assert tracker.max_running == 1
+        assert job._status.skipped_count >= tracker.count
+        assert job._status.coalesced_count == 0
+
+    @pytest.mark.asyncio
+    async def test_coalesce(self):
+        job, tracker = await run_overlapping_job(OverlapPolicy.COALESCE)
+        assert tracker.max_running == 1
+        assert job._status.coalesced_count >= 1
+        assert job._status.skipped_count == 0
+
+    @pytest.mark.asyncio
+    async def test_queue(self):
+        job, tracker = await run_overlapping_job(OverlapPolicy.QUEUE, overlap_limit=2)
+        assert tracker.max_running == 1
+        assert job._status.skipped_count >= 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent(self):
+        job, tracker = await run_overlapping_job(OverlapPolicy.CONCURRENT, overlap_limit=2)
+        assert tracker.max_running == 2
+        assert job._status.execution_count == tracker.count
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError):
+            JobParams(func=_slow, id="bad", interval=1, overlap_limit=0)
+
+
+class Test_JobFootprint:
+
+    def test_slotted(self):
+        job = make_job(Counter())
+        for obj in (job, job.status, job._func, job._results):
+            assert not hasattr(obj, "__dict__"), type(obj).__name__
+
+    def test_run_times_round_trip_exactly(self):
+        job = make_job(Counter())
+        run_time = datetime.datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc)
+        job.status.record_run(current_run_time=run_time, next_run_time=run_time + job.interval)
+        assert job.status.run_time_first == job.status.run_time_prev == run_time
+        assert job.status.run_time_next == run_time + job.interval
+
+    def test_shares_module_logger(self, caplog):
+        job = PeriodicJob(
+            JobParams(
+                func=_increment,
+                id="quiet",
+                interval=60,
+                func_args=(Counter(),),
+                log_level=logging.WARNING,
+            )
+        )
+        assert "job:quiet" not in logging.Logger.manager.loggerDict
+        assert job.LOG.logger is logging.getLogger("kvc_job")
+        logging.getLogger("kvc_job").addHandler(caplog.handler)
+        try:
+            job.pause()
+            job.LOG.warning("Odd")
+        finally:
+            logging.getLogger("kvc_job").removeHandler(caplog.handler)
+        assert [record.getMessage() for record in caplog.records] == ["job:quiet - Odd"]
@@ -0,0 +1,115 @@
+import asyncio
+import time
+
+import pytest
+
+from kvcommon.asynchronous.jobs import DatastoreLeaseBackend
+from kvcommon.asynchronous.jobs import FileLockLeaseBackend
+from kvcommon.asynchronous.jobs import JobLease
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.datastore import InMemoryDatastore
+
+
+class Test_LeaseBackends:
+
+    def test_datastore_lease_exclusive_until_expiry(self):
+        backend = DatastoreLeaseBackend(InMemoryDatastore(config_version=1))
+        assert backend.acquire("job:a", "one", ttl=0.05)
+        assert not backend.acquire("job:a", "two", ttl=0.05)
+        # Renewal by the holder
+        assert backend.acquire("job:a", "one", ttl=0.05)
+        assert backend.holder_of("job:a") == "one"
+
+        time.sleep(0.06)
+        assert backend.holder_of("job:a") is None
+        assert backend.acquire("job:a", "two", ttl=0.05)
+
+    def test_datastore_lease_release(self):
+        backend = DatastoreLeaseBackend(InMemoryDatastore(config_version=1))
+        backend.acquire("job:a", "one", ttl=60)
+        backend.release("job:a", "two")
+        assert not backend.acquire("job:a", "two", ttl=60)
+        backend.release("job:a", "one")
+        assert backend.acquire("job:a", "two", ttl=60)
+
+    def test_file_lock_lease(self, tmp_path):
+        first = FileLockLeaseBackend(tmp_path)
+        second = FileLockLeaseBackend(tmp_path)
+        assert first.acquire("job:a", "one", ttl=1)
+        assert first.acquire("job:a", "one", ttl=1)
+        assert not second.acquire("job:a", "two", ttl=1)
+        assert second.acquire("job:b", "two", ttl=1)
+
+        first.release("job:a", "one")
+        assert second.acquire("job:a", "two", ttl=1)
+
+    def test_backend_errors_mean_not_held(self):
+        class BrokenBackend(DatastoreLeaseBackend):
+            def acquire(self, key, holder, ttl):
+                raise ConnectionError()
+
+        lease = JobLease(BrokenBackend(InMemoryDatastore(config_version=1)), key="job:a")
+        assert not lease.refresh()
+        assert not lease.held
+
+
+class Test_SingleRunner:
+
+    @pytest.mark.asyncio
+    async def test_only_lease_holder_runs(self):
+        loop = asyncio.get_running_loop()
+        backend = DatastoreLeaseBackend(InMemoryDatastore(config_version=1))
+        runs = {"one": 0, "two": 0}
+
+        def make_replica(holder: str) -> PeriodicJob:
+            def count():
+                runs[holder] += 1
+
+            lease = JobLease(backend, key="job:cleanup", ttl=5, holder=holder)
+            return PeriodicJob(JobParams(func=count, id="cleanup", interval=0.01, lease=lease))
+
+        first, second = make_replica("one"), make_replica("two")
+        tasks = [asyncio.create_task(first.run(loop=loop))]
+        await asyncio.sleep(0.02)
+        tasks.append(asyncio.create_task(second.run(loop=loop)))
+        await asyncio.sleep(0.1)
+
+        assert runs["one"] > 0
+        assert runs["two"] == 0
+        assert second.status.standby_count > 0
+
+        # Holder stops for good -> Lease is released for the standby to take over at its next renewal
+        first.stop()
+        second.stop()
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        assert backend.holder_of("job:cleanup") is None
+
+    @pytest.mark.asyncio
+    async def test_release_off_the_loop(self):
+        class SlowBackend(DatastoreLeaseBackend):
+            def release(self, key, holder):
+                time.sleep(0.1)
+                super().release(key, holder)
+
+        loop = asyncio.get_running_loop()
+        backend = SlowBackend(InMemoryDatastore(config_version=1))
+        lease = JobLease(backend, key="job:cleanup", ttl=5)
+        job = PeriodicJob(JobParams(func=lambda: None, id="cleanup", interval=0.01, lease=lease))
+        task = asyncio.create_task(job.run(loop=loop))
+        await asyncio.sleep(0.02)
+        job.stop()
+
+        ticks = 0
+        while not task.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        await task
+        assert ticks > 3
+        assert backend.holder_of("job:cleanup") is None
+
+    def test_params_wrap_backend(self):
+        backend = DatastoreLeaseBackend(InMemoryDatastore(config_version=1))
+        params = JobParams(func=lambda: None, id="cleanup", interval=1, lease=backend, lease_ttl=9)
+        assert params.lease.key == "job:cleanup"
+        assert params.lease.renew_interval == 3
@@ -0,0 +1,136 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from prometheus_client import CollectorRegistry
+from prometheus_client import Histogram
+
+from kvcommon.asynchronous.executors import register_executor
+from kvcommon.asynchronous.executors import unregister_executor
+from kvcommon.asynchronous.jobs import MetricsSink
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs import RunMetrics
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.asynchronous.jobs.metrics import JobTimer
+from kvcommon.prometheus.jobs import JobTimerPrometheus
+
+MS = 1_000_000
+
+
+class ListSink(MetricsSink):
+    def __init__(self) -> None:
+        self.metrics = []
+
+    def record(self, metrics: RunMetrics) -> None:
+        self.metrics.append(metrics)
+
+
+def one_off(func, **kwargs) -> OneOffJob:
+    return OneOffJob(JobParams(func=func, id="job", interval=0, repeat=False, **kwargs))
+
+
+class Test_RunMetrics:
+
+    @pytest.mark.asyncio
+    async def test_sync_execution_time(self):
+        sink = ListSink()
+        job = one_off(lambda: time.sleep(0.05), metrics_sinks=[sink])
+        await job.run(loop=asyncio.get_running_loop())
+        (metrics,) = sink.metrics
+        assert metrics.ok
+        assert 45 * MS <= metrics.execution_ns < metrics.total_ns
+        assert job.last_run_metrics is metrics
+
+    @pytest.mark.asyncio
+    async def test_executor_queue_wait(self):
+        pool = ThreadPoolExecutor(max_workers=1)
+        register_executor("single", pool)
+        try:
+            pool.submit(time.sleep, 0.05)
+            sink = ListSink()
+            job = one_off(lambda: None, executor="single", metrics_sinks=[sink])
+            await job.run(loop=asyncio.get_running_loop())
+        finally:
+            unregister_executor("single", shutdown=True)
+        assert sink.metrics[0].queue_wait_ns >= 40 * MS
+        assert sink.metrics[0].execution_ns < 10 * MS
+
+    @pytest.mark.asyncio
+    async def test_scheduling_lag_from_blocked_loop(self):
+        sink = ListSink()
+
+        async def noop():
+            pass
+
+        job = PeriodicJob(
+            JobParams(
+                func=noop, id="job", interval=0.02, delay_first_run=True, metrics_sinks=[sink]
+            )
+        )
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        await asyncio.sleep(0)
+        # Block the loop past the job's due time
+        time.sleep(0.07)
+        await asyncio.sleep(0.01)
+        job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert sink.metrics[0].scheduling_lag_ns >= 40 * MS
+        assert sink.metrics[0].queue_wait_ns == 0
+
+    @pytest.mark.asyncio
+    async def test_catch_up_lag_from_missed_tick(self):
+        sink = ListSink()
+
+        async def block():
+            if not sink.metrics:
+                # Overruns the ticks at 20ms, 40ms and 60ms
+                time.sleep(0.07)
+
+        job = PeriodicJob(JobParams(func=block, id="job", interval=0.02, metrics_sinks=[sink]))
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        while len(sink.metrics) < 2:
+            await asyncio.sleep(0.005)
+        job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert sink.metrics[1].scheduling_lag_ns >= 40 * MS
+
+    @pytest.mark.asyncio
+    async def test_failed_run(self):
+        def fail():
+            raise ValueError()
+
+        sink = ListSink()
+        await one_off(fail, metrics_sinks=[sink]).run(loop=asyncio.get_running_loop())
+        assert not sink.metrics[0].ok
+
+
+class Test_JobTimer:
+
+    @pytest.mark.asyncio
+    async def test_timer_is_a_sink(self):
+        durations = []
+        params = JobParams(func=lambda: time.sleep(0.01), id="job", interval=0, repeat=False)
+        job = OneOffJob(params, timer=JobTimer(stop_callback=durations.append))
+        await job.run(loop=asyncio.get_running_loop())
+        assert len(durations) == 1 and durations[0] >= 0.009
+
+    def test_prometheus_timer(self):
+        registry = CollectorRegistry()
+        execution = Histogram("job_execution_seconds", "", registry=registry)
+        lag = Histogram("job_lag_seconds", "", registry=registry)
+        timer = JobTimerPrometheus(execution, lag_metric=lag)
+        timer.record(
+            RunMetrics(
+                job_id="a",
+                scheduling_lag_ns=2 * MS,
+                queue_wait_ns=0,
+                execution_ns=5 * MS,
+                total_ns=5 * MS,
+            )
+        )
+        assert registry.get_sample_value("job_execution_seconds_sum") == pytest.approx(0.005)
+        assert registry.get_sample_value("job_lag_seconds_sum") == pytest.approx(0.002)
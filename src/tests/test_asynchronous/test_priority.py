@@ -0,0 +1,191 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from prometheus_client import CollectorRegistry
+from prometheus_client import Histogram
+
+from kvcommon.asynchronous.executors import create_thread_pool
+from kvcommon.asynchronous.executors import unregister_executor
+from kvcommon.asynchronous.jobs import ExecutionQueue
+from kvcommon.asynchronous.jobs import JobPriority
+from kvcommon.asynchronous.jobs import MetricsSink
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.asynchronous.jobs.priority import ExecutionQueues
+from kvcommon.prometheus.jobs import JobTimerPrometheus
+
+
+class ListSink(MetricsSink):
+    def __init__(self) -> None:
+        self.records = []
+
+    def record(self, metrics) -> None:
+        self.records.append(metrics)
+
+
+async def admit_in_order(queue: ExecutionQueue, priorities, pause: float = 0.0):
+    admitted = []
+
+    async def waiter(label, priority):
+        await queue.acquire(priority)
+        admitted.append(label)
+        queue.release()
+
+    await queue.acquire()  # Saturate
+    tasks = []
+    for label, priority in priorities:
+        tasks.append(asyncio.create_task(waiter(label, priority)))
+        await asyncio.sleep(pause)
+    queue.release()
+    await asyncio.gather(*tasks)
+    return admitted
+
+
+class Test_ExecutionQueue:
+
+    def test_priority_then_fifo(self):
+        queue = ExecutionQueue(capacity=1, aging=0)
+        priorities = [("batch", JobPriority.BATCH), ("probe_1", 0), ("normal", 20), ("probe_2", 0)]
+        admitted = asyncio.run(admit_in_order(queue, priorities))
+        assert admitted == ["probe_1", "probe_2", "normal", "batch"]
+        assert queue.running_count == 0
+
+    def test_aging_prevents_starvation(self):
+        queue = ExecutionQueue(capacity=1, aging=1000)
+        admitted = asyncio.run(
+            admit_in_order(queue, [("batch", JobPriority.BATCH), ("probe", 0)], pause=0.05)
+        )
+        assert admitted == ["batch", "probe"]
+
+    def test_aging_follows_the_clock(self):
+        clock = VirtualClock()
+        queue = ExecutionQueue(capacity=1, aging=1, clock=clock)
+
+        async def main():
+            admitted = []
+
+            async def waiter(label, priority):
+                await queue.acquire(priority)
+                admitted.append(label)
+                queue.release()
+
+            await queue.acquire()
+            batch = asyncio.create_task(waiter("batch", JobPriority.BATCH))
+            await asyncio.sleep(0)
+            clock.advance(100)
+            probe = asyncio.create_task(waiter("probe", JobPriority.CRITICAL))
+            await asyncio.sleep(0)
+            queue.release()
+            await asyncio.gather(batch, probe)
+            return admitted
+
+        assert asyncio.run(main()) == ["batch", "probe"]
+
+    def test_cancelled_waiter_gives_up_its_place(self):
+        async def main():
+            queue = ExecutionQueue(capacity=1)
+            await queue.acquire()
+            task = asyncio.create_task(queue.acquire(JobPriority.HIGH))
+            await asyncio.sleep(0)
+            assert queue.waiting_by_priority() == {JobPriority.HIGH: 1}
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            assert queue.waiting_count == 0
+            queue.release()
+            return queue.running_count
+
+        assert asyncio.run(main()) == 0
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            ExecutionQueue(capacity=0)
+
+
+class Test_JobPriority:
+
+    def test_queue_wait_recorded_per_priority(self):
+        sink = ListSink()
+        registry = CollectorRegistry()
+        queue_metric = Histogram("queue_wait", "Queue wait", ["priority"], registry=registry)
+        timer = JobTimerPrometheus(
+            Histogram("execution", "Execution", registry=registry), queue_metric=queue_metric
+        )
+        job = OneOffJob(
+            JobParams(
+                func=time.sleep,
+                func_args=(0,),
+                id="probe",
+                interval=0,
+                repeat=False,
+                priority=JobPriority.CRITICAL,
+                metrics_sinks=[sink, timer],
+            )
+        )
+        queues = ExecutionQueues()
+        job.set_execution_queues(queues)
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            await job.run(loop=loop)
+            return queues.get("thread", loop)
+
+        queue = asyncio.run(main())
+        assert queue is not None and queue.running_count == 0
+        assert sink.records[0].priority == JobPriority.CRITICAL
+        assert registry.get_sample_value("queue_wait_count", {"priority": "0"}) == 1
+
+    def test_sized_to_loop_default_executor(self):
+        queues = ExecutionQueues()
+        loop = asyncio.new_event_loop()
+        executor = ThreadPoolExecutor(max_workers=64)
+        try:
+            assert queues.get("thread", loop) is None
+            loop.set_default_executor(executor)
+            assert queues.get("thread", loop).capacity == 64
+        finally:
+            loop.close()
+            executor.shutdown()
+
+    def test_admission_wait_excluded_from_timeout(self):
+        create_thread_pool("test-priority-pool", max_workers=1)
+        queues = ExecutionQueues()
+        try:
+            blocker = OneOffJob(
+                JobParams(
+                    func=time.sleep,
+                    func_args=(0.2,),
+                    id="blocker",
+                    interval=0,
+                    repeat=False,
+                    executor="test-priority-pool",
+                )
+            )
+            queued = OneOffJob(
+                JobParams(
+                    func=lambda: "done",
+                    id="queued",
+                    interval=0,
+                    repeat=False,
+                    timeout=0.05,
+                    executor="test-priority-pool",
+                )
+            )
+            for job in (blocker, queued):
+                job.set_execution_queues(queues)
+
+            async def main():
+                loop = asyncio.get_running_loop()
+                blocker_task = asyncio.create_task(blocker.run(loop=loop))
+                await asyncio.sleep(0.01)
+                await asyncio.wait_for(
+                    asyncio.gather(queued.run(loop=loop), blocker_task), timeout=2
+                )
+
+            asyncio.run(main())
+            assert queued.last_result.value == "done"
+            assert queued.status.timeout_count == 0
+        finally:
+            unregister_executor("test-priority-pool", shutdown=True)
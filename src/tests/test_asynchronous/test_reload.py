@@ -0,0 +1,97 @@
+import asyncio
+import collections
+import os
+import signal
+
+import pytest
+
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs import ReloadSummary
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs.job import JobParams
+
+
+class JobDefinitions:
+    """
+    Job source backed by a dict of job ID -> interval, recording when each job's runs start and end
+    """
+
+    def __init__(self, intervals, duration: float = 0.0) -> None:
+        self.intervals = dict(intervals)
+        self.duration = duration
+        self.started_at = collections.defaultdict(list)
+        self.finished_at = collections.defaultdict(list)
+
+    async def record(self, job_id: str):
+        loop = asyncio.get_running_loop()
+        self.started_at[job_id].append(loop.time())
+        await asyncio.sleep(self.duration)
+        self.finished_at[job_id].append(loop.time())
+
+    def __call__(self):
+        return [
+            PeriodicJob(
+                JobParams(func=self.record, func_args=(job_id,), id=job_id, interval=interval)
+            )
+            for job_id, interval in self.intervals.items()
+        ]
+
+
+class Test_Reload:
+
+    def test_diff_against_source(self):
+        definitions = JobDefinitions({"a": 1, "b": 1})
+        scheduler = JobScheduler(clock=VirtualClock(), job_source=definitions)
+        assert scheduler.count_jobs_all == 0
+        scheduler.simulate(2.5)
+        assert sorted(scheduler.keys_jobs_all) == ["a", "b"]
+
+        definitions.intervals = {"a": 5, "c": 1}
+        summary = scheduler.reload()
+        scheduler.simulate(10)
+        scheduler.stop()
+
+        assert summary == ReloadSummary(added=("c",), retired=("b",), updated=("a",))
+        assert sorted(scheduler.keys_jobs_all) == ["a", "c"]
+        assert definitions.started_at["a"] == [0.0, 1.0, 2.0, 7.0, 12.0]
+        assert definitions.started_at["b"] == [0.0, 1.0, 2.0]
+
+    def test_retired_job_finishes_its_run(self):
+        definitions = JobDefinitions({"slow": 10}, duration=2.0)
+        scheduler = JobScheduler(clock=VirtualClock(), job_source=definitions)
+        manual = OneOffJob(
+            JobParams(func=asyncio.sleep, func_args=(30,), id="manual", interval=0, repeat=False)
+        )
+        scheduler.add_job(manual)
+        scheduler.simulate(1)
+
+        definitions.intervals = {}
+        assert scheduler.reload().retired == ("slow",)
+        scheduler.simulate(5)
+        scheduler.stop()
+
+        assert definitions.finished_at["slow"] == [2.0]
+        assert list(scheduler.keys_jobs_all) == ["manual"]
+
+    @pytest.mark.skipif(not hasattr(signal, "SIGHUP"), reason="No SIGHUP on this platform")
+    def test_sighup_reloads_without_stopping(self):
+        definitions = JobDefinitions({"a": 1})
+        scheduler = JobScheduler(clock=VirtualClock(), job_source=definitions)
+        scheduler.simulate(1.5)
+
+        definitions.intervals = {"a": 1, "b": 1}
+        os.kill(os.getpid(), signal.SIGHUP)
+        scheduler.simulate(1)
+        scheduler.stop()
+
+        assert sorted(scheduler.keys_jobs_all) == ["a", "b"]
+        assert definitions.started_at["a"] == [0.0, 1.0, 2.0]
+
+    def test_set_interval_rejects_cron_jobs(self):
+        job = PeriodicJob(
+            JobParams(func=asyncio.sleep, func_args=(0,), id="cron", cron="* * * * *")
+        )
+        with pytest.raises(ValueError):
+            job.set_interval(5)
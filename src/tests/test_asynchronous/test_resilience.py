@@ -0,0 +1,139 @@
+import asyncio
+import time
+
+import pytest
+
+from kvcommon.asynchronous.jobs import CircuitBreaker
+from kvcommon.asynchronous.jobs import CircuitState
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs import RetryPolicy
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs.job import JobParams
+
+
+class Flaky:
+    def __init__(self, failures: int) -> None:
+        self.failures = failures
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError("down")
+        return self.calls
+
+
+def fast_retry(max_attempts: int = 3) -> RetryPolicy:
+    return RetryPolicy(max_attempts=max_attempts, backoff_base=0.001, jitter=0)
+
+
+class Test_RetryPolicy:
+
+    def test_backoff_grows_and_is_capped(self):
+        policy = RetryPolicy(backoff_base=1, backoff_factor=2, backoff_max=5, jitter=0)
+        assert [policy.delay(attempt) for attempt in range(1, 6)] == [1, 2, 4, 5, 5]
+
+    def test_jitter_bounded(self):
+        policy = RetryPolicy(backoff_base=1, jitter=0.5)
+        assert all(1 <= policy.delay(1) < 1.5 for _ in range(100))
+
+    def test_retry_on(self):
+        policy = RetryPolicy(max_attempts=3, retry_on=(ConnectionError,))
+        assert policy.should_retry(1, ConnectionError())
+        assert not policy.should_retry(1, ValueError())
+        assert not policy.should_retry(3, ConnectionError())
+
+    @pytest.mark.asyncio
+    async def test_run_succeeds_after_retries(self):
+        func = Flaky(failures=2)
+
+        def flaky():
+            return func()
+
+        job = OneOffJob(
+            JobParams(func=flaky, id="job", interval=0, repeat=False, retry=fast_retry())
+        )
+        await job.run(loop=asyncio.get_running_loop())
+        assert job.last_result.value == 3
+        assert job.status.retry_count == 2
+        assert job.status.failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_run_fails_when_attempts_exhausted(self):
+        func = Flaky(failures=5)
+
+        def flaky():
+            return func()
+
+        job = OneOffJob(
+            JobParams(func=flaky, id="job", interval=0, repeat=False, retry=fast_retry())
+        )
+        await job.run(loop=asyncio.get_running_loop())
+        assert func.calls == 3
+        assert isinstance(job.last_result.exception, ConnectionError)
+        assert job.status.failure_count == 1
+
+
+class Test_CircuitBreaker:
+
+    def test_opens_after_threshold_and_probes_once(self):
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+        for _ in range(2):
+            assert breaker.allow_run()
+            breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert not breaker.allow_run()
+
+        time.sleep(0.06)
+        assert breaker.allow_run()
+        assert breaker.state == CircuitState.HALF_OPEN
+        assert not breaker.allow_run()
+
+        breaker.record_success()
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.allow_run()
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        time.sleep(0.02)
+        assert breaker.allow_run()
+        breaker.record_failure()
+        assert breaker.state == CircuitState.OPEN
+        assert breaker.times_opened == 2
+
+    def test_half_opens_in_virtual_time(self):
+        func = Flaky(failures=3)
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+        scheduler = JobScheduler(clock=VirtualClock())
+        scheduler.add_job(
+            PeriodicJob(JobParams(func=func, id="job", interval=1, circuit_breaker=breaker))
+        )
+        scheduler.simulate(20)
+        assert breaker.state == CircuitState.OPEN
+        scheduler.simulate(20)
+        scheduler.stop()
+
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.times_opened == 1
+        assert func.calls > 4
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_rejects_runs(self):
+        func = Flaky(failures=100)
+
+        def flaky():
+            return func()
+
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        job = PeriodicJob(JobParams(func=flaky, id="job", interval=0.01, circuit_breaker=breaker))
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        await asyncio.sleep(0.2)
+        job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert func.calls == 3
+        assert job.status.circuit_state == CircuitState.OPEN
+        assert job.status.rejected_count > 0
@@ -0,0 +1,97 @@
+import asyncio
+import datetime
+import threading
+
+import pytest
+
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.asynchronous.jobs.results import JobResultBuffer
+
+NOW = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+
+def append(buffer: JobResultBuffer, value):
+    return buffer.append("job", started_at=NOW, finished_at=NOW, value=value)
+
+
+class Test_JobResultBuffer:
+
+    def test_ring_buffer_is_bounded(self):
+        buffer = JobResultBuffer(maxlen=3)
+        for value in range(5):
+            append(buffer, value)
+        assert [result.value for result in buffer.snapshot()] == [2, 3, 4]
+        assert buffer.latest().seq == 5
+
+    def test_wait_after_returns_buffered_results_immediately(self):
+        buffer = JobResultBuffer()
+        append(buffer, "a")
+        append(buffer, "b")
+        future = buffer.wait_after(1)
+        assert future.done()
+        assert [result.value for result in future.result()] == ["b"]
+
+    def test_next_result_from_another_thread(self):
+        buffer = JobResultBuffer()
+        future = buffer.next_result()
+        assert not future.done()
+        threading.Timer(0.02, append, args=(buffer, "value")).start()
+        assert future.result(timeout=1).value == "value"
+
+    def test_close_resolves_waiters(self):
+        buffer = JobResultBuffer()
+        future = buffer.next_result()
+        buffer.close()
+        assert future.result(timeout=1) is None
+
+
+class Test_JobResults:
+
+    @pytest.mark.asyncio
+    async def test_results_and_exceptions_are_kept(self):
+        calls = []
+
+        def func():
+            calls.append(None)
+            if len(calls) == 2:
+                raise ValueError("second run")
+            return len(calls)
+
+        job = PeriodicJob(JobParams(func=func, id="job", interval=0.01))
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        while len(job.results) < 3:
+            await asyncio.sleep(0.01)
+        job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        first, second, third = job.results[:3]
+        assert first.ok and first.value == 1
+        assert not second.ok and isinstance(second.exception, ValueError)
+        assert third.value == 3
+
+    @pytest.mark.asyncio
+    async def test_wait_for_result(self):
+        job = OneOffJob(JobParams(func=lambda: "done", id="job", interval=0.02, repeat=False))
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+        result = await job.wait_for_result(timeout=1)
+        await task
+        assert result.value == "done"
+        assert job.last_result is result
+
+    @pytest.mark.asyncio
+    async def test_stream_ends_when_job_stops(self):
+        runs = iter(range(100))
+        job = PeriodicJob(JobParams(func=lambda: next(runs), id="job", interval=0.01))
+        task = asyncio.create_task(job.run(loop=asyncio.get_running_loop()))
+
+        values = []
+        async for result in job.stream_results():
+            values.append(result.value)
+            if len(values) == 3:
+                job.stop()
+        await asyncio.wait_for(task, timeout=1)
+
+        assert values[:3] == sorted(values[:3])
+        assert len(values) >= 3
@@ -0,0 +1,125 @@
+import collections
+from concurrent.futures import Future
+
+import pytest
+
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.asynchronous.jobs.timing import phase_offset
+
+
+def _noop():
+    pass
+
+
+@pytest.fixture
+def make_scheduler():
+    schedulers = []
+
+    def make(**kwargs) -> JobScheduler:
+        scheduler = JobScheduler(**kwargs)
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in schedulers:
+        scheduler.stop()
+
+
+@pytest.fixture
+def scheduler(make_scheduler):
+    return make_scheduler()
+
+
+def make_job(id: str, interval: float = 1) -> PeriodicJob:
+    return PeriodicJob(JobParams(func=_noop, id=id, interval=interval))
+
+
+class Test_SchedulerDispatch:
+
+    def test_added_jobs_are_due_immediately(self, scheduler):
+        job = make_job("a")
+        scheduler.add_job(job)
+        due_ids = [j.id for j in scheduler._pop_due_jobs()]
+        assert "a" in due_ids
+        assert scheduler._pop_due_jobs() == []
+
+    def test_duplicate_add_is_ignored(self, scheduler):
+        scheduler.add_job(make_job("a"))
+        scheduler.add_job(make_job("a"))
+        due_ids = [j.id for j in scheduler._pop_due_jobs()]
+        assert due_ids.count("a") == 1
+
+    def test_removed_jobs_are_discarded_from_heap(self, scheduler):
+        scheduler.add_job(make_job("a"))
+        scheduler.remove_job("a")
+        due_ids = [j.id for j in scheduler._pop_due_jobs()]
+        assert "a" not in due_ids
+        with pytest.raises(KeyError):
+            scheduler.get_job("a")
+
+    def test_remove_only_cancels_on_request(self, scheduler):
+        futures = {job_id: Future() for job_id in ("a", "b")}
+        for job_id, future in futures.items():
+            scheduler.add_job(make_job(job_id))
+            scheduler._track_future(job_id, future)
+        scheduler.remove_job("a")
+        scheduler.remove_job("b", cancel=True)
+        assert not futures["a"].cancelled()
+        assert futures["b"].cancelled()
+        assert scheduler._futures == {}
+
+    def test_state_changes_are_recorded(self, scheduler):
+        job = make_job("a")
+        scheduler.add_job(job)
+        job.pause()
+        assert "a" in scheduler._changed_job_ids
+        assert scheduler._collect_finished_jobs(scheduler._changed_job_ids) == []
+
+        job.stop()
+        assert scheduler._collect_finished_jobs(scheduler._changed_job_ids) == ["a"]
+
+    def test_wait_time_is_capped(self, scheduler):
+        scheduler._pop_due_jobs()
+        assert scheduler._next_wait_time() == scheduler._max_wait_time
+
+
+class Test_PhaseSpread:
+
+    def test_offsets_are_deterministic_and_bounded(self):
+        offsets = [phase_offset(f"job-{i}", 60) for i in range(1000)]
+        assert offsets == [phase_offset(f"job-{i}", 60) for i in range(1000)]
+        assert all(0 <= offset < 60 for offset in offsets)
+        # Evenly spread: Each 6s slice of the interval gets roughly a tenth of the jobs
+        slices = collections.Counter(int(offset // 6) for offset in offsets)
+        assert len(slices) == 10
+        assert min(slices.values()) > 60
+
+    def test_jobs_dispatched_across_interval(self, make_scheduler):
+        scheduler = make_scheduler(phase_spread=True)
+        for i in range(50):
+            scheduler.add_job(make_job(f"job-{i}", interval=60))
+        dispatch_times = sorted(due for due, _, _ in scheduler._dispatch_heap)
+        assert dispatch_times[0] < 10
+        assert dispatch_times[-1] > 50
+
+    def test_start_jitter_bounded(self, make_scheduler):
+        scheduler = make_scheduler(start_jitter=2.0)
+        for i in range(20):
+            scheduler.add_job(make_job(f"job-{i}", interval=60))
+        assert all(0 <= due < 2.0 for due, _, _ in scheduler._dispatch_heap)
+
+    def test_rebase_on_start(self, make_scheduler):
+        scheduler = make_scheduler(phase_spread=True)
+        scheduler.add_job(make_job("a", interval=60))
+        scheduler.add_job(make_job("b", interval=60))
+        before = {job_id: due for due, _, job_id in scheduler._dispatch_heap}
+        scheduler._rebase_dispatch_heap()
+        after = {job_id: due for due, _, job_id in scheduler._dispatch_heap}
+        assert after["a"] - before["a"] == pytest.approx(after["b"] - before["b"])
+        assert after["a"] > before["a"]
+
+    def test_run_jitter_must_be_less_than_interval(self):
+        with pytest.raises(ValueError):
+            JobParams(func=_noop, id="a", interval=1, jitter=1)
@@ -0,0 +1,131 @@
+import asyncio
+import collections
+import threading
+import time
+
+import pytest
+
+from kvcommon.asynchronous.jobs import PeriodicJob
+from kvcommon.asynchronous.jobs import SchedulerState
+from kvcommon.asynchronous.jobs import ShardAssignment
+from kvcommon.asynchronous.jobs import ShardedJobScheduler
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.asynchronous.jobs.sharding import ConsistentHashRing
+
+
+def _noop():
+    pass
+
+
+def make_job(id: str) -> PeriodicJob:
+    return PeriodicJob(JobParams(func=_noop, id=id, interval=1))
+
+
+@pytest.fixture
+def make_scheduler():
+    schedulers = []
+
+    def make(**kwargs) -> ShardedJobScheduler:
+        scheduler = ShardedJobScheduler(**kwargs)
+        schedulers.append(scheduler)
+        return scheduler
+
+    yield make
+    for scheduler in schedulers:
+        scheduler.stop()
+
+
+class Test_ConsistentHashRing:
+
+    def test_deterministic(self):
+        ring_a = ConsistentHashRing(4)
+        ring_b = ConsistentHashRing(4)
+        keys = [f"job-{i}" for i in range(100)]
+        assert [ring_a.get_node(k) for k in keys] == [ring_b.get_node(k) for k in keys]
+
+    def test_distribution(self):
+        ring = ConsistentHashRing(4)
+        counts = collections.Counter(ring.get_node(f"job-{i}") for i in range(4000))
+        assert set(counts.keys()) == {0, 1, 2, 3}
+        assert min(counts.values()) > 500
+
+
+class Test_ShardedJobScheduler:
+
+    def test_invalid_shard_count(self):
+        with pytest.raises(ValueError):
+            ShardedJobScheduler(num_shards=0)
+
+    def test_virtual_clock(self, make_scheduler):
+        with pytest.raises(ValueError):
+            ShardedJobScheduler(num_shards=2, clock=VirtualClock())
+
+        scheduler = make_scheduler(num_shards=1, clock=VirtualClock())
+        job = make_job("job")
+        scheduler.add_job(job)
+        scheduler.simulate(10)
+        assert job.status.execution_count == 10
+        assert scheduler.clock.elapsed == 10
+
+    def test_hash_assignment_is_stable(self, make_scheduler):
+        scheduler = make_scheduler(num_shards=3)
+        job = make_job("a")
+        scheduler.add_job(job)
+        loop = scheduler._loop_for_job(job)
+        index = scheduler.get_shard_index(job)
+        assert scheduler.shards[index].loop is loop
+        assert index == ConsistentHashRing(3).get_node("a")
+        assert scheduler._loop_for_job(job) is loop
+
+    def test_least_loaded_assignment(self, make_scheduler):
+        scheduler = make_scheduler(num_shards=3, assignment=ShardAssignment.LEAST_LOADED)
+        for i in range(9):
+            job = make_job(f"job-{i}")
+            scheduler.add_job(job)
+            scheduler._loop_for_job(job)
+        assert [len(shard.job_ids) for shard in scheduler.shards] == [3, 3, 3]
+
+    def test_remove_job_untracks_shard(self, make_scheduler):
+        scheduler = make_scheduler(num_shards=2)
+        job = make_job("a")
+        scheduler.add_job(job)
+        scheduler._loop_for_job(job)
+        scheduler.remove_job("a")
+        assert scheduler.get_shard_index("a") is None
+        assert all("a" not in shard.job_ids for shard in scheduler.shards)
+
+    def test_migrate_running_job(self):
+        threads = []
+        running = collections.Counter()
+
+        async def record():
+            threads.append(threading.current_thread().name)
+            running["now"] += 1
+            running["max"] = max(running["max"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+
+        job = PeriodicJob(JobParams(func=record, id="a", interval=0.02))
+        scheduler = ShardedJobScheduler(num_shards=2, loop_watchdog=False)
+        scheduler.add_job(job)
+        scheduler._start_loop_threads()
+        scheduler._state = SchedulerState.ACTIVE
+        try:
+            scheduler.run_job(job)
+            source = scheduler.shards[scheduler.get_shard_index(job)]
+            target = scheduler.shards[1 - source.index]
+            time.sleep(0.1)
+            for _ in range(20):
+                # Picked regardless of whether it's executing - Only detached while it isn't
+                scheduler._migrate_job(job, source, target)
+                if scheduler.get_shard_index(job) == target.index:
+                    break
+                time.sleep(0.005)
+            time.sleep(0.1)
+            assert scheduler.get_shard_index(job) == target.index
+            assert threads[-1] == f"kvc-shard-{target.index}"
+            assert running["max"] == 1
+            assert job.run_task is not None and job.run_task.get_loop() is target.loop
+        finally:
+            scheduler.stop()
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import threading
+
+import pytest
+
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import VirtualClock
+from kvcommon.asynchronous.jobs import scheduler as scheduler_module
+from kvcommon.asynchronous.jobs.tasks import task_id
+
+
+async def double(value: int) -> int:
+    return value * 2
+
+
+def increment(value: int, step: int = 1) -> int:
+    return value + step
+
+
+def fail():
+    raise ValueError("Task failed")
+
+
+@pytest.fixture
+def scheduler():
+    scheduler = JobScheduler(log_level=logging.WARNING)
+    scheduler._start_loop_threads()
+    yield scheduler
+    scheduler.stop()
+
+
+class Test_Submit:
+
+    def test_coroutine_and_sync(self, scheduler: JobScheduler):
+        assert scheduler.submit(double, 21).result(timeout=5) == 42
+        assert scheduler.submit(increment, 1, step=10).result(timeout=5) == 11
+        assert scheduler.count_tasks_pending == 0
+        assert scheduler.count_jobs_all == 0
+
+    def test_submit_many_keeps_order(self, scheduler: JobScheduler):
+        futures = scheduler.submit_many(double, ((value,) for value in range(1000)))
+        assert [future.result(timeout=5) for future in futures] == [
+            value * 2 for value in range(1000)
+        ]
+        assert scheduler.submit_many(double, []) == []
+
+    def test_large_batch_yields_to_loop(self, scheduler: JobScheduler, monkeypatch):
+        monkeypatch.setattr(scheduler_module, "_TASK_START_CHUNK", 10)
+        order = []
+
+        async def record(value: int):
+            order.append(value)
+
+        async def submit():
+            futures = scheduler.submit_many(record, ((value,) for value in range(1000)))
+            asyncio.get_running_loop().call_soon(order.append, "other")
+            return await asyncio.gather(*futures)
+
+        asyncio.run_coroutine_threadsafe(submit(), scheduler.event_loop).result(timeout=5)
+        assert len(order) == 1001
+        assert order.index("other") <= 20
+
+    def test_errors_reach_future_and_pipeline(self, scheduler: JobScheduler):
+        futures = scheduler.submit_many(fail, [()] * 3)
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(timeout=5)
+        assert scheduler.errors.error_count(task_id(fail)) == 3
+
+    def test_coroutine_rejects_executor(self, scheduler: JobScheduler):
+        with pytest.raises(ValueError):
+            scheduler.submit(double, 1, executor="process")
+
+
+class Test_SubmitLifecycle:
+
+    def test_cancelled_before_start(self):
+        ran = threading.Event()
+        scheduler = JobScheduler(clock=VirtualClock())
+        future = scheduler.submit(ran.set)
+        assert future.cancel()
+        scheduler.simulate(1)
+        assert not ran.is_set()
+        assert scheduler.count_tasks_pending == 0
+        scheduler.stop()
+
+    def test_pending_tasks_cancelled_on_stop(self):
+        scheduler = JobScheduler(clock=VirtualClock())
+        future = scheduler.submit(asyncio.sleep, 60)
+        scheduler.simulate(1)
+        assert not future.done()
+        scheduler.stop()
+        assert future.cancelled()
@@ -0,0 +1,134 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from kvcommon.asynchronous.exceptions import JobCancelledException
+from kvcommon.asynchronous.exceptions import JobTimeoutException
+from kvcommon.asynchronous.executors import create_thread_pool
+from kvcommon.asynchronous.executors import stuck_worker_count
+from kvcommon.asynchronous.executors import unregister_executor
+from kvcommon.asynchronous.jobs import CancellationToken
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs.job import JobParams
+
+
+def make_job(func, timeout: float = 0.05) -> OneOffJob:
+    return OneOffJob(JobParams(func=func, id="job", interval=0, repeat=False, timeout=timeout))
+
+
+class Test_CancellationToken:
+
+    def test_cancel(self):
+        token = CancellationToken()
+        assert not token.wait(0.001)
+        token.raise_if_cancelled()
+        token.cancel("reason")
+        assert token.cancelled and token.wait(10)
+        with pytest.raises(JobCancelledException):
+            token.raise_if_cancelled()
+
+
+class Test_JobTimeout:
+
+    def test_timeout_must_be_positive(self):
+        with pytest.raises(ValueError):
+            JobParams(func=lambda: None, id="job", interval=1, timeout=0)
+
+    @pytest.mark.asyncio
+    async def test_coroutine_is_cancelled(self):
+        cancelled = asyncio.Event()
+
+        async def hang():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        job = make_job(hang)
+        await asyncio.wait_for(job.run(loop=asyncio.get_running_loop()), timeout=1)
+        assert cancelled.is_set()
+        assert isinstance(job.last_result.exception, JobTimeoutException)
+        assert job.status.timeout_count == 1
+        assert job.status.failure_count == 1
+
+    @pytest.mark.asyncio
+    async def test_sync_func_gets_cancel_token(self):
+        tokens = []
+
+        def hang(cancel_token: CancellationToken):
+            tokens.append(cancel_token)
+            cancel_token.wait(10)
+
+        job = make_job(hang)
+        await asyncio.wait_for(job.run(loop=asyncio.get_running_loop()), timeout=1)
+        assert tokens[0].cancelled
+        assert job.status.timeout_count == 1
+
+    @pytest.mark.asyncio
+    async def test_uncooperative_sync_func_counts_as_stuck(self):
+        release = threading.Event()
+        job = make_job(lambda: release.wait(10))
+        baseline = stuck_worker_count()
+
+        await asyncio.wait_for(job.run(loop=asyncio.get_running_loop()), timeout=1)
+        assert job.stuck_runs == 1
+        assert stuck_worker_count() == baseline + 1
+
+        release.set()
+        for _ in range(100):
+            if job.stuck_runs == 0:
+                break
+            await asyncio.sleep(0.01)
+        assert job.stuck_runs == 0
+        assert stuck_worker_count() == baseline
+
+    @pytest.mark.asyncio
+    async def test_run_waiting_for_a_worker_is_dropped(self):
+        create_thread_pool("test-timeout-pool", max_workers=1)
+        calls = []
+        try:
+            blocker = OneOffJob(
+                JobParams(
+                    func=time.sleep,
+                    func_args=(0.3,),
+                    id="a",
+                    interval=0,
+                    repeat=False,
+                    executor="test-timeout-pool",
+                )
+            )
+            queued = OneOffJob(
+                JobParams(
+                    func=lambda: calls.append("b"),
+                    id="b",
+                    interval=0,
+                    repeat=False,
+                    timeout=0.05,
+                    executor="test-timeout-pool",
+                )
+            )
+            loop = asyncio.get_running_loop()
+            baseline = stuck_worker_count()
+            blocker_task = asyncio.create_task(blocker.run(loop=loop))
+            await asyncio.sleep(0.01)
+
+            await asyncio.wait_for(queued.run(loop=loop), timeout=1)
+            assert queued.status.timeout_count == 1
+            assert queued.stuck_runs == 0
+            assert stuck_worker_count() == baseline
+
+            await asyncio.wait_for(blocker_task, timeout=1)
+            await asyncio.sleep(0.05)
+            assert calls == []
+        finally:
+            unregister_executor("test-timeout-pool", shutdown=True)
+
+    @pytest.mark.asyncio
+    async def test_fast_run_unaffected(self):
+        job = make_job(lambda: "done", timeout=1)
+        await job.run(loop=asyncio.get_running_loop())
+        assert job.last_result.value == "done"
+        assert job.status.failure_count == 0
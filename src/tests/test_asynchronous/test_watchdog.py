@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from prometheus_client import CollectorRegistry
+from prometheus_client import Counter
+from prometheus_client import Histogram
+
+from kvcommon.asynchronous.jobs import JobScheduler
+from kvcommon.asynchronous.jobs import LagHistogram
+from kvcommon.asynchronous.jobs import LoopWatchdog
+from kvcommon.asynchronous.jobs import OneOffJob
+from kvcommon.asynchronous.jobs.job import JobParams
+from kvcommon.prometheus.jobs import LoopWatchdogPrometheus
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield loop
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=2)
+    loop.close()
+
+
+async def block_loop(seconds: float = 0.3):
+    time.sleep(seconds)
+
+
+def wait_for_stall(watchdog: LoopWatchdog, timeout: float = 2.0):
+    deadline = time.monotonic() + timeout
+    while watchdog.stall_count == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class Test_LagHistogram:
+
+    def test_buckets_and_quantiles(self):
+        histogram = LagHistogram(buckets=(0.01, 0.1, 1.0))
+        for value in (0.001, 0.005, 0.05, 0.5, 3.0):
+            histogram.observe(value)
+        assert histogram.snapshot() == {0.01: 2, 0.1: 3, 1.0: 4, float("inf"): 5}
+        assert histogram.quantile(0.4) == 0.01
+        assert histogram.quantile(0.8) == 1.0
+        assert histogram.quantile(1.0) == 3.0
+        assert histogram.count == 5
+        assert histogram.max == 3.0
+
+    def test_invalid_buckets(self):
+        with pytest.raises(ValueError):
+            LagHistogram(buckets=(0.1, 0.01))
+
+
+class Test_LoopWatchdog:
+
+    def test_pins_stall_on_blocking_job(self, loop):
+        watchdog = LoopWatchdog(interval=0.02, stall_threshold=0.05)
+        watchdog.start(loop)
+        try:
+            time.sleep(0.1)
+            job = OneOffJob(JobParams(func=block_loop, id="blocker", interval=0, repeat=False))
+            asyncio.run_coroutine_threadsafe(job.run(loop=loop), loop).result(timeout=2)
+            wait_for_stall(watchdog)
+        finally:
+            watchdog.stop()
+
+        (stall,) = watchdog.stalls
+        assert stall.task_name == "job:blocker"
+        assert "in block_loop" in stall.location
+        assert stall.duration >= 0.2
+        assert watchdog.histogram.count > 0
+        assert watchdog.histogram.max >= 0.2
+
+    def test_prometheus_metrics(self, loop):
+        registry = CollectorRegistry()
+        lag = Histogram("loop_lag_seconds", "Loop lag", registry=registry)
+        stalls = Counter("loop_stalls", "Loop stalls", ["task"], registry=registry)
+        watchdog = LoopWatchdogPrometheus(
+            lag_metric=lag, stall_metric=stalls, interval=0.02, stall_threshold=0.05
+        )
+        watchdog.start(loop)
+        try:
+            time.sleep(0.1)
+            asyncio.run_coroutine_threadsafe(block_loop(), loop).result(timeout=2)
+            wait_for_stall(watchdog)
+        finally:
+            watchdog.stop()
+
+        assert registry.get_sample_value("loop_lag_seconds_count") > 0
+        task_name = watchdog.stalls[0].task_name
+        assert registry.get_sample_value("loop_stalls_total", {"task": task_name}) == 1
+
+    def test_scheduler_default(self):
+        for scheduler, expected in (
+            (JobScheduler(), LoopWatchdog),
+            (JobScheduler(loop_watchdog=False), type(None)),
+        ):
+            try:
+                assert isinstance(scheduler.watchdog, expected)
+            finally:
+                scheduler.stop()